@@ -0,0 +1,138 @@
+"""Runs the benchmark suite and compares result files.
+
+    python -m benchmarks run --output results.json
+    python -m benchmarks compare baseline.json results.json --threshold 0.1
+
+Every result is the best time of several runs, in nanoseconds per operation; lower is better.
+`compare` exits with status 1 when a benchmark got slower than the threshold allows."""
+
+import json
+import platform
+import sys
+import time
+from importlib import import_module
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from spargear import ArgumentSpec, RunnableArguments, SubcommandArguments, SubcommandSpec
+
+RESULTS_FORMAT_VERSION = 1
+SUITES = ("startup", "class_creation", "parse", "serialization", "attribute_access")
+"""The suites, each a `benchmarks.bench_<suite>` module with a `measure(scale, repeat)` function."""
+
+
+def run_suites(suites: List[str], scale: float, repeat: int) -> Dict[str, float]:
+    """Runs the given suites, returning `{"<suite>.<case>": nanoseconds}`."""
+    results: Dict[str, float] = {}
+    for suite in suites:
+        measure: Callable[[float, int], Dict[str, float]] = import_module(f"benchmarks.bench_{suite}").measure
+        print(f"Running {suite} ...", file=sys.stderr)
+        for case, ns in measure(scale, repeat).items():
+            results[f"{suite}.{case}"] = ns
+    return results
+
+
+def compare_results(
+    baseline: Dict[str, float], candidate: Dict[str, float], threshold: float
+) -> List[Tuple[str, Optional[float], Optional[float], str]]:
+    """Returns `(name, baseline_ns, candidate_ns, verdict)` rows; the verdict is "regression",
+    "improvement", "ok", "added" or "removed"."""
+    rows: List[Tuple[str, Optional[float], Optional[float], str]] = []
+    for name in sorted(set(baseline) | set(candidate)):
+        before, after = baseline.get(name), candidate.get(name)
+        if before is None:
+            verdict = "added"
+        elif after is None:
+            verdict = "removed"
+        elif before > 0 and after > before * (1 + threshold):
+            verdict = "regression"
+        elif after < before * (1 - threshold):
+            verdict = "improvement"
+        else:
+            verdict = "ok"
+        rows.append((name, before, after, verdict))
+    return rows
+
+
+def _format_ns(ns: Optional[float]) -> str:
+    if ns is None:
+        return "-"
+    for unit, factor in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= factor:
+            return f"{ns / factor:.2f} {unit}"
+    return f"{ns:.1f} ns"
+
+
+class RunBenchmarks(RunnableArguments[None]):
+    """Run the benchmarks and write the results as JSON."""
+
+    output: Optional[Path] = None
+    """File to write the results to (default: standard output)."""
+    suite: Optional[List[str]] = None
+    """Suites to run (default: all of them)."""
+    quick: bool = False
+    """Run fewer iterations: faster, but noisier."""
+    repeat: int = 5
+    """Number of runs each result is the best of."""
+
+    def run(self) -> None:
+        suites = self.suite or list(SUITES)
+        if unknown := [s for s in suites if s not in SUITES]:
+            raise SystemExit(f"Unknown suites: {', '.join(unknown)} (choose from {', '.join(SUITES)})")
+        started = time.time()
+        results = run_suites(suites, scale=0.1 if self.quick else 1.0, repeat=self.repeat)
+        document = {
+            "version": RESULTS_FORMAT_VERSION,
+            "created": started,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "quick": self.quick,
+            "results": results,
+        }
+        text = json.dumps(document, indent=2)
+        if self.output is None:
+            print(text)
+        else:
+            self.output.write_text(text + "\n", encoding="utf-8")
+            print(f"Wrote {len(results)} results to {self.output}", file=sys.stderr)
+
+
+class CompareBenchmarks(RunnableArguments[None]):
+    """Compare two result files and flag regressions."""
+
+    baseline: ArgumentSpec[Path] = ArgumentSpec(["baseline"], help="Results of the reference run.")
+    candidate: ArgumentSpec[Path] = ArgumentSpec(["candidate"], help="Results of the run to check.")
+    threshold: float = 0.1
+    """Relative slowdown tolerated before a result counts as a regression."""
+
+    def run(self) -> None:
+        baseline = _load_results(self.baseline.unwrap())
+        candidate = _load_results(self.candidate.unwrap())
+        rows = compare_results(baseline, candidate, self.threshold)
+        width = max((len(name) for name, *_ in rows), default=4)
+        print(f"{'benchmark':<{width}}  {'baseline':>10}  {'candidate':>10}  {'change':>8}  verdict")
+        for name, before, after, verdict in rows:
+            change = f"{(after / before - 1) * 100:+.1f}%" if before and after is not None else "-"
+            print(f"{name:<{width}}  {_format_ns(before):>10}  {_format_ns(after):>10}  {change:>8}  {verdict}")
+        if regressions := [name for name, *_, verdict in rows if verdict == "regression"]:
+            print(f"{len(regressions)} regression(s) above {self.threshold:.0%}", file=sys.stderr)
+            raise SystemExit(1)
+
+
+def _load_results(path: Path) -> Dict[str, float]:
+    document = json.loads(path.read_text(encoding="utf-8"))
+    if document.get("version") != RESULTS_FORMAT_VERSION:
+        raise SystemExit(f"{path}: unsupported results format {document.get('version')!r}")
+    return document["results"]
+
+
+class BenchmarkArguments(SubcommandArguments):
+    """spargear benchmark suite."""
+
+    run_command = SubcommandSpec("run", argument_class=RunBenchmarks, help="Run the benchmarks.")
+    compare_command = SubcommandSpec("compare", argument_class=CompareBenchmarks, help="Compare two result files.")
+
+
+if __name__ == "__main__":
+    BenchmarkArguments().execute()
@@ -0,0 +1,12 @@
+"""Timing helpers shared by the benchmark modules."""
+
+import timeit
+from typing import Callable
+
+
+def best_ns(func: Callable[[], object], number: int, repeat: int = 5) -> float:
+    """The best time of `repeat` runs, in nanoseconds per call, minus the cost of calling an empty function."""
+    number = max(number, 1)
+    baseline = min(timeit.repeat(lambda: None, number=number, repeat=repeat))
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    return max(best - baseline, 0.0) / number * 1e9
@@ -0,0 +1,41 @@
+"""Microbenchmark of attribute access on BaseArguments instances.
+
+Run with `python -m benchmarks.bench_attribute_access`; prints nanoseconds per access."""
+
+from typing import Callable, Dict
+
+from spargear import ArgumentSpec, BaseArguments
+
+from ._timing import best_ns
+
+
+class AccessArguments(BaseArguments):
+    name: str = "bench"
+    count: int = 1
+    level: ArgumentSpec[str] = ArgumentSpec(["--level"], default="INFO")
+
+    def run(self) -> int:
+        return self.count
+
+
+def measure(scale: float = 1.0, repeat: int = 5) -> Dict[str, float]:
+    """Returns the best nanoseconds per access for each kind of attribute."""
+    args = AccessArguments([])
+    args.extra = "not an argument"  # pyright: ignore[reportAttributeAccessIssue]
+
+    def write() -> None:
+        args.count = 2
+
+    cases: Dict[str, Callable[[], object]] = {
+        "read_specless_argument": lambda: args.name,
+        "read_spec_argument": lambda: args.level,
+        "read_method": lambda: args.run,
+        "read_plain_attribute": lambda: args.extra,  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownLambdaType]
+        "write_specless_argument": write,
+    }
+    return {name: best_ns(case, int(200_000 * scale), repeat) for name, case in cases.items()}
+
+
+if __name__ == "__main__":
+    for name, ns in measure().items():
+        print(f"{name:<28}{ns:8.1f} ns")
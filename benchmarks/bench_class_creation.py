@@ -0,0 +1,48 @@
+"""Benchmark of class creation (`__init_subclass__`) by number of fields and depth of the hierarchy.
+
+Run with `python -m benchmarks.bench_class_creation`; prints nanoseconds per hierarchy."""
+
+import itertools
+from typing import Dict, Sequence
+
+from spargear import BaseArguments
+
+from ._timing import best_ns
+
+FIELD_COUNTS = (1, 10, 50)
+DEPTHS = (1, 10, 30)
+
+_counter = itertools.count()
+
+
+def build_hierarchy(fields: int, depth: int) -> type:
+    """Creates `depth` classes, each deriving from the previous one and declaring `fields` fields."""
+    # Unique names, so the classes aren't mistaken for redefinitions of earlier ones
+    prefix = f"Bench{next(_counter)}"
+    parent: type = BaseArguments
+    for level in range(depth):
+        names = [f"f{level}_{i}" for i in range(fields)]
+        namespace: Dict[str, object] = {"__annotations__": {name: int for name in names}, "__module__": __name__}
+        namespace.update({name: i for i, name in enumerate(names)})
+        parent = type(f"{prefix}_{level}", (parent,), namespace)
+    return parent
+
+
+def measure(
+    scale: float = 1.0,
+    repeat: int = 5,
+    field_counts: Sequence[int] = FIELD_COUNTS,
+    depths: Sequence[int] = DEPTHS,
+) -> Dict[str, float]:
+    """Returns the best nanoseconds to create a whole hierarchy, for each field count and depth."""
+    results: Dict[str, float] = {}
+    for fields in field_counts:
+        for depth in depths:
+            number = max(int(200 * scale / (fields * depth) ** 0.5), 1)
+            results[f"fields={fields},depth={depth}"] = best_ns(lambda: build_hierarchy(fields, depth), number, repeat)
+    return results
+
+
+if __name__ == "__main__":
+    for name, ns in measure().items():
+        print(f"{name:<28}{ns / 1e3:10.1f} us")
@@ -0,0 +1,83 @@
+"""Benchmark of building parsers and of parsing command lines end to end.
+
+Run with `python -m benchmarks.bench_parse`; prints nanoseconds per operation."""
+
+from pathlib import Path
+from typing import Dict, List, Literal, Optional
+
+from spargear import ArgumentSpec, BaseArguments, SubcommandSpec
+
+from ._timing import best_ns
+
+
+class TrainArguments(BaseArguments):
+    """Train a model."""
+
+    epochs: int = 10
+    """Number of epochs."""
+    learning_rate: float = 1e-3
+    """Learning rate."""
+    optimizer: Literal["sgd", "adam", "adamw"] = "adam"
+    """Optimizer."""
+    layers: List[int] = [64, 64]
+    """Hidden layer sizes."""
+    checkpoint: Optional[Path] = None
+    """Checkpoint to resume from."""
+
+
+class ServeArguments(BaseArguments):
+    """Serve a model."""
+
+    host: str = "127.0.0.1"
+    port: int = 8000
+    workers: int = 1
+
+
+class CliArguments(BaseArguments):
+    """A CLI of typical size."""
+
+    config: Optional[Path] = None
+    """Configuration file."""
+    verbose: bool = False
+    """Verbose output."""
+    log_level: ArgumentSpec[str] = ArgumentSpec(["--log-level"], default="INFO", help="Log level.")
+    train = SubcommandSpec("train", argument_class=TrainArguments, help="Train a model.")
+    serve = SubcommandSpec("serve", argument_class=ServeArguments, help="Serve a model.")
+
+
+class FastCliArguments(CliArguments):
+    """The same CLI, parsed with the fast engine."""
+
+    __parse_engine__ = "fast"
+
+
+ARGV = ["--verbose", "train", "--epochs", "3", "--optimizer", "sgd", "--layers", "32", "16"]
+
+
+def _get_parser_cold() -> object:
+    CliArguments.invalidate_parser_cache()
+    return _get_parser_warm()
+
+
+def _get_parser_warm() -> object:
+    return CliArguments._get_parser_for_argv(ARGV)  # pyright: ignore[reportPrivateUsage]
+
+
+def measure(scale: float = 1.0, repeat: int = 5) -> Dict[str, float]:
+    """Returns the best nanoseconds per operation for building parsers and parsing."""
+    number = int(2_000 * scale)
+    results = {
+        "get_parser_cold": best_ns(_get_parser_cold, number // 4, repeat),
+        "get_parser_warm": best_ns(_get_parser_warm, number * 10, repeat),
+        "parse_root_only": best_ns(lambda: CliArguments(["--verbose"]), number, repeat),
+        "parse_subcommand": best_ns(lambda: CliArguments(ARGV), number, repeat),
+        "parse_subcommand_fast_engine": best_ns(lambda: FastCliArguments(ARGV), number, repeat),
+    }
+    batch = [ARGV] * 100
+    results["parse_many_per_argv"] = best_ns(lambda: list(CliArguments.parse_many(batch)), max(number // 100, 1), repeat) / len(batch)
+    return results
+
+
+if __name__ == "__main__":
+    for name, ns in measure().items():
+        print(f"{name:<28}{ns / 1e3:10.1f} us")
@@ -0,0 +1,57 @@
+"""Benchmark of serialization round-trips.
+
+Run with `python -m benchmarks.bench_serialization`; prints nanoseconds per operation and the size of
+the serialized data in each format."""
+
+from typing import Dict, List, Optional
+
+from spargear import BaseArguments
+
+from ._timing import best_ns
+
+
+class ConfigArguments(BaseArguments):
+    host: str = "localhost"
+    port: int = 8080
+    debug: bool = False
+    ratio: float = 0.5
+    tags: List[str] = ["a", "b", "c"]
+    name: Optional[str] = None
+
+
+def _example() -> ConfigArguments:
+    return ConfigArguments(["--port", "9000", "--name", "bench"])
+
+
+def sizes() -> Dict[str, int]:
+    """Returns the bytes each format takes for the same instance."""
+    config = _example()
+    return {
+        "json": len(config.to_json().encode("utf-8")),
+        "pickle": len(config.to_pickle()),
+        "bytes": len(config.to_bytes()),
+    }
+
+
+def measure(scale: float = 1.0, repeat: int = 5) -> Dict[str, float]:
+    """Returns the best nanoseconds per serialization and deserialization."""
+    number = int(2_000 * scale)
+    config = _example()
+    json_data = config.to_json()
+    pickle_data = config.to_pickle()
+    binary_data = config.to_bytes()
+    return {
+        "to_json": best_ns(config.to_json, number, repeat),
+        "from_json": best_ns(lambda: ConfigArguments.from_json(json_data), number, repeat),
+        "to_pickle": best_ns(config.to_pickle, number, repeat),
+        "from_pickle": best_ns(lambda: ConfigArguments.from_pickle(pickle_data), number, repeat),
+        "to_bytes": best_ns(config.to_bytes, number, repeat),
+        "from_bytes": best_ns(lambda: ConfigArguments.from_bytes(binary_data), number, repeat),
+    }
+
+
+if __name__ == "__main__":
+    for name, ns in measure().items():
+        print(f"{name:<28}{ns / 1e3:10.1f} us")
+    for name, size in sizes().items():
+        print(f"{name + ' size':<28}{size:10d} B")
@@ -0,0 +1,36 @@
+"""Benchmark of `import spargear` in a fresh interpreter.
+
+Run with `python -m benchmarks.bench_startup`; prints nanoseconds per import."""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _best_run_ns(code: str, runs: int) -> float:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(ROOT), env.get("PYTHONPATH", "")) if p)
+    command: List[str] = [sys.executable, "-c", code]
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter_ns()
+        subprocess.run(command, env=env, check=True)
+        best = min(best, time.perf_counter_ns() - start)
+    return best
+
+
+def measure(scale: float = 1.0, repeat: int = 5) -> Dict[str, float]:
+    """Returns the best nanoseconds `import spargear` adds to interpreter startup."""
+    runs = max(int(4 * repeat * scale), 3)
+    interpreter = _best_run_ns("pass", runs)
+    return {"import_spargear": max(_best_run_ns("import spargear", runs) - interpreter, 0.0)}
+
+
+if __name__ == "__main__":
+    for name, ns in measure().items():
+        print(f"{name:<28}{ns / 1e6:8.2f} ms")
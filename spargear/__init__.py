@@ -1,7 +1,20 @@
+from ._compiled import compile_arguments
+from ._completion import completion_script, write_completion_index
+from ._config import Env, config_cache_info, invalidate_config_cache, set_config_cache_maxsize
+from ._docstrings import disable_docstring_cache, enable_docstring_cache
+from ._shared import (
+    SharedFactory,
+    invalidate_shared_factories,
+    set_shared_factory_cache_maxsize,
+    shared_factory,
+    shared_factory_cache_info,
+)
+from ._timings import add_timing_hook, record_timings, remove_timing_hook
 from ._typing import Annotated
 from .argspec import ArgumentSpec, ArgumentSpecType
 from .arguments import RunnableArguments, SubcommandArguments
-from .base import BaseArguments
+from .base import BaseArguments, DefaultFactoryError, ParseError
+from .computed import ComputedField, computed
 from .subcommand import SubcommandSpec, subcommand, subcommandclass
 
 __all__ = [
@@ -12,10 +25,32 @@ __all__ = [
     "subcommand",
     "subcommandclass",
     "SubcommandSpec",
+    # Computed fields
+    "computed",
+    "ComputedField",
     # Advanced features
     "RunnableArguments",
     "SubcommandArguments",
     "ArgumentSpecType",
+    "ParseError",
+    "DefaultFactoryError",
+    "SharedFactory",
     # Utilities
     "Annotated",
+    "Env",
+    "enable_docstring_cache",
+    "disable_docstring_cache",
+    "compile_arguments",
+    "completion_script",
+    "write_completion_index",
+    "shared_factory",
+    "invalidate_shared_factories",
+    "shared_factory_cache_info",
+    "set_shared_factory_cache_maxsize",
+    "config_cache_info",
+    "invalidate_config_cache",
+    "set_config_cache_maxsize",
+    "record_timings",
+    "add_timing_hook",
+    "remove_timing_hook",
 ]
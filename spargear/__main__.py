@@ -0,0 +1,77 @@
+"""Command-line tools of spargear.
+
+    python -m spargear compile mypkg.cli:App
+    python -m spargear completion mypkg.cli:App --shell bash --prog myapp
+"""
+
+import sys
+from pathlib import Path
+from typing import List, Optional, Type
+
+from ._compiled import compile_arguments, import_target
+from ._completion import Shell, completion_script, write_completion_index
+from .argspec import ArgumentSpec
+from .arguments import RunnableArguments, SubcommandArguments
+from .base import BaseArguments
+from .subcommand import SubcommandSpec
+
+
+class CompileArguments(RunnableArguments[None]):
+    """Compile the schemas of argument classes, so that later starts skip analysing them.
+
+    A module is written to `__pycache__` next to every source file involved. It is ignored as soon as
+    one of those files changes, so compile again after editing."""
+
+    targets: ArgumentSpec[List[str]] = ArgumentSpec(
+        ["targets"], nargs="+", metavar="module:Class", help="Argument classes to compile, with their subcommands."
+    )
+
+    def run(self) -> None:
+        classes = [_import_arguments(target) for target in self.targets.unwrap()]
+        for path in compile_arguments(*classes):
+            print(path, file=sys.stderr)
+
+
+class CompletionArguments(RunnableArguments[None]):
+    """Write the shell completion index of an argument class, and print a completion script for it.
+
+    Completing reads only the index, so the application is not imported on every key press. The index
+    is regenerated by itself when a source file it was generated from changes."""
+
+    target: ArgumentSpec[str] = ArgumentSpec(["target"], metavar="module:Class", help="The argument class of the CLI.")
+    shell: Optional[Shell] = None
+    """Print the completion script for this shell (default: only write the index)."""
+    prog: Optional[str] = None
+    """The command to complete (default: the top-level package of the class)."""
+    index: Optional[Path] = None
+    """Where to write the index (default: in the user's cache directory)."""
+
+    def run(self) -> None:
+        cls = _import_arguments(self.target.unwrap())
+        if self.shell is None:
+            print(write_completion_index(cls, self.index, self.target.unwrap()), file=sys.stderr)
+        else:
+            print(completion_script(cls, self.shell, self.prog, self.index, self.target.unwrap()), end="")
+
+
+def _import_arguments(target: str) -> Type[BaseArguments]:
+    try:
+        cls = import_target(target)
+    except (ImportError, AttributeError, ValueError, TypeError) as e:
+        raise SystemExit(f"Cannot import {target}: {e}")
+    if not issubclass(cls, BaseArguments):
+        raise SystemExit(f"{target} is not a BaseArguments subclass")
+    return cls
+
+
+class SpargearArguments(SubcommandArguments):
+    """spargear tools."""
+
+    compile_command = SubcommandSpec("compile", argument_class=CompileArguments, help="Compile argument schemas.")
+    completion_command = SubcommandSpec(
+        "completion", argument_class=CompletionArguments, help="Set up shell completion."
+    )
+
+
+if __name__ == "__main__":
+    SpargearArguments().execute()
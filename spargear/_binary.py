@@ -0,0 +1,255 @@
+"""A compact binary format for argument values, laid out by the class's schema.
+
+The field order and types are known to both ends, so only the values are written:
+
+    header   b"SPGB", format version (1 byte)
+    level    schema hash (8 bytes), then per field a status byte and its value, then the name of
+             the selected subcommand (empty if none), whose level follows
+
+A value of the declared type is written with `struct`: bools as 1 byte, ints as 4 bytes or, if
+they don't fit, 8, floats as 8, and strings, paths and enum members (by name) as UTF-8 after their
+size; lists and tuples as their size followed by their elements. Sizes below 255 take 1 byte,
+others 5. A value of another type is pickled instead.
+
+Like the namespace loader, the encoder and decoder of a class are generated as straight-line source
+specialised for its fields."""
+
+import pickle
+import struct
+from enum import Enum
+from hashlib import blake2b
+from pathlib import PurePath
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+MAGIC = b"SPGB"
+FORMAT_VERSION = 1
+HEADER = struct.pack("<4sB", MAGIC, FORMAT_VERSION)
+
+_I = struct.Struct("<I")
+_SCALAR_NAMES = {"?": "bool", "q": "int", "d": "float", "i": "int32"}
+_SIZES = {"?": 1, "q": 8, "d": 8, "i": 4}
+_INT_MIN, _INT_MAX = -(2**63), 2**63 - 1
+_NARROW_INT = "-2147483648 <= {0} <= 2147483647"
+# Sizes below 255 take one byte; larger ones are 255 followed by the size as 4 bytes
+_SMALL = tuple(bytes((n,)) for n in range(255))
+_MISSING = object()
+
+
+class BinaryField(NamedTuple):
+    """How the value of one argument is written."""
+
+    key: str
+    kind: str
+    """"?" (bool), "q" (int), "d" (float), "s" (str), "path", "enum", or "x" for always pickled."""
+    container: Optional[type]
+    """`list` or `tuple` if the value is that container of `kind` elements, otherwise None."""
+    type: Optional[type]
+    """The path or enum class that values of kind "path" or "enum" are read back as."""
+
+
+def field_kind(element_type: Optional[type]) -> str:
+    """The kind of the values of an argument whose (element) type is `element_type`."""
+    if element_type is bool:
+        return "?"
+    if element_type is int:
+        return "q"
+    if element_type is float:
+        return "d"
+    if element_type is str:
+        return "s"
+    if element_type is not None and issubclass(element_type, PurePath):
+        return "path"
+    if element_type is not None and issubclass(element_type, Enum):
+        return "enum"
+    return "x"
+
+
+class BinaryCodec:
+    """Writes and reads the values of one argument class, in the order of `fields`."""
+
+    def __init__(self, fields: Sequence[BinaryField]) -> None:
+        self.fields = tuple(fields)
+        layout = [(f.key, f.kind, f.container and f.container.__name__, f.type and f.type.__qualname__) for f in self.fields]
+        self.schema_hash = blake2b(repr(layout).encode(), digest_size=8).digest()
+        """Identifies the layout; bytes written for another layout are rejected instead of misread."""
+        namespace = codec_globals(self.fields, self.schema_hash)
+        exec(compile(generate_codec_source(self.fields), "<spargear binary codec>", "exec"), namespace)
+        self._encode: Callable[[Mapping[str, object], Callable[[str], object]], bytes] = namespace["encode"]  # pyright: ignore[reportAttributeAccessIssue]
+        self._decode: Callable[[bytes, int, Dict[str, object]], int] = namespace["decode"]  # pyright: ignore[reportAttributeAccessIssue]
+
+    def encode(self, values: Mapping[str, object], fallback: Callable[[str], object]) -> bytes:
+        """Returns the bytes of one level: the schema hash and the value of every field.
+
+        The values are read from `values` by key; `fallback(key)` gives those missing there."""
+        return self._encode(values, fallback)
+
+    def decode(self, data: bytes, offset: int, values: Dict[str, object], subject: str) -> int:
+        """Reads one level written by `encode()` at `offset` into `values`; returns the offset after it."""
+        if data[offset : offset + 8] != self.schema_hash:
+            raise ValueError(f"The data was written for another schema than that of {subject}")
+        try:
+            return self._decode(data, offset + 8, values)
+        except (struct.error, IndexError, UnicodeDecodeError, KeyError) as e:
+            raise ValueError(f"Truncated or corrupt data for {subject}: {e}") from e
+
+
+def generate_codec_source(fields: Sequence[BinaryField]) -> str:
+    """Generates the source of `encode(values, fallback)` and `decode(data, offset, values)` for `fields`.
+
+    `encode` reads the values by key from `values`, calling `fallback(key)` for those missing; `decode`
+    stores them into `values` and returns the offset after them. It refers to the path and enum classes
+    as `_t{i}`, which `codec_globals()` provides."""
+    lines: List[str] = ["def encode(values, fallback):", "    out = [_hash]", "    append = out.append", "    get = values.get"]
+    for i, f in enumerate(fields):
+        lines.append(f"    v = get({f.key!r}, _MISSING)")
+        lines.append("    if v is _MISSING:")
+        lines.append(f"        v = fallback({f.key!r})")
+        lines.append("    if v is None:")
+        lines.append("        append(b'\\x00')")
+        if f.container is not None and f.kind in _SCALAR_NAMES:
+            check = f"type(v) is {f.container.__name__} and all({_check(f.kind, 'e', i)} for e in v)"
+            if f.kind == "q":
+                lines.append(f"    elif {check} and all({_NARROW_INT.format('e')} for e in v):")
+                lines += ["        append(b'\\x03')", *_write_size("len(v)", "        ")]
+                lines.append("        append(_pack(f'<{len(v)}i', *v))")
+            lines.append(f"    elif {check}:")
+            lines += ["        append(b'\\x01')", *_write_size("len(v)", "        ")]
+            lines.append(f"        append(_pack(f'<{{len(v)}}{f.kind}', *v))")
+        elif f.container is not None and f.kind != "x":
+            lines.append(f"    elif type(v) is {f.container.__name__} and all({_check(f.kind, 'e', i)} for e in v):")
+            lines += ["        append(b'\\x01')", *_write_size("len(v)", "        ")]
+            lines.append("        for e in v:")
+            lines += _write_text(f.kind, "e", "            ")
+        elif f.kind in _SCALAR_NAMES:
+            if f.kind == "q":
+                lines.append(f"    elif type(v) is int and {_NARROW_INT.format('v')}:")
+                lines.append("        append(_pack_status_int32(3, v))")
+            lines.append(f"    elif {_check(f.kind, 'v', i)}:")
+            lines.append(f"        append(_pack_status_{_SCALAR_NAMES[f.kind]}(1, v))")
+        elif f.kind != "x":
+            lines.append(f"    elif {_check(f.kind, 'v', i)}:")
+            lines.append("        append(b'\\x01')")
+            lines += _write_text(f.kind, "v", "        ")
+        lines.append("    else:")
+        lines.append("        b = _dumps(v, _PROTOCOL)")
+        lines.append("        append(b'\\x02')")
+        lines += _write_size("len(b)", "        ")
+        lines.append("        append(b)")
+    lines.append("    return b''.join(out)")
+    lines.append("")
+
+    lines.append("def decode(data, offset, values):")
+    for i, f in enumerate(fields):
+        target = f"values[{f.key!r}]"
+        lines.append("    s = data[offset]")
+        lines.append("    offset += 1")
+        lines.append("    if s == 0:")
+        lines.append(f"        {target} = None")
+        lines.append("    elif s == 2:")
+        lines += _read_size("        ")
+        lines.append(f"        {target} = _loads(data[offset : offset + n])")
+        lines.append("        offset += n")
+        convert = "list" if f.container is list else "tuple"
+        if f.container is not None and f.kind in _SCALAR_NAMES:
+            for status, code in ((1, f.kind), (3, "i")) if f.kind == "q" else ((1, f.kind),):
+                lines.append(f"    elif s == {status}:")
+                lines += _read_size("        ")
+                lines.append(f"        {target} = {convert}(_unpack_from(f'<{{n}}{code}', data, offset))")
+                lines.append(f"        offset += {_SIZES[code]} * n")
+        elif f.container is not None and f.kind != "x":
+            lines.append("    elif s == 1:")
+            lines += _read_size("        ")
+            lines.append("        items = []")
+            lines.append("        for _ in range(n):")
+            lines += _read_text(f.kind, "items.append", i, "            ")
+            lines.append(f"        {target} = {'items' if f.container is list else 'tuple(items)'}")
+        elif f.kind in _SCALAR_NAMES:
+            for status, code in ((1, f.kind), (3, "i")) if f.kind == "q" else ((1, f.kind),):
+                lines.append(f"    elif s == {status}:")
+                lines.append(f"        {target}, = _unpack_{_SCALAR_NAMES[code]}(data, offset)")
+                lines.append(f"        offset += {_SIZES[code]}")
+        elif f.kind != "x":
+            lines.append("    elif s == 1:")
+            lines += _read_text(f.kind, f"{target} = ", i, "        ")
+        lines.append("    else:")
+        lines.append(f"        raise ValueError('invalid status byte {{}} of {f.key}'.format(s))")
+    lines.append("    return offset")
+    return "\n".join(lines) + "\n"
+
+
+def _check(kind: str, var: str, i: int) -> str:
+    if kind == "q":
+        return f"type({var}) is int and {_INT_MIN} <= {var} <= {_INT_MAX}"
+    if kind in ("path", "enum"):
+        return f"isinstance({var}, _t{i})"
+    return f"type({var}) is {({'?': 'bool', 'd': 'float', 's': 'str'})[kind]}"
+
+
+def _write_size(size: str, indent: str) -> List[str]:
+    return [f"{indent}n = {size}", f"{indent}append(_SMALL[n] if n < 255 else _pack_BI(255, n))"]
+
+
+def _read_size(indent: str) -> List[str]:
+    return [
+        f"{indent}n = data[offset]",
+        f"{indent}offset += 1",
+        f"{indent}if n == 255:",
+        f"{indent}    n, = _unpack_I(data, offset)",
+        f"{indent}    offset += 4",
+    ]
+
+
+def _write_text(kind: str, var: str, indent: str) -> List[str]:
+    text = {"s": var, "path": f"str({var})", "enum": f"{var}.name"}[kind]
+    return [f"{indent}b = {text}.encode('utf-8')", *_write_size("len(b)", indent), f"{indent}append(b)"]
+
+
+def _read_text(kind: str, store: str, i: int, indent: str) -> List[str]:
+    text = "data[offset : offset + n].decode('utf-8')"
+    value = {"s": text, "path": f"_t{i}({text})", "enum": f"_t{i}[{text}]"}[kind]
+    # `store` is either an assignment ("x = ") or a call ("items.append")
+    statement = f"{store}{value}" if store.endswith("= ") else f"{store}({value})"
+    return [*_read_size(indent), f"{indent}{statement}", f"{indent}offset += n"]
+
+
+def codec_globals(fields: Sequence[BinaryField], schema_hash: bytes) -> Dict[str, object]:
+    """The globals the source from `generate_codec_source()` needs."""
+    namespace: Dict[str, object] = {
+        "_hash": schema_hash,
+        "_MISSING": _MISSING,
+        "_SMALL": _SMALL,
+        "_dumps": pickle.dumps,
+        "_loads": pickle.loads,
+        "_PROTOCOL": pickle.HIGHEST_PROTOCOL,
+        "_pack": struct.pack,
+        "_unpack_from": struct.unpack_from,
+        "_pack_BI": struct.Struct("<BI").pack,
+        "_unpack_I": _I.unpack_from,
+    }
+    for code, name in _SCALAR_NAMES.items():
+        namespace[f"_pack_status_{name}"] = struct.Struct(f"<B{code}").pack
+        namespace[f"_unpack_{name}"] = struct.Struct(f"<{code}").unpack_from
+    for i, f in enumerate(fields):
+        if f.type is not None:
+            namespace[f"_t{i}"] = f.type
+    return namespace
+
+
+def write_text(text: str) -> bytes:
+    encoded = text.encode("utf-8")
+    size = len(encoded)
+    return (_SMALL[size] if size < 255 else struct.pack("<BI", 255, size)) + encoded
+
+
+def read_text(data: bytes, offset: int, subject: str) -> Tuple[str, int]:
+    try:
+        size = data[offset]
+        offset += 1
+        if size == 255:
+            (size,) = _I.unpack_from(data, offset)
+            offset += 4
+        if offset + size > len(data):
+            raise IndexError("text runs past the end of the data")
+        return data[offset : offset + size].decode("utf-8"), offset + size
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"Truncated or corrupt data for {subject}: {e}") from e
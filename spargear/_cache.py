@@ -0,0 +1,93 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, NamedTuple, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache, in the spirit of `functools.lru_cache().cache_info()`."""
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class LRUCache(Generic[K, V]):
+    """A small thread-safe mapping with least-recently-used eviction and hit/miss accounting."""
+
+    def __init__(self, maxsize: Optional[int] = 128) -> None:
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: Optional[int]) -> None:
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def get(self, key: K, validate: Optional[Callable[[V], bool]] = None) -> Optional[V]:
+        """Returns the cached value, or None if it is missing or rejected by `validate`."""
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            if validate is not None and not validate(value):
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key: K) -> Optional[V]:
+        """Returns the cached value or None, without counting a hit or miss or refreshing the entry."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def discard(self, predicate: Callable[[K, V], bool]) -> int:
+        """Removes every entry satisfying `predicate(key, value)` and returns how many were removed."""
+        with self._lock:
+            stale = [key for key, value in self._entries.items() if predicate(key, value)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(hits=self.hits, misses=self.misses, maxsize=self._maxsize, currsize=len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def _evict(self) -> None:
+        if self._maxsize is None:
+            return
+        while len(self._entries) > max(self._maxsize, 0):
+            self._entries.popitem(last=False)
@@ -0,0 +1,393 @@
+"""Ahead-of-time compiled schemas.
+
+`compile_arguments()` (or `python -m spargear compile module:Class`) writes, for every source file
+defining an argument class, a generated module to `__pycache__/<stem>.spargear.py`. It holds what
+spargear would otherwise work out at every start: the resolved type hints, the attribute docstrings
+used as help texts and the namespace loaders.
+
+At class creation, spargear loads that module if it is still valid: the Python version and the
+stamps (mtime and size) of every source file it was generated from must match. Each class entry is
+used only if the class's schema hash still matches too; otherwise the class is analysed as usual."""
+
+import hashlib
+import logging
+import os
+import sys
+import sysconfig
+import threading
+import types
+import typing
+import weakref
+from enum import Enum
+from importlib import import_module
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from pprint import pformat
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Type
+
+from ._config import Env
+from ._loader import LoaderField, NamespaceLoader, generate_loader_source, loader_globals
+from ._typing import (
+    Annotated,
+    extract_attr_docstrings,
+    get_args,
+    get_argument_type_hints,
+    get_origin,
+    get_own_annotations,
+    import_object,
+)
+
+if TYPE_CHECKING:
+    from .base import BaseArguments
+
+logger = logging.getLogger(__name__)
+
+COMPILED_ENV = "SPARGEAR_COMPILED"
+"""Environment variable that, when set to "0", makes spargear ignore compiled schemas."""
+_FORMAT_VERSION = 5
+
+_lock = threading.RLock()
+# Loaded compiled modules by source path; None when there is none, or it is stale
+_modules: Dict[str, Optional[types.ModuleType]] = {}
+_classes: "weakref.WeakKeyDictionary[type, Optional[CompiledClass]]" = weakref.WeakKeyDictionary()
+
+
+class CompiledClass(NamedTuple):
+    """The compiled schema of one argument class."""
+
+    docstrings: Dict[str, str]
+    """The attribute docstrings, as `extract_attr_docstrings()` returns them."""
+    hints: Optional[Callable[[types.ModuleType], Dict[str, object]]]
+    """Returns the type hints `get_argument_type_hints()` would, given the class's module; None if they could not be
+    compiled."""
+    loader_signature: str
+    loader_factory: Callable[..., NamespaceLoader]
+
+    def get_type_hints(self, cls: type) -> Optional[Dict[str, object]]:
+        if self.hints is None:
+            return None
+        try:
+            return self.hints(sys.modules[cls.__module__])
+        except Exception as e:
+            logger.debug(f"Compiled type hints of {cls.__qualname__} failed ({e!r}); evaluating them instead.")
+            return None
+
+    def get_loader(self, fields: Sequence[LoaderField], subject: str) -> Optional[NamespaceLoader]:
+        """The compiled loader, if it was generated for the same `fields`."""
+        if self.loader_signature != loader_signature(fields, subject):
+            return None
+        return self.loader_factory(**loader_globals(fields))
+
+
+def artifact_path(source_path: str) -> Path:
+    """Where the compiled schemas of the classes defined in `source_path` are written."""
+    source = Path(source_path)
+    return source.parent / "__pycache__" / f"{source.stem}.spargear.py"
+
+
+def schema_hash(cls: type) -> str:
+    """Hashes what a class body declares, without evaluating anything.
+
+    The result is the same while the class is being created and afterwards."""
+    annotations = get_own_annotations(cls)
+    names = {name for name in vars(cls) if not name.startswith("__")}.union(annotations)
+    parts = [
+        _FORMAT_VERSION,
+        cls.__qualname__,
+        [f"{base.__module__}:{base.__qualname__}" for base in cls.__bases__],
+        [(name, repr(hint)) for name, hint in annotations.items()],
+        sorted(names),
+    ]
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()[:32]
+
+
+def loader_signature(fields: Sequence[LoaderField], subject: str) -> str:
+    """Identifies the loader source `generate_loader_source()` produces for `fields`."""
+    return repr((
+        subject,
+        [
+            (
+                f.key,
+                f.attr,
+                f.container and f.container.__name__,
+                f.checkable_type is not None,
+                f.default_factory_spec is not None,
+                f.lazy,
+            )
+            for f in fields
+        ],
+    ))
+
+
+def get_compiled_class(cls: type) -> Optional[CompiledClass]:
+    """The compiled schema of `cls`, if there is a valid one."""
+    try:
+        return _classes[cls]
+    except KeyError:
+        pass
+    with _lock:
+        compiled = _classes[cls] = _find_compiled_class(cls)
+    return compiled
+
+
+def _find_compiled_class(cls: type) -> Optional[CompiledClass]:
+    if os.environ.get(COMPILED_ENV) == "0" or "<locals>" in cls.__qualname__:
+        return None
+    source_path = getattr(sys.modules.get(cls.__module__), "__file__", None)
+    if not source_path:
+        return None
+    if (module := _get_compiled_module(source_path)) is None:
+        return None
+    entry = module.CLASSES.get(cls.__qualname__)
+    if entry is None or entry["schema_hash"] != schema_hash(cls):
+        return None
+    return CompiledClass(
+        docstrings=entry["docstrings"],
+        hints=module.HINTS.get(cls.__qualname__),
+        loader_signature=entry["loader_signature"],
+        loader_factory=module.LOADERS[cls.__qualname__],
+    )
+
+
+def _get_compiled_module(source_path: str) -> Optional[types.ModuleType]:
+    if source_path in _modules:
+        return _modules[source_path]
+    module = None
+    path = artifact_path(source_path)
+    if path.is_file():
+        try:
+            spec = spec_from_file_location(f"{path.stem.replace('.', '_')}_compiled", path)
+            assert spec is not None and spec.loader is not None
+            module = module_from_spec(spec)
+            spec.loader.exec_module(module)
+            if not _is_current(module):
+                logger.debug(f"Compiled schemas {path} are stale; recompile them.")
+                module = None
+        except Exception as e:
+            logger.debug(f"Failed to load compiled schemas {path}: {e!r}")
+            module = None
+    _modules[source_path] = module
+    return module
+
+
+def _is_current(module: types.ModuleType) -> bool:
+    if module.FORMAT != _FORMAT_VERSION or tuple(module.PYTHON) != sys.version_info[:2]:
+        return False
+    for path, stamp in module.STAMPS.items():
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if [stat.st_mtime_ns, stat.st_size] != stamp:
+            return False
+    return True
+
+
+def invalidate_compiled_schemas() -> None:
+    """Forget the compiled modules loaded so far, so they are looked up (and validated) again."""
+    with _lock:
+        _modules.clear()
+        _classes.clear()
+
+
+# Compilation
+
+
+class _NotCompilable(Exception):
+    """Raised for type hints that can't be written as source."""
+
+
+class _HintWriter:
+    """Writes type hints as source, referring to the class's own module as `_m` and to others through `_mod()`."""
+
+    def __init__(self, module_name: str) -> None:
+        self.module_name = module_name
+        self.modules: Set[str] = set()
+
+    def write(self, hint: object) -> str:
+        if hint is type(None):
+            return "type(None)"
+        if hint is Ellipsis:
+            return "..."
+        if hint is typing.Any:
+            return "typing.Any"
+        origin = get_origin(hint)
+        if origin is None:
+            if isinstance(hint, type):
+                return self.write_class(hint)
+            raise _NotCompilable(hint)
+        args = get_args(hint)
+        if origin is typing.Literal:
+            return f"typing.Literal[{', '.join(self.write_value(arg) for arg in args)}]"
+        if origin is Annotated:
+            metadata = getattr(hint, "__metadata__", ())
+            written = [self.write(getattr(hint, "__origin__"))] + [self.write_value(m) for m in metadata]
+            return f"{self.write_module('spargear._typing')}.Annotated[{', '.join(written)}]"
+        if not args:
+            raise _NotCompilable(hint)
+        written_args = ", ".join(self.write(arg) for arg in args)
+        if sys.version_info >= (3, 10) and origin is types.UnionType:
+            return " | ".join(self.write(arg) for arg in args)
+        if origin is typing.Union:
+            return f"typing.Union[{written_args}]"
+        if sys.version_info >= (3, 9) and isinstance(hint, types.GenericAlias):
+            return f"{self.write_class(origin)}[{written_args}]"  # pyright: ignore[reportArgumentType]
+        if (name := getattr(hint, "_name", None)) and getattr(typing, name, None) is not None:
+            return f"typing.{name}[{written_args}]"
+        if isinstance(origin, type):
+            return f"{self.write_class(origin)}[{written_args}]"
+        raise _NotCompilable(hint)
+
+    def write_value(self, value: object) -> str:
+        if value is None or type(value) in (str, bytes, int, float, bool):
+            return repr(value)
+        if isinstance(value, Enum):
+            return f"{self.write_class(type(value))}.{value.name}"
+        if isinstance(value, Env):
+            return f"{self.write_module('spargear._config')}.Env({value.name!r})"
+        raise _NotCompilable(value)
+
+    def write_class(self, cls: type) -> str:
+        if "<locals>" in cls.__qualname__:
+            raise _NotCompilable(cls)
+        if cls.__module__ == "builtins":
+            return cls.__qualname__
+        if cls.__module__ == self.module_name:
+            return f"_m.{cls.__qualname__}"
+        return f"{self.write_module(cls.__module__)}.{cls.__qualname__}"
+
+    def write_module(self, module_name: str) -> str:
+        self.modules.add(module_name)
+        return f"_mod({module_name!r})"
+
+
+def compile_arguments(*classes: Type["BaseArguments"]) -> List[Path]:
+    """Compiles the schemas of `classes`, their subcommands and every argument class defined next to them.
+
+    One module is written per source file, to `__pycache__/<stem>.spargear.py`; returns their paths."""
+    from .base import BaseArguments
+
+    by_source: Dict[str, List[Type[BaseArguments]]] = {}
+    for cls in _walk_classes(classes):
+        source_path = getattr(sys.modules.get(cls.__module__), "__file__", None)
+        if source_path and "<locals>" not in cls.__qualname__:
+            by_source.setdefault(source_path, [])
+            if cls not in by_source[source_path]:
+                by_source[source_path].append(cls)
+
+    written: List[Path] = []
+    for source_path, source_classes in by_source.items():
+        module = sys.modules[source_classes[0].__module__]
+        for value in list(vars(module).values()):
+            if (
+                isinstance(value, type)
+                and issubclass(value, BaseArguments)
+                and value.__module__ == module.__name__
+                and value not in source_classes
+            ):
+                source_classes.append(value)
+        path = artifact_path(source_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(_generate_module(source_path, source_classes), encoding="utf-8")
+        written.append(path)
+    invalidate_compiled_schemas()
+    return written
+
+
+def _walk_classes(roots: Iterable[Type["BaseArguments"]]) -> List[Type["BaseArguments"]]:
+    """The classes and, recursively, the argument classes of their subcommands and their bases."""
+    from .base import BaseArguments
+
+    seen: List[Type[BaseArguments]] = []
+    pending = list(roots)
+    while pending:
+        cls = pending.pop()
+        if cls in seen or cls is BaseArguments:
+            continue
+        seen.append(cls)
+        pending.extend(base for base in cls.__mro__[1:] if issubclass(base, BaseArguments))
+        pending.extend(subc.get_argument_class() for subc in cls.__subcommands__.values())
+    return seen
+
+
+def _generate_module(source_path: str, classes: Sequence[Type["BaseArguments"]]) -> str:
+    from .base import BaseArguments
+
+    stamped: Set[str] = {source_path}
+    entries: Dict[str, Dict[str, object]] = {}
+    functions: List[str] = []
+    hints_names: Dict[str, str] = {}
+    loader_names: Dict[str, str] = {}
+    for index, cls in enumerate(classes):
+        fields, subject = cls._get_loader_fields(), cls.__qualname__  # pyright: ignore[reportPrivateUsage]
+        entries[cls.__qualname__] = {
+            "schema_hash": schema_hash(cls),
+            "docstrings": extract_attr_docstrings(cls),
+            "loader_signature": loader_signature(fields, subject),
+        }
+
+        writer = _HintWriter(cls.__module__)
+        hints = get_argument_type_hints(cls, BaseArguments)
+        try:
+            items = [f"        {name!r}: {writer.write(hint)}," for name, hint in hints.items()]
+            source = "\n".join([f"def _hints_{index}(_m):", "    return {", *items, "    }"])
+            namespace: Dict[str, object] = {"typing": typing, "_mod": import_module}
+            exec(source, namespace)
+            if namespace[f"_hints_{index}"](sys.modules[cls.__module__]) != hints:  # pyright: ignore[reportCallIssue]
+                raise _NotCompilable(cls)
+        except _NotCompilable as e:
+            logger.info(f"Type hints of {cls.__qualname__} are left uncompiled: {e.args[0]!r} can't be written as source.")
+        else:
+            functions.append(source)
+            hints_names[cls.__qualname__] = f"_hints_{index}"
+            stamped.update(
+                file
+                for file in (getattr(sys.modules.get(name), "__file__", None) for name in writer.modules)
+                if file and not _is_stdlib(file)
+            )
+
+        loader_source = generate_loader_source(fields, "load_namespace", subject)
+        functions.append(
+            "\n".join([
+                f"def _loader_{index}({', '.join(sorted(loader_globals(fields)))}):",
+                *(f"    {line}" if line else "" for line in loader_source.splitlines()),
+                "    return load_namespace",
+            ])
+        )
+        loader_names[cls.__qualname__] = f"_loader_{index}"
+
+    stamps: Dict[str, List[int]] = {}
+    for path in sorted(stamped):
+        stat = os.stat(path)
+        stamps[path] = [stat.st_mtime_ns, stat.st_size]
+    roots = ", ".join(f"{cls.__module__}:{cls.__qualname__}" for cls in classes)
+    lines = [
+        f'"""Schemas of {roots}, compiled by spargear. Do not edit; recompile instead."""',
+        "",
+        "import typing",
+        "from importlib import import_module as _mod",
+        "",
+        f"FORMAT = {_FORMAT_VERSION}",
+        f"PYTHON = {tuple(sys.version_info[:2])!r}",
+        f"STAMPS = {pformat(stamps)}",
+        f"CLASSES = {pformat(entries, sort_dicts=False)}",
+        "",
+        *(f"\n{function}\n" for function in functions),
+        "",
+        f"HINTS = {{{', '.join(f'{qualname!r}: {name}' for qualname, name in hints_names.items())}}}",
+        f"LOADERS = {{{', '.join(f'{qualname!r}: {name}' for qualname, name in loader_names.items())}}}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _is_stdlib(path: str) -> bool:
+    paths = sysconfig.get_paths()
+    return any(os.path.commonpath([path, paths[key]]) == paths[key] for key in ("stdlib", "platstdlib"))
+
+
+def import_target(target: str) -> type:
+    """Imports the class a "module:qualname" target names."""
+    obj = import_object(target)
+    if not isinstance(obj, type):
+        raise TypeError(f"{target} is not a class")
+    return obj
@@ -0,0 +1,141 @@
+"""Answers shell completion requests from a completion index, without importing the application.
+
+The shell scripts from `completion_script()` run this file directly (not as part of the package), so
+it must only use the standard library:
+
+    python -I -S _completer.py {bash,zsh,fish} INDEX CWORD WORD...
+
+(`-I` also keeps this directory off `sys.path`, where `_typing.py` would shadow the standard library.)
+
+CWORD is the index of the word being completed in WORD..., whose first word is the program name.
+Candidates are printed one per line. If a source file the index was generated from changed, the
+index is regenerated first, which imports the application once."""
+
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+INDEX_FORMAT_VERSION = 1
+
+# An index holds {"classes": {key: class}, "root": key, ...}. A class is {"options": {flag: [arity, choices or
+# None, help]}, "positionals": [[arity, choices or None]], "subcommands": {name: [help, key]}}; an arity is an
+# int or "?", "*" or "+"
+Index = Dict[str, Any]
+
+
+def load_index(path: str) -> Optional[Index]:
+    """Reads the index at `path`, regenerating it if it is stale; None if it can't be had."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get("version") == INDEX_FORMAT_VERSION and is_current(index):
+        return index
+    if not regenerate(index, path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_current(index: Index) -> bool:
+    """Whether every source file the index was generated from is unchanged."""
+    for path, stamp in index.get("stamps", {}).items():
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if [stat.st_mtime_ns, stat.st_size] != stamp:
+            return False
+    return True
+
+
+def regenerate(index: Index, path: str) -> bool:
+    """Rebuilds the index by importing the application in a normal interpreter."""
+    python, target = index.get("python"), index.get("target")
+    if not isinstance(python, str) or not isinstance(target, str):
+        return False
+    import subprocess  # Only needed here; every import delays the completions
+
+    command = [python, "-m", "spargear", "completion", target, "--index", path]
+    try:
+        return subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60).returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def complete(index: Index, words: Sequence[str], cword: int) -> List[Tuple[str, str]]:
+    """Returns `(candidate, description)` pairs for `words[cword]`."""
+    node = index["classes"][index["root"]]
+    positional_index = positional_taken = 0
+    expecting: Optional[List[Any]] = None  # The option the current word is a value of
+    i = 1
+    while i < cword:
+        word = words[i]
+        i += 1
+        if word == "--":
+            break
+        if word.startswith("-") and len(word) > 1:
+            option = node["options"].get(word)
+            if option is None or option[0] == 0:
+                continue
+            # Skip the values already typed; the current word may be one of them
+            arity = option[0]
+            limit = arity if isinstance(arity, int) else 1 if arity == "?" else None
+            taken = 0
+            while i < cword and not words[i].startswith("-") and (limit is None or taken < limit):
+                i += 1
+                taken += 1
+            # An optional value is only worth suggesting if there are choices
+            if i == cword and (limit is None or taken < limit) and (arity != "?" or option[1]):
+                expecting = option
+            continue
+        if positional_index < len(node["positionals"]):
+            arity = node["positionals"][positional_index][0]
+            positional_taken += 1
+            if arity not in ("*", "+") and positional_taken >= (arity if isinstance(arity, int) else 1):
+                positional_index, positional_taken = positional_index + 1, 0
+            continue
+        if (subcommand := node["subcommands"].get(word)) is not None:
+            node = index["classes"][subcommand[1]]
+            positional_index = positional_taken = 0
+
+    current = words[cword] if cword < len(words) else ""
+    # A variable number of values may end here, with the next option
+    if expecting is not None and not (current.startswith("-") and not isinstance(expecting[0], int)):
+        return [(choice, "") for choice in expecting[1] or () if choice.startswith(current)]
+    if current.startswith("-"):
+        return [(flag, option[2]) for flag, option in node["options"].items() if flag.startswith(current)]
+    if positional_index < len(node["positionals"]):
+        return [(choice, "") for choice in node["positionals"][positional_index][1] or () if choice.startswith(current)]
+    return [(name, subcommand[0]) for name, subcommand in node["subcommands"].items() if name.startswith(current)]
+
+
+def format_candidates(shell: str, candidates: List[Tuple[str, str]]) -> str:
+    if shell == "zsh":
+        lines = [candidate.replace(":", "\\:") + (f":{help}" if help else "") for candidate, help in candidates]
+    elif shell == "fish":
+        lines = [candidate + (f"\t{help}" if help else "") for candidate, help in candidates]
+    else:
+        lines = [candidate for candidate, _ in candidates]
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str]) -> int:
+    if len(argv) < 3:
+        print(__doc__, file=sys.stderr)
+        return 2
+    shell, path, cword, words = argv[0], argv[1], int(argv[2]), list(argv[3:])
+    if (index := load_index(path)) is None:
+        return 1
+    if output := format_candidates(shell, complete(index, words, cword)):
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
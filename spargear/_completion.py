@@ -0,0 +1,169 @@
+"""Shell completion backed by a precomputed index.
+
+`write_completion_index()` resolves the whole subcommand tree once and stores, per argument class, its
+option strings with their arity, choices and help, its positionals and its subcommands. The scripts from
+`completion_script()` answer every completion request by running `_completer.py`, which reads only
+that index, so the application is never imported while completing."""
+
+import hashlib
+import json
+import os
+import shlex
+import sys
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Type, Union, cast
+
+from ._completer import INDEX_FORMAT_VERSION, Index
+from ._typing import ACTION_TYPES_THAT_DONT_SUPPORT_TYPE_KWARG
+
+if TYPE_CHECKING:
+    from .base import BaseArguments
+
+Shell = Literal["bash", "zsh", "fish"]
+SHELLS = ("bash", "zsh", "fish")
+
+
+def default_index_path(target: str) -> Path:
+    """The index location for a "module:qualname" target, in the user's cache directory."""
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache) / "spargear" / "completion" / f"{target.replace(':', '.')}.json"
+
+
+def build_completion_index(cls: Type["BaseArguments"], target: Optional[str] = None) -> Index:
+    """Describes the command-line interface of `cls` for `_completer.complete()`."""
+    classes: Dict[str, Dict[str, object]] = {}
+    sources: Dict[str, None] = {}
+    pending: List[Type[BaseArguments]] = [cls]
+    while pending:
+        current = pending.pop()
+        if (key := _class_key(current)) in classes:
+            continue
+        options: Dict[str, List[object]] = {
+            "-h": [0, None, "Show this help message and exit."],
+            "--help": [0, None, "Show this help message and exit."],
+        }
+        positionals: List[List[object]] = []
+        for spec, spec_type in current.__arguments__.values():
+            arity: Union[int, str] = 0 if spec.action in ACTION_TYPES_THAT_DONT_SUPPORT_TYPE_KWARG else spec.nargs or 1
+            choices: Optional[List[str]] = None
+            if spec.choices:
+                choices = [c.name if isinstance(c, Enum) else str(c) for c in spec.choices]
+            elif isinstance(spec_type.type, type) and issubclass(spec_type.type, Enum):
+                # Enum arguments are converted by member name rather than restricted to choices
+                choices = list(spec_type.type.__members__)
+            if any(name.startswith("-") for name in spec.name_or_flags):
+                for flag in spec.name_or_flags:
+                    options[flag] = [arity, choices, _first_line(spec.help)]
+            else:
+                positionals.append([arity, choices])
+        subcommands: Dict[str, List[str]] = {}
+        for name, subc in current.__subcommands__.items():
+            try:
+                argument_class = subc.get_argument_class()
+            except Exception:
+                continue
+            subcommands[name] = [_first_line(subc.help), _class_key(argument_class)]
+            pending.append(argument_class)
+        classes[key] = {"options": options, "positionals": positionals, "subcommands": subcommands}
+        if source := getattr(sys.modules.get(current.__module__), "__file__", None):
+            sources[source] = None
+
+    stamps: Dict[str, List[int]] = {}
+    for source in sources:
+        stat = os.stat(source)
+        stamps[source] = [stat.st_mtime_ns, stat.st_size]
+    return {
+        "version": INDEX_FORMAT_VERSION,
+        "target": target or _class_key(cls),
+        "python": sys.executable,
+        "schema_hash": hashlib.sha256(json.dumps(classes, sort_keys=True).encode("utf-8")).hexdigest()[:16],
+        "stamps": stamps,
+        "root": _class_key(cls),
+        "classes": classes,
+    }
+
+
+def write_completion_index(
+    cls: Type["BaseArguments"], path: Optional[Union[str, "os.PathLike[str]"]] = None, target: Optional[str] = None
+) -> Path:
+    """Writes the completion index of `cls` (by default to `default_index_path()`) and returns its path.
+
+    If the schema is unchanged, only the source stamps of an existing index are refreshed."""
+    index = build_completion_index(cls, target)
+    index_path = Path(path) if path is not None else default_index_path(index["target"])
+    previous: object
+    try:
+        previous = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        previous = None
+    if isinstance(previous, dict):
+        previous_index = cast(Dict[str, Any], previous)
+        if previous_index.get("schema_hash") == index["schema_hash"]:
+            previous_index["stamps"] = index["stamps"]
+            index = previous_index
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    temporary.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    os.replace(temporary, index_path)
+    return index_path
+
+
+def completion_script(
+    cls: Type["BaseArguments"],
+    shell: Shell,
+    prog: Optional[str] = None,
+    index: Optional[Union[str, "os.PathLike[str]"]] = None,
+    target: Optional[str] = None,
+) -> str:
+    """Writes the completion index of `cls` and returns a `shell` script completing `prog` from it.
+
+    `prog` defaults to the top-level package of `cls`; source the script from the shell's startup file.
+    `target` ("module:qualname") is how the index is regenerated when the sources change."""
+    if shell not in SHELLS:
+        raise ValueError(f"Unsupported shell {shell!r} (choose from {', '.join(SHELLS)})")
+    prog = prog or cls.__module__.split(".")[0]
+    index_path = write_completion_index(cls, index, target)
+    command = " ".join(
+        shlex.quote(str(part)) for part in (sys.executable, "-I", "-S", Path(__file__).with_name("_completer.py"), shell, index_path)
+    )
+    function = "_spargear_complete_" + "".join(c if c.isalnum() else "_" for c in prog)
+    if shell == "bash":
+        lines = [
+            f"{function}() {{",
+            "    local IFS=$'\\n'",
+            f'    COMPREPLY=($({command} "$COMP_CWORD" "${{COMP_WORDS[@]}}" 2>/dev/null))',
+            "}",
+            f"complete -o default -F {function} {shlex.quote(prog)}",
+        ]
+    elif shell == "zsh":
+        lines = [
+            f"#compdef {prog}",
+            f"{function}() {{",
+            "    local -a candidates",
+            f'    candidates=("${{(@f)$({command} $((CURRENT - 1)) "${{words[@]}}" 2>/dev/null)}}")',
+            '    if [[ -n "${candidates[1]}" ]]; then',
+            "        _describe 'values' candidates",
+            "    else",
+            "        _files",
+            "    fi",
+            "}",
+            f"compdef {function} {shlex.quote(prog)}",
+        ]
+    else:
+        lines = [
+            f"function {function}",
+            "    set -l words (commandline -opc) (commandline -ct)",
+            f"    {command} (math (count $words) - 1) $words 2>/dev/null",
+            "end",
+            f"complete -c {shlex.quote(prog)} -a '({function})'",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def _class_key(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _first_line(text: Optional[str]) -> str:
+    return (text or "").strip().split("\n", 1)[0]
@@ -0,0 +1,234 @@
+"""Configuration sources for layered loading: configuration files and environment variables.
+
+Configuration files are parsed once and the parsed documents are cached process-wide, keyed by
+path and format. A cached document is reused until the file's modification time or size changes;
+the cache keeps the `maxsize` most recently used documents."""
+
+import json
+import os
+import shlex
+from copy import deepcopy
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Literal, Mapping, NamedTuple, Optional, Sequence, Tuple, Union, cast
+
+from ._cache import CacheInfo, LRUCache
+
+if TYPE_CHECKING:
+    from .argspec import ArgumentSpec, ArgumentSpecType
+
+ConfigFormat = Literal["json", "toml", "ini"]
+ConfigSource = Union[str, Path, Mapping[str, object]]
+"""A configuration file, or its already loaded contents."""
+
+_SUFFIX_FORMATS: Dict[str, ConfigFormat] = {".json": "json", ".toml": "toml", ".ini": "ini", ".cfg": "ini"}
+_TRUE_STRINGS = ("true", "1", "yes", "on")
+_FALSE_STRINGS = ("false", "0", "no", "off")
+
+
+class ConfigLayer(NamedTuple):
+    """The values of one configuration source by argument name; a subcommand's are nested under its name."""
+
+    name: str
+    """Where the values come from, as reported by `get_value_source()`."""
+    values: Mapping[str, object]
+    from_strings: bool = False
+    """Whether the values are text to convert as the command line would (INI files, the environment)."""
+
+
+class Env(NamedTuple):
+    """Annotated metadata naming the environment variable an argument is read from:
+
+        port: Annotated[int, Env("PORT")] = 8080
+
+    The name is used as is, without the class's `__env_prefix__`; with no name, the argument is read
+    from the prefixed variable even without a prefix."""
+
+    name: Optional[str] = None
+
+
+class _ConfigDocument(NamedTuple):
+    mtime_ns: int
+    size: int
+    values: Mapping[str, object]
+
+    def is_current(self, stat: os.stat_result) -> bool:
+        return self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size
+
+
+# Parsed documents by (absolute path, format)
+_documents: "LRUCache[Tuple[str, str], _ConfigDocument]" = LRUCache(maxsize=64)
+
+
+def infer_config_format(path: Union[str, Path]) -> Optional[ConfigFormat]:
+    """The format of a configuration file by its extension: .json, .toml, or .ini/.cfg."""
+    return _SUFFIX_FORMATS.get(Path(path).suffix.lower())
+
+
+def read_config_file(path: Union[str, Path], format: Optional[ConfigFormat] = None) -> Mapping[str, object]:
+    """Returns the values of a configuration file, parsing it only if it changed since it was last read.
+
+    The returned mapping is shared between callers and must not be modified. INI files have no
+    top-level values; those of the [DEFAULT] section are used instead, and every other section
+    becomes a nested mapping."""
+    if format is None and (format := infer_config_format(path)) is None:
+        raise ValueError(f"Cannot infer the format of configuration file {path}; give it explicitly")
+    key = (os.path.abspath(path), format)
+    stat = os.stat(key[0])
+    if (document := _documents.get(key, lambda document: document.is_current(stat))) is not None:
+        return document.values
+    with open(key[0], "rb") as f:
+        data = f.read()
+    values = _parse_config(data, format, path)
+    # Stat the file as read; a change made while reading is picked up by the next call
+    _documents.put(key, _ConfigDocument(stat.st_mtime_ns, stat.st_size, values))
+    return values
+
+
+def _parse_config(data: bytes, format: ConfigFormat, path: Union[str, Path]) -> Mapping[str, object]:
+    if format == "json":
+        values: object = json.loads(data.decode("utf-8"))
+        if not isinstance(values, dict):
+            raise ValueError(f"Configuration file {path} must contain an object, not {type(values).__name__}")
+        return values  # pyright: ignore[reportUnknownVariableType]
+    if format == "toml":
+        try:
+            import tomllib  # pyright: ignore[reportMissingImports]
+        except ImportError:  # Python < 3.11
+            try:
+                import tomli as tomllib  # pyright: ignore[reportMissingImports]
+            except ImportError:
+                raise ImportError(f"Reading {path} needs Python 3.11+ or the `tomli` package") from None
+        return cast(Dict[str, object], tomllib.loads(data.decode("utf-8")))  # pyright: ignore[reportUnknownMemberType]
+    from configparser import ConfigParser
+
+    # [DEFAULT] holds the top-level values; it is read as an ordinary section so that its keys don't leak into the others
+    parser = ConfigParser(interpolation=None, default_section="\0")
+    parser.optionxform = str  # pyright: ignore[reportAttributeAccessIssue]  # Keep the case of argument names
+    parser.read_string(data.decode("utf-8"), source=str(path))
+    ini_values: Dict[str, object] = {}
+    for section in parser.sections():
+        values = dict(parser.items(section))
+        if section == "DEFAULT":
+            ini_values.update(values)
+        else:
+            ini_values[section] = values
+    return ini_values
+
+
+def config_layer(source: ConfigSource, format: Optional[ConfigFormat] = None) -> ConfigLayer:
+    """The layer of a configuration source, named `config:<path>` for files and `config` otherwise."""
+    if not isinstance(source, (str, Path)):
+        return ConfigLayer("config", source)
+    if format is None:
+        format = infer_config_format(source)
+    return ConfigLayer(f"config:{source}", read_config_file(source, format), from_strings=format == "ini")
+
+
+def nested_layers(layers: Sequence[ConfigLayer], name: str) -> List[ConfigLayer]:
+    """The layers of the values nested under `name`, in the same order; layers without them are left out."""
+    return [
+        layer._replace(values=cast(Mapping[str, object], sub))
+        for layer in layers
+        if isinstance(sub := layer.values.get(name), Mapping)
+    ]
+
+
+def take_layer_value(value: object) -> object:
+    """A value from a layer, copied if it is a container, since cached documents are shared."""
+    return deepcopy(cast(object, value)) if isinstance(value, (list, dict)) else value
+
+
+def coerce_string(spec: "ArgumentSpec[object]", spec_type: "ArgumentSpecType", text: str) -> object:
+    """Converts the text given for an argument outside the command line as the command line would.
+
+    Flags take true/false, yes/no, on/off or 1/0, counts a number, and arguments taking several
+    values a shell-style list."""
+    kwargs = spec.get_add_argument_kwargs()
+    action, nargs = kwargs["action"], kwargs["nargs"]
+    if action in ("store_true", "store_false"):
+        if (lowered := text.strip().lower()) not in _TRUE_STRINGS + _FALSE_STRINGS:
+            raise ValueError(f"invalid boolean value: {text!r}")
+        return (lowered in _TRUE_STRINGS) == (action == "store_true")
+    if action == "count":
+        return int(text)
+    convert, choices = kwargs["type"], kwargs["choices"]
+    if spec_type.should_return_as_list or spec_type.should_return_as_tuple or nargs in ("*", "+") or isinstance(nargs, int):
+        items = [_convert(item, convert, choices) for item in shlex.split(text)]
+        return tuple(items) if spec_type.should_return_as_tuple else items
+    return _convert(text, convert, choices)
+
+
+def coerce_value(spec: "ArgumentSpec[object]", spec_type: "ArgumentSpecType", value: object) -> object:
+    """Converts a value given for an argument by a typed source (JSON, TOML, a mapping).
+
+    Text, alone or in a list, is converted with the argument's type as on the command line, and the
+    choices of the argument are checked; other values are kept as they are."""
+    kwargs = spec.get_add_argument_kwargs()
+    if kwargs["action"] in ("store_true", "store_false", "count"):
+        return value
+    convert, choices = kwargs["type"], kwargs["choices"]
+    if (spec_type.should_return_as_list or spec_type.should_return_as_tuple) and isinstance(value, (list, tuple)):
+        items = [_convert_item(item, convert, choices) for item in cast(Sequence[object], value)]
+        return tuple(items) if isinstance(value, tuple) else items
+    return _convert_item(value, convert, choices)
+
+
+def _convert_item(value: object, convert: Optional[Callable[[str], object]], choices: Optional[Sequence[object]]) -> object:
+    if isinstance(value, str):
+        return _convert(value, convert, choices)
+    return _check_choice(value, choices)
+
+
+def _convert(text: str, convert: Optional[Callable[[str], object]], choices: Optional[Sequence[object]]) -> object:
+    return _check_choice(text if convert is None else convert(text), choices)
+
+
+def _check_choice(value: object, choices: Optional[Sequence[object]]) -> object:
+    if choices is not None and value not in choices:
+        raise ValueError(f"invalid choice: {value!r} (choose from {', '.join(map(repr, choices))})")
+    return value
+
+
+def build_env_index(
+    prefix: Optional[str], arguments: Mapping[str, Tuple["ArgumentSpec[object]", "ArgumentSpecType"]], owner: str
+) -> Dict[str, str]:
+    """Maps the environment variables the arguments are read from to the argument names.
+
+    An argument is read from `<prefix><NAME>` if the class has a prefix, or from the variable named by
+    its `Env` metadata. Raises TypeError if two arguments would be read from the same variable."""
+    index: Dict[str, str] = {}
+    for key, (spec, _) in arguments.items():
+        env = next((m for m in spec.annotated if isinstance(m, Env)), None)
+        if env is not None and env.name is not None:
+            name = env.name
+        elif env is not None or prefix is not None:
+            name = f"{prefix or ''}{key.upper()}"
+        else:
+            continue
+        if (other := index.get(name)) is not None:
+            raise TypeError(f"{owner}.{other} and {owner}.{key} are both read from the environment variable {name}")
+        index[name] = key
+    return index
+
+
+def env_layer(index: Mapping[str, str], environ: Mapping[str, str]) -> Optional[ConfigLayer]:
+    """The layer of the variables in `index` that are set in `environ`, scanning it once; None if none are."""
+    values = {key: value for name, value in environ.items() if (key := index.get(name)) is not None}
+    return ConfigLayer("env", values, from_strings=True) if values else None
+
+
+def invalidate_config_cache() -> None:
+    """Drops every cached configuration document."""
+    _documents.clear()
+
+
+def config_cache_info() -> CacheInfo:
+    """Returns hit/miss statistics of the configuration document cache."""
+    return _documents.info()
+
+
+def set_config_cache_maxsize(maxsize: Optional[int]) -> None:
+    """Bounds the number of cached configuration documents; the least recently used ones are evicted first.
+
+    None removes the bound."""
+    _documents.maxsize = maxsize
@@ -0,0 +1,176 @@
+import atexit
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+import weakref
+from importlib.util import cache_from_source
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, NamedTuple, Optional, Set, Type, Union
+
+from . import _timings  # pyright: ignore[reportPrivateUsage]
+from ._compiled import get_compiled_class
+from ._typing import extract_attr_docstrings
+
+logger = logging.getLogger(__name__)
+
+DOCSTRING_CACHE_ENV = "SPARGEAR_DOCSTRING_CACHE"
+"""Environment variable enabling the cache: "1" stores it in `__pycache__`, any other non-empty value is a directory."""
+_CACHE_FORMAT_VERSION = 1
+
+# None means "not configured programmatically, consult the environment variable"
+_setting: Optional[Union[bool, Path]] = None
+_lock = threading.Lock()
+
+
+class _ModuleDocstrings(NamedTuple):
+    """Docstrings of the classes of one source file, valid while the file's stamp is unchanged."""
+
+    cache_file: Path
+    mtime_ns: int
+    size: int
+    classes: Dict[str, Dict[str, str]]
+
+
+_loaded: Dict[str, _ModuleDocstrings] = {}
+# Docstrings already looked up in this process, per class
+_memo: "weakref.WeakKeyDictionary[type, Dict[str, str]]" = weakref.WeakKeyDictionary()
+# Source paths whose entries gained classes since they were loaded; written out at exit
+_dirty: Set[str] = set()
+
+
+def enable_docstring_cache(directory: Optional[Union[str, "os.PathLike[str]"]] = None) -> None:
+    """Persist extracted attribute docstrings so later processes don't re-parse the sources.
+
+    The cache lives in `__pycache__` next to each source file, or in `directory` if given.
+    Entries are keyed by source path, mtime and size, and by class qualname."""
+    global _setting
+    with _lock:
+        _setting = True if directory is None else Path(directory)
+        _loaded.clear()
+        _memo.clear()
+        _dirty.clear()
+
+
+def disable_docstring_cache() -> None:
+    """Stop using the persistent docstring cache, whatever the environment says."""
+    global _setting
+    with _lock:
+        _setting = False
+        _loaded.clear()
+        _memo.clear()
+        _dirty.clear()
+
+
+def _get_setting() -> Union[bool, Path]:
+    if _setting is not None:
+        return _setting
+    value = os.environ.get(DOCSTRING_CACHE_ENV, "")
+    if value.lower() in ("", "0", "false", "no"):
+        return False
+    if value.lower() in ("1", "true", "yes"):
+        return True
+    return Path(value)
+
+
+def _cache_file_for(source_path: str, setting: Union[bool, Path]) -> Path:
+    if isinstance(setting, Path):
+        digest = hashlib.sha1(os.path.abspath(source_path).encode("utf-8")).hexdigest()
+        return setting / f"{Path(source_path).stem}-{digest[:16]}.spargear-docstrings.json"
+    # Follows PYTHONPYCACHEPREFIX like .pyc files do
+    return Path(os.path.splitext(cache_from_source(source_path))[0] + ".spargear-docstrings.json")
+
+
+def _load_module_docstrings(source_path: str, cache_file: Path, mtime_ns: int, size: int) -> _ModuleDocstrings:
+    entry = _loaded.get(source_path)
+    if entry is not None and entry.mtime_ns == mtime_ns and entry.size == size:
+        return entry
+    classes: Dict[str, Dict[str, str]] = {}
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        if (
+            data.get("version") == _CACHE_FORMAT_VERSION
+            and data.get("mtime_ns") == mtime_ns
+            and data.get("size") == size
+            and isinstance(data.get("classes"), dict)
+        ):
+            classes = data["classes"]
+    except (OSError, ValueError, AttributeError):
+        pass
+    entry = _ModuleDocstrings(cache_file=cache_file, mtime_ns=mtime_ns, size=size, classes=classes)
+    _loaded[source_path] = entry
+    return entry
+
+
+@atexit.register
+def flush_docstring_cache() -> None:
+    """Writes the docstrings extracted in this process to the persistent cache."""
+    with _lock:
+        for source_path in _dirty:
+            if (entry := _loaded.get(source_path)) is not None:
+                _store_module_docstrings(source_path, entry)
+        _dirty.clear()
+
+
+def _store_module_docstrings(source_path: str, entry: _ModuleDocstrings) -> None:
+    data = {
+        "version": _CACHE_FORMAT_VERSION,
+        "source": source_path,
+        "mtime_ns": entry.mtime_ns,
+        "size": entry.size,
+        "classes": entry.classes,
+    }
+    try:
+        entry.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = entry.cache_file.with_name(f"{entry.cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_file, entry.cache_file)
+    except OSError as e:
+        logger.debug(f"Failed to write docstring cache {entry.cache_file}: {e}")
+
+
+def get_attr_docstrings(cls: Type[object]) -> Dict[str, str]:
+    """Like `extract_attr_docstrings`, but memoized per class and served from the persistent cache when it is enabled.
+
+    Falls back to plain extraction when the class has no source file on disk (zipapps, frozen apps)."""
+    if (docstrings := _memo.get(cls)) is None:
+        docstrings = _memo[cls] = _get_attr_docstrings(cls)
+    return docstrings
+
+
+def _get_attr_docstrings(cls: Type[object]) -> Dict[str, str]:
+    if not _timings.enabled:
+        return _extract_or_load_attr_docstrings(cls)
+    started = perf_counter()
+    try:
+        return _extract_or_load_attr_docstrings(cls)
+    finally:
+        _timings.record("docstrings", started, cls)
+
+
+def _extract_or_load_attr_docstrings(cls: Type[object]) -> Dict[str, str]:
+    if (compiled := get_compiled_class(cls)) is not None:
+        return dict(compiled.docstrings)
+    setting = _get_setting()
+    if setting is False or "<locals>" in cls.__qualname__:
+        return extract_attr_docstrings(cls)
+    try:
+        source_path = inspect.getsourcefile(cls)
+        if source_path is None:
+            return extract_attr_docstrings(cls)
+        stat = os.stat(source_path)
+    except (TypeError, OSError):
+        return extract_attr_docstrings(cls)
+
+    with _lock:
+        cache_file = _cache_file_for(source_path, setting)
+        entry = _load_module_docstrings(source_path, cache_file, stat.st_mtime_ns, stat.st_size)
+        if (cached := entry.classes.get(cls.__qualname__)) is not None:
+            return cached
+        docstrings = extract_attr_docstrings(cls)
+        entry.classes[cls.__qualname__] = docstrings
+        _dirty.add(source_path)
+        return docstrings
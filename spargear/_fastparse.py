@@ -0,0 +1,277 @@
+"""A parse engine for the common subset of argparse features, working from tables built once per class.
+
+It makes a single pass over argv and reproduces exactly what argparse would put in the namespace.
+Whenever argparse would do anything else (print help, report an error, or handle a feature this
+engine does not implement), it gives up by returning None, and the caller parses with argparse."""
+
+import argparse
+import re
+from typing import Callable, Collection, Dict, List, Mapping, NamedTuple, Optional, Sequence, Set, Union
+
+_STORE = 0
+_STORE_TRUE = 1
+_STORE_FALSE = 2
+
+_NO_DEFAULT = object()
+_negative_number = re.compile(r"^-\d+$|^-\d*\.\d+$")
+
+
+class FastAction(NamedTuple):
+    """What the engine needs to know about one argument; built by `make_fast_action()`."""
+
+    dest: str
+    option_strings: Sequence[str]
+    """Empty for positionals."""
+    kind: int
+    nargs: Optional[Union[int, str]]
+    const: object
+    default: object
+    """`_NO_DEFAULT` when argparse would not put a default in the namespace."""
+    type: Optional[Callable[[str], object]]
+    choices: Optional[Collection[object]]
+    required: bool
+
+
+def make_fast_action(name_or_flags: Sequence[str], kwargs: Mapping[str, object]) -> Optional[FastAction]:
+    """Mirrors `add_argument(*name_or_flags, **kwargs)` for the supported subset; returns None for anything else."""
+    action = kwargs.get("action")
+    if action in (None, "store"):
+        kind = _STORE
+    elif action == "store_true":
+        kind = _STORE_TRUE
+    elif action == "store_false":
+        kind = _STORE_FALSE
+    else:
+        return None
+    if set(kwargs) - {"action", "nargs", "const", "default", "type", "choices", "required", "help", "metavar", "dest"}:
+        return None
+
+    nargs = kwargs.get("nargs")
+    const = kwargs.get("const")
+    type_func = kwargs.get("type")
+    choices = kwargs.get("choices")
+    if type_func is not None and not callable(type_func):
+        return None
+    if kind != _STORE and (nargs is not None or const is not None or type_func is not None or choices is not None):
+        return None
+    if nargs is not None and nargs not in ("?", "*", "+") and not (isinstance(nargs, int) and nargs > 0):
+        return None
+    if const is not None and nargs != "?":
+        return None
+    if choices is not None and not isinstance(choices, Collection):
+        return None
+
+    if "default" in kwargs:
+        default = kwargs["default"]
+        if default is argparse.SUPPRESS:
+            default = _NO_DEFAULT
+    else:
+        default = {_STORE: None, _STORE_TRUE: False, _STORE_FALSE: True}[kind]
+
+    is_option = any(name.startswith("-") for name in name_or_flags)
+    if is_option:
+        if not all(name.startswith("-") and len(name) > 1 for name in name_or_flags):
+            return None
+        if any(_negative_number.match(name) for name in name_or_flags):
+            return None
+        dest = kwargs.get("dest")
+        if not isinstance(dest, str):
+            return None
+        return FastAction(
+            dest=dest,
+            option_strings=tuple(name_or_flags),
+            kind=kind,
+            nargs=nargs,
+            const=const if kind == _STORE else kind == _STORE_TRUE,
+            default=default,
+            type=type_func,  # pyright: ignore[reportArgumentType]
+            choices=choices,  # pyright: ignore[reportArgumentType]
+            required=bool(kwargs.get("required", False)),
+        )
+
+    # Positionals: only a fixed number of values, so every one of them is required
+    if len(name_or_flags) != 1 or kind != _STORE or "dest" in kwargs or kwargs.get("required") is not None:
+        return None
+    if not (nargs is None or isinstance(nargs, int)):
+        return None
+    return FastAction(
+        dest=name_or_flags[0],
+        option_strings=(),
+        kind=kind,
+        nargs=nargs,
+        const=None,
+        default=default,
+        type=type_func,  # pyright: ignore[reportArgumentType]
+        choices=choices,  # pyright: ignore[reportArgumentType]
+        required=True,
+    )
+
+
+class _GiveUp(Exception):
+    """Raised internally when argparse has to take over."""
+
+
+class FastParser:
+    """Parses one level of a command line: the arguments of a class, then possibly one of its subcommands."""
+
+    def __init__(
+        self,
+        actions: Sequence[FastAction],
+        subcommand_names: Collection[str],
+        subcommand_required: bool,
+        resolve_subcommand: Callable[[str], Optional["FastParser"]],
+    ) -> None:
+        self.actions = actions
+        self.options: Dict[str, FastAction] = {name: a for a in actions for name in a.option_strings}
+        self.positionals = [a for a in actions if not a.option_strings]
+        self.subcommand_names = subcommand_names
+        self.subcommand_required = subcommand_required
+        self.resolve_subcommand = resolve_subcommand
+
+    @classmethod
+    def create(
+        cls,
+        actions: Sequence[Optional[FastAction]],
+        subcommand_names: Collection[str],
+        subcommand_required: bool,
+        resolve_subcommand: Callable[[str], Optional["FastParser"]],
+    ) -> Optional["FastParser"]:
+        """Returns a parser, or None if an argument is unsupported or argparse would reject the arguments."""
+        supported: List[FastAction] = []
+        option_strings: Set[str] = set()
+        for action in actions:
+            if action is None:
+                return None
+            if option_strings.intersection(action.option_strings) or "-h" in action.option_strings or "--help" in action.option_strings:
+                return None  # argparse raises on conflicting option strings
+            option_strings.update(action.option_strings)
+            supported.append(action)
+        return cls(supported, subcommand_names, subcommand_required, resolve_subcommand)
+
+    def parse_args(self, args: Sequence[str]) -> Optional[argparse.Namespace]:
+        """The namespace argparse would return, or None if argparse must parse `args` itself."""
+        try:
+            return argparse.Namespace(**self._parse(args, 0))
+        except _GiveUp:
+            return None
+
+    def _parse(self, args: Sequence[str], depth: int) -> Dict[str, object]:
+        namespace: Dict[str, object] = {}
+        for action in self.actions:
+            if action.default is not _NO_DEFAULT and action.dest not in namespace:
+                namespace[action.dest] = action.default
+        subcommand_dest = None
+        if self.subcommand_names:
+            subcommand_dest = "subcommand" if depth == 0 else f"subcommand_depth_{depth}"
+            namespace.setdefault(subcommand_dest, None)
+
+        seen: Set[str] = set()  # option strings or dests of the actions seen
+        positional_index = 0
+        subcommand_selected = False
+        i, n = 0, len(args)
+        while i < n:
+            token = args[i]
+            if token.startswith("-"):
+                i = self._consume_option(args, i, namespace, seen)
+                continue
+
+            # A run of values: fill the positionals in order, then maybe select a subcommand
+            end = i
+            while end < n and not args[end].startswith("-"):
+                end += 1
+            while positional_index < len(self.positionals):
+                action = self.positionals[positional_index]
+                count = 1 if action.nargs is None else int(action.nargs)
+                if end - i < count:
+                    break
+                values = [self._convert(action, value) for value in args[i : i + count]]
+                namespace[action.dest] = values[0] if action.nargs is None else values
+                seen.add(action.dest)
+                positional_index += 1
+                i += count
+            if i == end:
+                continue
+            if positional_index < len(self.positionals) or subcommand_dest is None:
+                raise _GiveUp  # values left over: a positional split by an option, or unrecognized arguments
+            name = args[i]
+            if name not in self.subcommand_names or (subparser := self.resolve_subcommand(name)) is None:
+                raise _GiveUp
+            # Like argparse, the subcommand parses everything that follows into its own namespace
+            namespace[subcommand_dest] = name
+            namespace.update(subparser._parse(args[i + 1 :], depth + 1))
+            subcommand_selected = True
+            break
+
+        if positional_index < len(self.positionals) or (self.subcommand_required and not subcommand_selected):
+            raise _GiveUp
+        for action in self.actions:
+            if (action.option_strings[0] if action.option_strings else action.dest) in seen:
+                continue
+            if action.required:
+                raise _GiveUp
+            # argparse converts string defaults of the arguments that were not given
+            default = action.default
+            if isinstance(default, str) and namespace.get(action.dest, _NO_DEFAULT) is default:
+                namespace[action.dest] = self._convert(action, default, check=False)
+        return namespace
+
+    def _consume_option(self, args: Sequence[str], i: int, namespace: Dict[str, object], seen: Set[str]) -> int:
+        token = args[i]
+        explicit: Optional[str] = None
+        if (action := self.options.get(token)) is None:
+            if not token.startswith("--") or "=" not in token:
+                raise _GiveUp
+            token, explicit = token.split("=", 1)
+            if (action := self.options.get(token)) is None or action.kind != _STORE or action.nargs not in (None, "?"):
+                raise _GiveUp
+        i += 1
+        if action.kind != _STORE:
+            value: object = action.const
+        elif explicit is not None:
+            value = self._convert(action, explicit)
+        else:
+            end = i
+            while end < len(args) and not args[end].startswith("-"):
+                end += 1
+            available = end - i
+            nargs = action.nargs
+            if nargs is None:
+                if not available:
+                    raise _GiveUp
+                value = self._convert(action, args[i])
+                i += 1
+            elif nargs == "?":
+                if available:
+                    value = self._convert(action, args[i])
+                    i += 1
+                else:
+                    value = action.const
+                    if isinstance(value, str):
+                        value = self._convert(action, value)
+            elif nargs == "*" or nargs == "+":
+                if nargs == "+" and not available:
+                    raise _GiveUp
+                value = [self._convert(action, v) for v in args[i:end]]
+                i = end
+            else:
+                count = int(nargs)
+                if available < count:
+                    raise _GiveUp
+                value = [self._convert(action, v) for v in args[i : i + count]]
+                i += count
+        namespace[action.dest] = value
+        seen.add(action.option_strings[0])
+        return i
+
+    @staticmethod
+    def _convert(action: FastAction, value: str, check: bool = True) -> object:
+        if action.type is not None:
+            try:
+                converted = action.type(value)
+            except (argparse.ArgumentTypeError, TypeError, ValueError):
+                raise _GiveUp
+        else:
+            converted = value
+        if check and action.choices is not None and converted not in action.choices:
+            raise _GiveUp
+        return converted
@@ -0,0 +1,143 @@
+import argparse
+from time import perf_counter
+from types import CoroutineType
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, NamedTuple, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+    FactoryExecutor = Executor
+    FactoryFuture = Future[object]
+else:
+    # concurrent.futures is only imported once an executor is used
+    FactoryExecutor = FactoryFuture = object
+
+from . import _timings  # pyright: ignore[reportPrivateUsage]
+from ._typing import assert_type
+
+
+class DeferredFactory(NamedTuple):
+    """A lazy default factory, to be called when its argument is first read."""
+
+    factory: Callable[[], object]
+
+
+# Default factory results still to be waited for, by attribute name: the coroutines of `async def`
+# factories, the futures of factories submitted to an executor, and the lazy factories not run at all
+PendingFactories = Dict[str, Union[Coroutine[Any, Any, object], FactoryFuture, DeferredFactory]]
+FactorySubmitter = Callable[[Callable[[], object]], FactoryFuture]
+NamespaceLoader = Callable[[argparse.Namespace, Dict[str, object], Optional[FactorySubmitter]], Optional[PendingFactories]]
+
+
+class LoaderField(NamedTuple):
+    """Everything the generated loader needs to know about one argument, resolved ahead of time."""
+
+    key: str
+    """The attribute name of the argument."""
+    attr: str
+    """The namespace attribute argparse stores the parsed value in."""
+    container: Optional[type]
+    """`list` or `tuple` if the value is returned as that container, otherwise None."""
+    checkable_type: Optional[type]
+    """The type every parsed (element) value is asserted to be, if any."""
+    default_factory_spec: Optional[object]
+    """The spec whose `default_factory` fills the value when nothing was parsed, if it has one."""
+    lazy: bool = False
+    """Whether the default factory is left for the first read of the value."""
+
+
+_MISSING = object()
+
+
+def generate_loader_source(
+    fields: Sequence[LoaderField], name: str = "load_namespace", subject: Optional[str] = None
+) -> str:
+    """Generates straight-line source of a function `name(namespace, values, submit=None)`.
+
+    The function stores the parsed value of every field into `values`, then fills the
+    missing ones from their default factories. The coroutines of `async def` factories are
+    returned by attribute name instead (None if there are none), for the caller to await
+    together. Given `submit` (an executor's), every factory is submitted to it and its
+    future returned the same way. Lazy factories are not called but returned wrapped in a
+    `DeferredFactory`. It refers to checkable types as `_t{i}` and specs as `_s{i}`, which
+    `loader_globals()` provides. The time spent in default factories is reported to the
+    timing hooks under `subject`."""
+    lines: List[str] = [f"def {name}(namespace, values, submit=None):", "    get = namespace.__dict__.get"]
+    for i, f in enumerate(fields):
+        lines.append(f"    v = get({f.attr!r}, _MISSING)")
+        lines.append("    if v is not _MISSING and v is not _SUPPRESS:")
+        if f.container is list:
+            lines.append("        if v is not None and not isinstance(v, list):")
+            lines.append("            v = [v]")
+        elif f.container is tuple:
+            lines.append("        if v is not None and not isinstance(v, tuple):")
+            lines.append("            v = tuple(v) if isinstance(v, list) else (v,)")
+        if f.checkable_type is not None:
+            if f.container is not None:
+                lines.append("        if v is not None:")
+                lines.append("            for e in v:")
+                lines.append(f"                _assert_type(e, _t{i})")
+            else:
+                lines.append("        if v is not None:")
+                lines.append(f"            _assert_type(v, _t{i})")
+        lines.append(f"        values[{f.key!r}] = v")
+    has_factories = any(f.default_factory_spec is not None for f in fields)
+    if has_factories:
+        lines.append("    pending = None")
+        lines.append("    started = _perf_counter() if _timings.enabled else None")
+    for i, f in enumerate(fields):
+        if f.default_factory_spec is None:
+            continue
+        lines.append(f"    if values.get({f.key!r}) is None:")
+        lines.append(f"        factory = _s{i}.default_factory")
+        lines.append("        if factory is not None:")
+        if f.lazy:
+            lines.append("            if pending is None:")
+            lines.append("                pending = {}")
+            lines.append(f"            pending[{f.key!r}] = _DeferredFactory(factory)")
+            continue
+        lines.append("            if submit is not None:")
+        lines.append("                v = submit(factory)")
+        lines.append("            else:")
+        lines.append("                v = factory()")
+        lines.append("            if submit is not None or type(v) is _CoroutineType:")
+        lines.append("                if pending is None:")
+        lines.append("                    pending = {}")
+        lines.append(f"                pending[{f.key!r}] = v")
+        lines.append("            else:")
+        lines.append(f"                values[{f.key!r}] = v")
+    if has_factories:
+        lines.append("    if started is not None:")
+        lines.append(f"        _timings.record('default_factories', started, {subject!r})")
+        lines.append("    return pending")
+    if len(lines) == 2:
+        lines.append("    pass")
+    return "\n".join(lines) + "\n"
+
+
+def loader_globals(fields: Sequence[LoaderField]) -> Dict[str, object]:
+    """The globals the source from `generate_loader_source()` needs."""
+    namespace: Dict[str, object] = {
+        "_MISSING": _MISSING,
+        "_CoroutineType": CoroutineType,
+        "_DeferredFactory": DeferredFactory,
+        "_SUPPRESS": argparse.SUPPRESS,
+        "_assert_type": assert_type,
+        "_perf_counter": perf_counter,
+        "_timings": _timings,
+    }
+    for i, f in enumerate(fields):
+        if f.checkable_type is not None:
+            namespace[f"_t{i}"] = f.checkable_type
+        if f.default_factory_spec is not None:
+            namespace[f"_s{i}"] = f.default_factory_spec
+    return namespace
+
+
+def compile_loader(
+    fields: Sequence[LoaderField], name: str = "load_namespace", subject: Optional[str] = None
+) -> NamespaceLoader:
+    """Compiles a namespace loader specialised for `fields`."""
+    namespace = loader_globals(fields)
+    exec(compile(generate_loader_source(fields, name, subject), f"<spargear loader {name}>", "exec"), namespace)
+    return namespace[name]  # pyright: ignore[reportReturnType]
@@ -0,0 +1,153 @@
+"""Default factories whose results are shared by every instance in the process.
+
+A factory wrapped by `shared_factory()` runs once; later calls return the cached result until it
+expires after `ttl` seconds, is evicted (the cache keeps the `maxsize` most recently used results)
+or is invalidated."""
+
+import threading
+from functools import update_wrapper
+from time import monotonic
+from types import CoroutineType
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Generic, NamedTuple, Optional, TypeVar, Union, cast, overload
+
+from ._cache import CacheInfo, LRUCache
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+T = TypeVar("T")
+
+
+class _SharedResult(NamedTuple):
+    value: object
+    expires: Optional[float]
+    """The `monotonic()` time the result expires at; None if it never does."""
+
+    def is_fresh(self) -> bool:
+        return self.expires is None or monotonic() < self.expires
+
+
+# Results by shared factory
+_results: "LRUCache[SharedFactory[Any], _SharedResult]" = LRUCache(maxsize=128)
+
+
+class _Evaluation:
+    """A run of an async factory, shared by the calls made until it completes."""
+
+    def __init__(self, coroutine: Coroutine[Any, Any, object]) -> None:
+        self.coroutine: Optional[Coroutine[Any, Any, object]] = coroutine
+        """The factory's coroutine, until the first awaiter takes it to run it."""
+        from concurrent.futures import Future
+
+        self.done: "Future[object]" = Future()
+        """Completed with the coroutine's outcome; the other awaiters wait for it, in whatever event loop they run."""
+
+
+class SharedFactory(Generic[T]):
+    """A default factory whose result is cached process-wide; see `shared_factory()`."""
+
+    def __init__(self, factory: Callable[[], T], ttl: Optional[float] = None) -> None:
+        if ttl is not None and ttl < 0:
+            raise ValueError(f"ttl must not be negative, got {ttl}")
+        self.factory = factory
+        self.ttl = ttl
+        """Seconds a result stays valid; None keeps it until it is evicted or invalidated."""
+        # Held while the result is computed, so that concurrent misses run the factory once
+        self._lock = threading.Lock()
+        self._evaluation: Optional[_Evaluation] = None
+        update_wrapper(self, factory)
+
+    def __call__(self) -> T:
+        if (result := _results.get(self, _SharedResult.is_fresh)) is not None:
+            return result.value  # pyright: ignore[reportReturnType]
+        with self._lock:
+            # Another thread may have run the factory while this one waited
+            if (result := _results.peek(self)) is not None and result.is_fresh():
+                return result.value  # pyright: ignore[reportReturnType]
+            if (evaluation := self._evaluation) is None:
+                value = self.factory()
+                if not isinstance(value, CoroutineType):
+                    return self._store(value)  # pyright: ignore[reportReturnType]
+                # An async factory: its result is cached once awaited, so a cached result needs no awaiting
+                # at all; until then, every call awaits the same run
+                evaluation = self._evaluation = _Evaluation(cast(Coroutine[Any, Any, object], value))
+            return self._await_evaluation(evaluation)  # pyright: ignore[reportReturnType]
+
+    async def _await_evaluation(self, evaluation: _Evaluation) -> object:
+        with self._lock:
+            # The first to be awaited runs the factory's coroutine
+            coroutine, evaluation.coroutine = evaluation.coroutine, None
+        if coroutine is None:
+            import asyncio
+
+            return await asyncio.wrap_future(evaluation.done)
+        try:
+            value = self._store(await coroutine)
+        except BaseException as e:
+            self._finish(evaluation)
+            evaluation.done.set_exception(e)
+            raise
+        self._finish(evaluation)
+        evaluation.done.set_result(value)
+        return value
+
+    def _finish(self, evaluation: _Evaluation) -> None:
+        with self._lock:
+            if self._evaluation is evaluation:
+                self._evaluation = None
+
+    def _store(self, value: object) -> object:
+        _results.put(self, _SharedResult(value, None if self.ttl is None else monotonic() + self.ttl))
+        return value
+
+    def invalidate(self) -> bool:
+        """Drops the cached result, so that the next call runs the factory again. Returns whether there was one."""
+        return invalidate_shared_factories(self) > 0
+
+    def __repr__(self) -> str:
+        return f"shared_factory({self.factory!r}, ttl={self.ttl!r})"
+
+
+@overload
+def shared_factory(factory: Callable[[], T], *, ttl: Optional[float] = None) -> SharedFactory[T]: ...
+@overload
+def shared_factory(
+    factory: None = None, *, ttl: Optional[float] = None
+) -> Callable[[Callable[[], T]], SharedFactory[T]]: ...
+def shared_factory(
+    factory: Optional[Callable[[], T]] = None, *, ttl: Optional[float] = None
+) -> Union[SharedFactory[T], Callable[[Callable[[], T]], SharedFactory[T]]]:
+    """Marks a default factory as shareable: its result is cached process-wide and returned to every instance.
+
+    Use it as `@shared_factory`, `@shared_factory(ttl=60)` or `shared_factory(load_credentials, ttl=60)`.
+    Every instance gets the same object, so mutable results should not be modified in place. Async
+    factories can be shared as well.
+
+    Args:
+        factory: The zero-argument factory.
+        ttl: Seconds a result stays valid. None keeps it until it is evicted or invalidated.
+    """
+    if factory is None:
+        return lambda factory: SharedFactory(factory, ttl)
+    return SharedFactory(factory, ttl)
+
+
+def invalidate_shared_factories(*factories: SharedFactory[Any]) -> int:
+    """Drops the cached results of `factories`, or of every shared factory if none are given.
+
+    Returns how many results were dropped."""
+    if not factories:
+        return _results.discard(lambda factory, result: True)
+    return _results.discard(lambda factory, result: any(factory is f for f in factories))
+
+
+def shared_factory_cache_info() -> CacheInfo:
+    """Returns hit/miss statistics of the shared factory results."""
+    return _results.info()
+
+
+def set_shared_factory_cache_maxsize(maxsize: Optional[int]) -> None:
+    """Bounds the number of cached results; the least recently used ones are evicted first.
+
+    None removes the bound."""
+    _results.maxsize = maxsize
@@ -0,0 +1,156 @@
+import atexit
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Dict, Generator, List, NamedTuple, Optional, TextIO, Tuple
+
+TIMINGS_ENV = "SPARGEAR_TIMINGS"
+"""Environment variable that, when set to a non-empty value other than "0", prints a timing summary to stderr at exit."""
+
+PHASES = (
+    "schema",
+    "docstrings",
+    "parser",
+    "parse_args",
+    "load_namespace",
+    "default_factories",
+    "subcommand_walk",
+    "execute",
+    "run",
+)
+"""The phases spargear reports, in the order they usually happen."""
+
+TimingHook = Callable[[str, float, Optional[str]], None]
+"""Called as `hook(phase, seconds, subject)`; the subject is usually the qualified name of the class involved."""
+
+enabled = False
+"""Whether any hook is registered. Instrumented code checks this before reading the clock."""
+_hooks: List[TimingHook] = []
+_lock = threading.Lock()
+
+
+def add_timing_hook(hook: TimingHook) -> None:
+    """Registers `hook` to be called with the duration of every phase spargear goes through."""
+    global enabled
+    with _lock:
+        _hooks.append(hook)
+        enabled = True
+
+
+def remove_timing_hook(hook: TimingHook) -> None:
+    """Unregisters a hook added with `add_timing_hook()`."""
+    global enabled
+    with _lock:
+        _hooks.remove(hook)
+        enabled = bool(_hooks)
+
+
+def record(phase: str, started: float, subject: object = None) -> None:
+    """Reports a phase that began at `started` (a `perf_counter()` value) and ends now."""
+    seconds = perf_counter() - started
+    name: Optional[str]
+    if subject is None or isinstance(subject, str):
+        name = subject
+    else:
+        name = getattr(subject, "__qualname__", None) or str(subject)
+    for hook in tuple(_hooks):
+        hook(phase, seconds, name)
+
+
+class Timing(NamedTuple):
+    phase: str
+    seconds: float
+    subject: Optional[str]
+
+
+class TimingStats:
+    """The durations recorded for one phase and subject."""
+
+    __slots__ = ("count", "total", "min", "max")
+
+    def __init__(self, seconds: float) -> None:
+        self.count = 1
+        self.total = self.min = self.max = seconds
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(count={self.count}, total={self.total}, min={self.min}, max={self.max})"
+
+
+class Timings:
+    """Durations collected by `record_timings()`.
+
+    Every duration is added to the statistics of its phase and subject; with `keep_records`, it is also kept
+    in `records`, which otherwise stays empty so that a long-running process collects a bounded amount."""
+
+    def __init__(self, keep_records: bool = True) -> None:
+        self.keep_records = keep_records
+        self.records: List[Timing] = []
+        self.stats: Dict[Tuple[str, Optional[str]], TimingStats] = {}
+
+    def __call__(self, phase: str, seconds: float, subject: Optional[str]) -> None:
+        if self.keep_records:
+            self.records.append(Timing(phase, seconds, subject))
+        if (stats := self.stats.get((phase, subject))) is None:
+            self.stats[(phase, subject)] = TimingStats(seconds)
+        else:
+            stats.add(seconds)
+
+    def totals(self) -> Dict[str, float]:
+        """Total seconds per phase. Phases nest (e.g. `default_factories` within `load_namespace`), so they don't add up."""
+        totals: Dict[str, float] = {}
+        for (phase, _), stats in self.stats.items():
+            totals[phase] = totals.get(phase, 0.0) + stats.total
+        return totals
+
+    def summary(self) -> str:
+        """A table of the count, total and maximum duration of every phase, and its slowest subject."""
+        rows: Dict[str, List[Tuple[Optional[str], TimingStats]]] = {}
+        for (phase, subject), stats in self.stats.items():
+            rows.setdefault(phase, []).append((subject, stats))
+        order = sorted(rows, key=lambda phase: PHASES.index(phase) if phase in PHASES else len(PHASES))
+        lines = [f"{'phase':<18}{'count':>7}{'total ms':>11}{'max ms':>10}  slowest"]
+        for phase in order:
+            subjects = rows[phase]
+            slowest, slowest_stats = max(subjects, key=lambda item: item[1].max)
+            count = sum(stats.count for _, stats in subjects)
+            total = sum(stats.total for _, stats in subjects)
+            lines.append(f"{phase:<18}{count:>7}{total * 1e3:>11.3f}{slowest_stats.max * 1e3:>10.3f}  {slowest or ''}")
+        return "\n".join(lines)
+
+
+@contextmanager
+def record_timings() -> Generator[Timings, None, None]:
+    """Collects the durations of the phases spargear goes through inside the `with` block.
+
+    Example:
+        with record_timings() as timings:
+            args = MyArguments()
+        print(timings.summary())
+    """
+    timings = Timings()
+    add_timing_hook(timings)
+    try:
+        yield timings
+    finally:
+        remove_timing_hook(timings)
+
+
+def _print_summary(timings: Timings, file: TextIO) -> None:
+    if timings.stats:
+        print(f"spargear timings:\n{timings.summary()}", file=file)
+
+
+if os.environ.get(TIMINGS_ENV, "") not in ("", "0"):
+    _env_timings = Timings(keep_records=False)
+    add_timing_hook(_env_timings)
+    atexit.register(lambda: _print_summary(_env_timings, sys.stderr))
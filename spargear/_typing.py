@@ -7,6 +7,7 @@ import textwrap
 import types
 from enum import Enum
 from functools import partial
+from importlib import import_module
 
 if sys.version_info < (3, 9):
     import typing_extensions as typing
@@ -160,6 +161,54 @@ def get_choices(
     return choices or None
 
 
+def get_own_annotations(cls: type) -> typing.Dict[str, object]:
+    """The annotations in the body of `cls` itself (not its bases), without evaluating them."""
+    if sys.version_info >= (3, 10):
+        # Python 3.10+ no longer falls back to a base's `__annotations__` when the class has none
+        return cls.__annotations__
+    return cls.__dict__.get("__annotations__", {})
+
+
+def get_own_annotation_names(cls: type) -> typing.List[str]:
+    """Names annotated in the body of `cls` itself (not its bases), without evaluating the annotations."""
+    return list(get_own_annotations(cls))
+
+
+def get_argument_type_hints(cls: type, base: type) -> typing.Dict[str, object]:
+    """Evaluates the type hints of `cls`, leaving out those annotated in the body of `base` (one of its bases)."""
+    excluded = get_own_annotations(base)
+    return {name: hint for name, hint in get_type_hints(cls, include_extras=True).items() if name not in excluded}
+
+
+def get_own_type_hints(cls: type, names: typing.Collection[str]) -> typing.Dict[str, object]:
+    """Evaluates the annotations of `names` in the body of `cls` itself as `get_type_hints(cls)` would, without
+    evaluating any other annotation of `cls` or its bases."""
+    annotations = {name: hint for name, hint in get_own_annotations(cls).items() if name in names}
+    if not annotations:
+        return {}
+    holder = type(cls.__name__, (), {"__annotations__": annotations, "__module__": cls.__module__})
+    module_namespace: typing.Dict[str, object] = getattr(sys.modules.get(cls.__module__), "__dict__", {})
+    # Module names shadow the class namespace, as in `get_type_hints()`
+    return get_type_hints(holder, globalns=dict(vars(cls)), localns=module_namespace, include_extras=True)
+
+
+def split_import_path(path: str) -> typing.Tuple[str, str]:
+    """Splits a "module:qualname" import path, raising ValueError if it isn't one."""
+    module_name, _, qualname = path.partition(":")
+    if not module_name or not qualname:
+        raise ValueError(f"Expected an import path of the form module:qualname, got {path!r}")
+    return module_name, qualname
+
+
+def import_object(path: str) -> object:
+    """Imports the object a "module:qualname" import path names."""
+    module_name, qualname = split_import_path(path)
+    obj: object = import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
 def extract_attr_docstrings(cls: typing.Type[object]) -> typing.Dict[str, str]:
     """
     Extracts docstrings from class attributes.
@@ -196,6 +245,62 @@ def extract_attr_docstrings(cls: typing.Type[object]) -> typing.Dict[str, str]:
         return {}
 
 
+class DeferredText:
+    """Text computed on first use, such as help texts taken from docstrings."""
+
+    __slots__ = ("_factory",)
+
+    def __init__(self, factory: typing.Callable[[], typing.Optional[str]]) -> None:
+        self._factory = factory
+
+    def resolve(self) -> typing.Optional[str]:
+        return self._factory()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._factory!r})"
+
+
+class ResolvedOnRead:
+    """Dataclass field descriptor that accepts a `DeferredText` and resolves it on first read.
+
+    The unresolved value stays available through `get_raw_text()`, so that it can be handed
+    to argparse without resolving it."""
+
+    def __init__(self, default: typing.Optional[str]) -> None:
+        self.default = default
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: object, objtype: typing.Optional[type] = None) -> typing.Optional[str]:
+        if obj is None:
+            return self.default
+        value = obj.__dict__.get(self.name, self.default)
+        if isinstance(value, DeferredText):
+            value = value.resolve()
+            obj.__dict__[self.name] = value
+        return value
+
+    def __set__(self, obj: object, value: typing.Union[typing.Optional[str], DeferredText]) -> None:
+        obj.__dict__[self.name] = value
+
+
+TextOrDeferred = typing.Union[str, DeferredText]
+
+
+def get_raw_text(obj: object, name: str) -> typing.Optional[TextOrDeferred]:
+    """Returns a `ResolvedOnRead` field of `obj` without resolving it."""
+    return obj.__dict__.get(name, getattr(type(obj), name, None))
+
+
+def resolve_text(text: typing.Optional[TextOrDeferred]) -> typing.Optional[str]:
+    """Resolves `text` if it is deferred."""
+    if isinstance(text, DeferredText):
+        return text.resolve()
+    return text
+
+
 def unwrap_callable(func: typing.Callable[..., object]) -> typing.Callable[..., object]:
     """
     Get the name of a callable.
@@ -1,12 +1,15 @@
 import argparse
-from dataclasses import dataclass, field
+from copy import copy
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from typing import (
+    Any,
     Callable,
     Dict,
     Generic,
+    Hashable,
     List,
     Literal,
-    NamedTuple,
     Optional,
     Sequence,
     Tuple,
@@ -14,17 +17,22 @@ from typing import (
     TypedDict,
     TypeVar,
     Union,
+    cast,
 )
 
+from ._cache import LRUCache
 from ._typing import (
     ACTION_TYPES_THAT_DONT_SUPPORT_TYPE_KWARG,
     SUPPRESS_LITERAL_TYPE,
     Action,
+    ResolvedOnRead,
+    TextOrDeferred,
     ensure_no_optional,
     get_args,
     get_arguments_of_container_types,
     get_choices,
     get_origin,
+    get_raw_text,
     get_type_of_element_of_container_types,
 )
 
@@ -38,7 +46,7 @@ class ArgumentKwargs(TypedDict, Generic[T]):
     default: Optional[Union[T, SUPPRESS_LITERAL_TYPE]]
     choices: Optional[Sequence[T]]
     required: Optional[bool]
-    help: Optional[str]
+    help: Optional[TextOrDeferred]
     metavar: Optional[str]
     version: Optional[str]
     type: Optional[Callable[[str], T]]
@@ -57,13 +65,14 @@ class ArgumentSpec(Generic[T]):
     default_factory: Optional[Callable[[], T]] = None
     choices: Optional[Sequence[T]] = None
     required: bool = False
-    help: str = ""
+    help: str = cast(str, ResolvedOnRead(""))  # May be given as a DeferredText, resolved on first read
     metavar: Optional[str] = None
     version: Optional[str] = None
     type: Optional[Callable[[str], T]] = None
     dest: Optional[str] = None
     value: Optional[T] = field(init=False, default=None)  # Parsed value stored here
     annotated: Tuple[object, ...] = ()
+    lazy: Optional[bool] = None  # Run `default_factory` on first read instead of at parse time; None follows the class
 
     def __post_init__(self) -> None:
         """Validate that default and default_factory are not both set."""
@@ -91,7 +100,7 @@ class ArgumentSpec(Generic[T]):
             "default": self.default,
             "choices": self.choices,
             "required": self.required,
-            "help": self.help,
+            "help": get_raw_text(self, "help"),  # Left unresolved until help is rendered
             "metavar": self.metavar,
             "version": self.version,
             "type": self.type,
@@ -109,73 +118,142 @@ class ArgumentSpec(Generic[T]):
             self.value = self.default_factory()
 
 
-class ArgumentSpecType(NamedTuple):
-    """Represents the type information extracted from ArgumentSpec type hints."""
+class ArgumentSpecView(ArgumentSpec[T]):
+    """An instance's view of a class-level ArgumentSpec.
 
-    type_no_optional_or_spec: object  # The T in ArgumentSpec[T]
-    is_specless_type: bool = False
+    The view shares every attribute with the class-level spec, except `value`, which lives in the
+    instance's value storage. Setting any other attribute first gives the view a private copy of
+    the spec, so the class-level spec is never modified through an instance."""
 
-    @classmethod
-    def from_type_hint(cls, type_hint: object):
-        """Extract type information from a type hint."""
-        type_no_spec: object = ensure_no_argspec(type_hint)  # pyright: ignore[reportPrivateUsage]
-        return cls(
-            type_no_optional_or_spec=ensure_no_optional(type_no_spec),
-            is_specless_type=type_hint is type_no_spec,
-        )
+    _spec: ArgumentSpec[T]
+    _values: Dict[str, object]
+    _key: str
+    _owned: bool
 
-    @property
-    def choices(self) -> Optional[Tuple[object, ...]]:
-        """Extract choices from Literal types."""
-        return get_choices(
-            type_no_optional_or_spec=self.type_no_optional_or_spec,
-            container_types=(list, tuple),
-        )
+    def __init__(self, spec: ArgumentSpec[T], values: Dict[str, object], key: str) -> None:  # pyright: ignore[reportMissingSuperCall]
+        object.__setattr__(self, "_spec", spec)
+        object.__setattr__(self, "_values", values)
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_owned", False)
 
     @property
-    def type(self) -> Optional[Type[object]]:
-        """Determine the appropriate type for the argument."""
-        t = get_type_of_element_of_container_types(
-            type_no_optional_or_spec=self.type_no_optional_or_spec,
-            container_types=(list, tuple),
-        )
-        if t is not None:
-            return t
-        if isinstance(self.type_no_optional_or_spec, type):
-            return self.type_no_optional_or_spec
-        return None
+    def value(self) -> Optional[T]:  # pyright: ignore[reportIncompatibleVariableOverride]
+        return cast(Optional[T], self._values.get(self._key, self._spec.value))
 
-    @property
-    def should_return_as_list(self) -> bool:
-        """Determines if the argument should be returned as a list."""
-        return (
-            get_arguments_of_container_types(
-                type_no_optional_or_spec=self.type_no_optional_or_spec,
-                container_types=(list,),
-            )
-            is not None
-        )
+    @value.setter
+    def value(self, value: Optional[T]) -> None:  # pyright: ignore[reportIncompatibleVariableOverride]
+        self._values[self._key] = value
 
     @property
-    def should_return_as_tuple(self) -> bool:
-        """Determines if the argument should be returned as a tuple."""
-        return (
-            get_arguments_of_container_types(
-                type_no_optional_or_spec=self.type_no_optional_or_spec,
-                container_types=(tuple,),
-            )
-            is not None
+    def detached(self) -> bool:
+        """Whether the view has its own copy of the spec, because an attribute other than `value` was set."""
+        return self._owned
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name == "value":
+            object.__setattr__(self, name, value)
+            return
+        if not self._owned:
+            # Copy on write: detach from the class-level spec before modifying it
+            object.__setattr__(self, "_spec", copy(self._spec))
+            object.__setattr__(self, "_owned", True)
+        setattr(self._spec, name, value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArgumentSpec):
+            return NotImplemented
+        other = cast(ArgumentSpec[object], other)
+        return all(getattr(self, f.name) == getattr(other, f.name) for f in fields(ArgumentSpec))
+
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+    def get_add_argument_kwargs(self) -> "ArgumentKwargs[T]":
+        return self._spec.get_add_argument_kwargs()
+
+
+def _delegate_spec_fields(view_class: Type[ArgumentSpecView[Any]]) -> None:
+    """Gives `view_class` a property for every ArgumentSpec field but `value`, reading it from the viewed spec.
+
+    Setting one goes through `ArgumentSpecView.__setattr__`, which detaches the view first."""
+
+    def make_property(name: str) -> property:
+        def fset(self: ArgumentSpecView[Any], value: object) -> None:
+            setattr(self, name, value)
+
+        return property(attrgetter(f"_spec.{name}"), fset, doc=f"`{name}` of the viewed ArgumentSpec.")
+
+    for spec_field in fields(ArgumentSpec):
+        if spec_field.name != "value":
+            setattr(view_class, spec_field.name, make_property(spec_field.name))
+
+
+_delegate_spec_fields(ArgumentSpecView)
+
+
+@dataclass(frozen=True)
+class ArgumentSpecType:
+    """Represents the type information extracted from ArgumentSpec type hints.
+
+    Everything derived from the type is computed once, when the instance is created. Use
+    `from_type_hint()`, which shares one instance between all identical type hints."""
+
+    type_no_optional_or_spec: object  # The T in ArgumentSpec[T]
+    is_specless_type: bool = False
+
+    choices: Optional[Tuple[object, ...]] = field(init=False, repr=False, compare=False)
+    """Choices extracted from Literal (or Enum) types."""
+    type: Optional[Type[object]] = field(init=False, repr=False, compare=False)
+    """The appropriate type for the argument (or its elements)."""
+    should_return_as_list: bool = field(init=False, repr=False, compare=False)
+    """Whether the argument should be returned as a list."""
+    should_return_as_tuple: bool = field(init=False, repr=False, compare=False)
+    """Whether the argument should be returned as a tuple."""
+    tuple_nargs: Optional[Union[int, Literal["+"]]] = field(init=False, repr=False, compare=False)
+    """The number of arguments for a tuple type."""
+
+    def __post_init__(self) -> None:
+        t = self.type_no_optional_or_spec
+        element_type = get_type_of_element_of_container_types(type_no_optional_or_spec=t, container_types=(list, tuple))
+        if element_type is None and isinstance(t, type):
+            element_type = t
+        should_return_as_tuple = get_arguments_of_container_types(type_no_optional_or_spec=t, container_types=(tuple,)) is not None
+        tuple_nargs: Optional[Union[int, Literal["+"]]] = None
+        if should_return_as_tuple and (args := get_args(t)):
+            tuple_nargs = len(args) if Ellipsis not in args else "+"
+
+        # Frozen dataclass: the derived fields are set once, here
+        object.__setattr__(self, "choices", get_choices(type_no_optional_or_spec=t, container_types=(list, tuple)))
+        object.__setattr__(self, "type", element_type)
+        object.__setattr__(
+            self,
+            "should_return_as_list",
+            get_arguments_of_container_types(type_no_optional_or_spec=t, container_types=(list,)) is not None,
         )
+        object.__setattr__(self, "should_return_as_tuple", should_return_as_tuple)
+        object.__setattr__(self, "tuple_nargs", tuple_nargs)
 
-    @property
-    def tuple_nargs(self) -> Optional[Union[int, Literal["+"]]]:
-        """Determine the number of arguments for a tuple type."""
-        if self.should_return_as_tuple and (args := get_args(self.type_no_optional_or_spec)):
-            if Ellipsis not in args:
-                return len(args)
-            else:
-                return "+"
-        return None
+    @classmethod
+    def from_type_hint(cls, type_hint: object) -> "ArgumentSpecType":
+        """Extract type information from a type hint.
+
+        Identical hints share one (immutable) instance per process; unhashable hints are analysed every time."""
+        key = _hint_key(type_hint)
+        try:
+            if (cached := _spec_types.get(key)) is not None:
+                return cached
+        except TypeError:  # e.g. Annotated metadata that isn't hashable
+            return cls._analyse(type_hint)
+        spec_type = cls._analyse(type_hint)
+        _spec_types.put(key, spec_type)
+        return spec_type
+
+    @classmethod
+    def _analyse(cls, type_hint: object) -> "ArgumentSpecType":
+        type_no_spec: object = ensure_no_argspec(type_hint)
+        return cls(
+            type_no_optional_or_spec=ensure_no_optional(type_no_spec),
+            is_specless_type=type_hint is type_no_spec,
+        )
 
     @property
     def basic_info(self) -> Dict[str, object]:
@@ -191,6 +269,20 @@ class ArgumentSpecType(NamedTuple):
         }
 
 
+# Hash-consed analyses, keyed by `_hint_key()` of the type hint
+_spec_types: "LRUCache[Hashable, ArgumentSpecType]" = LRUCache(maxsize=1024)
+
+
+def _hint_key(type_hint: object) -> Hashable:
+    """A cache key for `type_hint` that, unlike the hint, tells apart the orders of its arguments.
+
+    `Literal["x", "y"] == Literal["y", "x"]` (and likewise for Union), but the declared order is that of
+    the choices shown in help."""
+    if not (args := get_args(type_hint)):
+        return type_hint
+    return (type_hint, tuple(_hint_key(arg) for arg in args))
+
+
 def ensure_no_argspec(t: object) -> object:
     """Unwraps the ArgumentSpec type to get the actual type."""
     if (
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from time import perf_counter
 from typing import Generic, Protocol, Type, TypeVar, cast, runtime_checkable
 
+from . import _timings  # pyright: ignore[reportPrivateUsage]
 from .base import BaseArguments
 
 T = TypeVar("T", covariant=True)
@@ -18,7 +20,23 @@ class RunnableArguments(BaseArguments, ABC, Runnable[T]):
 
 class SubcommandArguments(BaseArguments):
     def execute(self) -> None:
+        if not _timings.enabled:
+            return self.__execute()
+        started = perf_counter()
+        try:
+            self.__execute()
+        finally:
+            _timings.record("execute", started, self.__class__)
+
+    def __execute(self) -> None:
         if (subcommand := self.ok(cast(Type[RunnableArguments[object]], RunnableArguments))) is not None:
-            subcommand.run()
+            if not _timings.enabled:
+                subcommand.run()
+                return
+            started = perf_counter()
+            try:
+                subcommand.run()
+            finally:
+                _timings.record("run", started, subcommand.__class__)
         else:
-            self.get_parser().print_help()
+            self._get_parser_for_argv([]).print_help()
@@ -2,23 +2,38 @@ import argparse
 import inspect
 import json
 import logging
+import os
 import pickle
-from copy import deepcopy
+import sys
+import threading
+import weakref
+from collections import deque
+from contextvars import ContextVar
 from dataclasses import field, make_dataclass
 from enum import Enum
+from functools import partial
+from itertools import islice
 from pathlib import Path
+from time import perf_counter
 from traceback import print_exc
+from types import CoroutineType
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Coroutine,
+    Deque,
     Dict,
     Iterable,
     Iterator,
     List,
     Literal,
+    Mapping,
+    NamedTuple,
+    NoReturn,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -27,21 +42,61 @@ from typing import (
     overload,
 )
 
+from . import _timings  # pyright: ignore[reportPrivateUsage]
+from ._binary import HEADER, BinaryCodec, BinaryField, field_kind, read_text, write_text
+from ._cache import CacheInfo, LRUCache
+from ._config import (
+    ConfigFormat,
+    ConfigLayer,
+    ConfigSource,
+    build_env_index,
+    coerce_string,
+    coerce_value,
+    config_layer,
+    env_layer,
+    infer_config_format,
+    nested_layers,
+    take_layer_value,
+)
+from ._compiled import get_compiled_class, invalidate_compiled_schemas
+from ._docstrings import get_attr_docstrings
+from ._fastparse import FastAction, FastParser, make_fast_action
+from ._loader import (
+    DeferredFactory,
+    FactoryExecutor,
+    FactoryFuture,
+    FactorySubmitter,
+    LoaderField,
+    NamespaceLoader,
+    PendingFactories,
+    compile_loader,
+)
 from ._typing import (
+    ACTION_TYPES_THAT_DONT_SUPPORT_TYPE_KWARG,
     Action,
     Annotated,
-    assert_type,
-    extract_attr_docstrings,
+    DeferredText,
+    TextOrDeferred,
     get_args,
     get_arguments_of_container_types,
     get_origin,
+    get_own_annotation_names,
+    get_own_annotations,
+    get_own_type_hints,
+    get_raw_text,
     get_type_hints,
     get_type_of_element_of_container_types,
     is_optional,
+    resolve_text,
     sanitize_flag,
 )
-from .argspec import ArgumentKwargs, ArgumentSpec, ArgumentSpecType, ensure_no_optional
-from .subcommand import SubcommandSpec
+from .argspec import ArgumentKwargs, ArgumentSpec, ArgumentSpecType, ArgumentSpecView, ensure_no_optional
+from .computed import ComputedPlans, resolve_computed_fields
+from .subcommand import SubcommandSpec, get_factory_generation, invalidate_subcommand_factories
+
+if TYPE_CHECKING:
+    from _typeshed import SupportsWrite
+    from concurrent.futures import Future
 
 S = TypeVar("S", bound="BaseArguments")
 T = TypeVar("T")
@@ -50,13 +105,246 @@ logger = logging.getLogger(__name__)
 SubcommandLike = Union[Type[S], SubcommandSpec[S]]
 
 
+class _CompiledParser(NamedTuple):
+    """A built parser together with the subcommand classes that were resolved to build it."""
+
+    parser: argparse.ArgumentParser
+    dependencies: Tuple[Tuple[SubcommandSpec["BaseArguments"], type], ...]
+
+    def is_current(self) -> bool:
+        """Whether every subcommand spec still resolves to the class the parser was built from."""
+        for spec, argument_class in self.dependencies:
+            try:
+                if spec.get_argument_class() is not argument_class:
+                    return False
+            except Exception:
+                return False
+        return True
+
+
+class _DeferredHelpFormatterMixin(argparse.HelpFormatter):
+    """Resolves deferred help texts and descriptions when they are rendered."""
+
+    def add_text(self, text: Optional[str]) -> None:
+        super().add_text(resolve_text(text))
+
+    def _format_action(self, action: argparse.Action) -> str:
+        if isinstance(action.help, DeferredText):
+            action.help = action.help.resolve()
+        return super()._format_action(action)
+
+
+class _HelpFormatter(_DeferredHelpFormatterMixin, argparse.HelpFormatter):
+    pass
+
+
+class _ArgumentDefaultsHelpFormatter(_DeferredHelpFormatterMixin, argparse.ArgumentDefaultsHelpFormatter):
+    pass
+
+
+class ParseError(Exception):
+    """A command line that could not be parsed, as yielded by `BaseArguments.parse_many()`."""
+
+    def __init__(
+        self,
+        message: str,
+        argv: Optional[Sequence[str]] = None,
+        index: Optional[int] = None,
+        status: int = 2,
+        prog: Optional[str] = None,
+    ) -> None:
+        super().__init__(message)
+        self.message = message
+        """The error message argparse would have printed (without the usage line)."""
+        self.argv: Optional[List[str]] = list(argv) if argv is not None else None
+        """The command line that failed."""
+        self.index = index
+        """The position of the command line in the batch."""
+        self.status = status
+        """The exit status argparse would have exited with; 0 for `--help`."""
+        self.prog = prog
+        """The program name of the (sub)parser that reported the error."""
+
+    def __reduce__(self) -> Tuple[Any, Tuple[object, ...]]:
+        return (ParseError, (self.message, self.argv, self.index, self.status, self.prog))
+
+
+class DefaultFactoryError(Exception):
+    """An `async def` default factory that raised, attributed to the argument it was filling."""
+
+    def __init__(self, message: str, owner: Optional[str] = None, field: Optional[str] = None) -> None:
+        super().__init__(message)
+        self.message = message
+        self.owner = owner
+        """The name of the argument class declaring the argument."""
+        self.field = field
+        """The attribute name of the argument."""
+
+    def __reduce__(self) -> Tuple[Any, Tuple[object, ...]]:
+        return (DefaultFactoryError, (self.message, self.owner, self.field))
+
+
+# When set, parsers raise ParseError instead of printing to the terminal and exiting
+_raise_parse_errors: ContextVar[bool] = ContextVar("spargear_raise_parse_errors", default=False)
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """The parser class of every parser built by spargear."""
+
+    def __init__(self, *args: Any, formatter_class: Type[argparse.HelpFormatter] = _HelpFormatter, **kwargs: Any):
+        super().__init__(*args, formatter_class=formatter_class, **kwargs)
+
+    def _check_help(self, action: argparse.Action) -> None:
+        # Newer Pythons render help strings eagerly to validate them; deferred ones are validated when rendered
+        if isinstance(action.help, DeferredText):
+            return
+        check_help: Optional[Callable[[argparse.Action], None]] = getattr(super(), "_check_help", None)
+        if check_help is not None:
+            check_help(action)
+
+    def error(self, message: str) -> NoReturn:
+        if _raise_parse_errors.get():
+            raise ParseError(message, prog=self.prog)
+        super().error(message)
+
+    def exit(self, status: int = 0, message: Optional[str] = None) -> NoReturn:
+        if _raise_parse_errors.get():
+            # --help, --version or an action calling parser.exit()
+            raise ParseError((message or "").strip(), status=status, prog=self.prog)
+        super().exit(status, message)
+
+    def _print_message(self, message: str, file: Optional["SupportsWrite[str]"] = None) -> None:
+        if _raise_parse_errors.get():
+            return
+        super()._print_message(message, file)
+
+
+_MISSING = object()
+
+
+class _ArgumentAttribute:
+    """Data descriptor giving instances access to the value (or instance-specific spec) of one argument.
+
+    On the class itself, it returns what the class attribute was before the descriptor replaced it."""
+
+    __slots__ = ("key", "spec", "is_specless_type", "class_value")
+
+    def __init__(self, key: str, spec: ArgumentSpec[object], is_specless_type: bool, class_value: object) -> None:
+        self.key = key
+        self.spec = spec
+        self.is_specless_type = is_specless_type
+        self.class_value = class_value
+
+    def __get__(self, obj: Optional["BaseArguments"], objtype: Optional[type] = None) -> object:
+        if obj is None:
+            if self.class_value is _MISSING:
+                raise AttributeError(f"type object {objtype.__name__ if objtype else '?'!r} has no attribute {self.key!r}")
+            return self.class_value
+
+        # For specless types, return the actual value if it exists
+        if self.is_specless_type:
+            return obj.__dict__["__instance_values__"].get(self.key, self.spec.default)
+
+        # For ArgumentSpec types, return the instance's view of the spec
+        instance_specs: Dict[str, ArgumentSpec[object]] = obj.__dict__["__instance_specs__"]
+        if (instance_spec := instance_specs.get(self.key)) is None:
+            # Views are cheap: they share the class-level spec until an attribute other than `value` is set
+            instance_spec = instance_specs[self.key] = ArgumentSpecView(self.spec, obj.__dict__["__instance_values__"], self.key)
+        return instance_spec
+
+    def __set__(self, obj: "BaseArguments", value: object) -> None:
+        # Values of both kinds live in the value storage; spec views read `value` from there
+        obj.__dict__["__instance_values__"][self.key] = value
+
+
+_ACCUMULATING_ACTIONS = ("append", "append_const", "extend", "count")
+
+
+class _LayerDefault:
+    """The default of an argument in a parser for layered loading.
+
+    Values argparse filled in with it can be told from those given on the command line, while help still
+    shows the real default."""
+
+    __slots__ = ("value", "convert")
+
+    def __init__(self, value: object, convert: Optional[Callable[[str], object]] = None) -> None:
+        self.value = value
+        self.convert = convert
+        """The argument's type, applied to a string default when it is used, as argparse would."""
+
+    def resolve(self) -> object:
+        if self.convert is not None and isinstance(self.value, str):
+            return self.convert(self.value)
+        return self.value
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+    def __repr__(self) -> str:
+        return repr(self.value)
+
+
+class _LayerValueError(ValueError):
+    """Raised for a value from a layer other than the command line that can't be converted."""
+
+
+class _UnselectedSubcommand(Exception):
+    """Raised when argparse walks into a subcommand that the argv pre-scan did not select."""
+
+
+class _LazySubcommandParser(_ArgumentParser):
+    """Subparser used by lazily built parsers; placeholders of unselected subcommands refuse to parse."""
+
+    unselected: bool = False
+
+    def parse_known_args(self, args: Optional[Sequence[str]] = None, namespace: Optional[argparse.Namespace] = None):  # pyright: ignore[reportIncompatibleMethodOverride]
+        if self.unselected:
+            raise _UnselectedSubcommand(self.prog)
+        return super().parse_known_args(args, namespace)
+
+
+# Compiled parsers, keyed by (argument class, parser variant)
+_parser_cache: "LRUCache[Tuple[type, object], _CompiledParser]" = LRUCache(maxsize=256)
+# Fast parse engine tables by argument class; None marks classes the engine cannot parse
+_fast_parsers: "weakref.WeakKeyDictionary[type, Optional[FastParser]]" = weakref.WeakKeyDictionary()
+# Classes by (module, qualname), used to notice when a class is redefined (e.g. module reload)
+_defined_classes: Dict[Tuple[str, str], "weakref.ReferenceType[type]"] = {}
+
+
 class BaseArguments:
     """Base class for defining arguments declaratively using ArgumentSpec."""
 
     __arguments__: Dict[str, Tuple[ArgumentSpec[object], ArgumentSpecType]]
     __subcommands__: Dict[str, SubcommandSpec["BaseArguments"]]
+    __computed__: ComputedPlans = {}
     __subcommand: Optional["BaseArguments"] = None
 
+    __namespace_loader__: Optional[NamespaceLoader] = None
+    __binary_codec__: Optional[BinaryCodec] = None
+    __uses_lazy_subcommands__: Optional[Tuple[int, bool]] = None
+    __lazy_subcommands__: Optional[bool] = None
+    """Build subparsers only along the subcommand path selected by argv, without touching the other factories.
+
+    None (the default) turns it on when a subcommand in the tree is given by import path."""
+    __parse_engine__: Literal["argparse", "fast"] = "argparse"
+    """With "fast", command lines using only common argparse features are parsed without argparse.
+    Anything else (help, errors, unsupported features) is still parsed by argparse, with identical results."""
+    __default_factory_executor__: Union[bool, FactoryExecutor] = False
+    """Run the default factories that need to run in an executor, concurrently instead of one after another.
+
+    True shares one thread pool between all classes; an `Executor` is used as given. As before, a factory
+    only runs when the command line gave no value for its argument."""
+    __lazy_default_factories__: bool = False
+    """Call default factories when their argument is first read on the instance, rather than at parse time.
+
+    `ArgumentSpec(lazy=...)` decides for a single argument."""
+    __env_prefix__: Optional[str] = None
+    """Read every argument from the environment variable `<prefix><NAME>`, e.g. `APP_PORT` for `port` with the
+    prefix "APP_". `Annotated[..., Env("NAME")]` names the variable of a single argument."""
+    __env_index__: Dict[str, str] = {}
+    """The argument names by the environment variable they are read from, built when the class is created."""
+
     @property
     def last_subcommand(self) -> Optional["BaseArguments"]:
         return self.__subcommand
@@ -97,176 +385,310 @@ class BaseArguments:
 
         # only load at root (내부 생성이 아닌 경우)
         if not _internal_init:
-            cls = self.__class__
-            parser = cls.get_parser()
             try:
-                parsed_args = parser.parse_args(args)
-            except SystemExit:
-                raise
-
-            # load this class's own specs
-            self.__load_from_namespace(parsed_args)
-
-            # now walk down through any subcommands
-            current_cls = cls
-            current_inst: Optional["BaseArguments"] = None
-            depth = 0
-            while current_cls._has_subcommands():
-                # 각 레벨에 맞는 dest 이름 사용
-                if depth == 0:
-                    dest_name = "subcommand"
-                else:
-                    dest_name = f"subcommand_depth_{depth}"
-
-                subname = getattr(parsed_args, dest_name, None)
-                if not subname:
-                    break
+                self.__load_parsed(self.__class__.__parse_args(args))
+            except _LayerValueError as e:
+                self.__class__._get_parser_for_argv(args).error(str(e))
 
-                subc = current_cls.__subcommands__.get(subname)
-                if not subc:
-                    break
+    @classmethod
+    async def aparse(cls: Type[S], args: Optional[Sequence[str]] = None) -> S:
+        """Like `cls(args)`, but awaits the `async def` default factories in the running event loop.
+
+        All of them, including those of the selected subcommands, run concurrently. One that raises
+        is reported as a `DefaultFactoryError` naming its argument."""
+        instance = cls(args=None, _internal_init=True)
+        try:
+            pending = instance.__load_parsed_values(cls.__parse_args(args))
+        except _LayerValueError as e:
+            cls._get_parser_for_argv(args).error(str(e))
+        if pending:
+            await _gather_default_factories(pending, cls)
+        return instance
 
-                try:
-                    argument_class = subc.get_argument_class()
-                except Exception:
-                    break
+    @classmethod
+    def load_layers(
+        cls: Type[S],
+        args: Optional[Sequence[str]] = None,
+        configs: Sequence[ConfigSource] = (),
+        env: Optional[Mapping[str, str]] = None,
+    ) -> S:
+        """Loads the arguments from several sources, in increasing order of precedence:
+        defaults < configuration files (in the order given) < environment < command line.
 
-                # Create subcommand instance with internal flag
-                inst = argument_class(args=None, _internal_init=True)
-                # Load values from parsed args
-                inst.__load_from_namespace(parsed_args)
-                current_inst = inst
-                current_cls = argument_class
-                depth += 1
-            self.__subcommand = current_inst
+        The command line is parsed once; a value given there wins even when it equals the default.
+        Values of a subcommand's arguments are nested under the subcommand's name in the other
+        sources. `get_value_source()` tells which layer supplied each value.
 
-    def __str__(self) -> str:
-        """String representation of the BaseArguments instance."""
-        return f"{self.__class__.__name__}({self.to_json(indent=2)})"
+        Args:
+            args: The command line; `sys.argv[1:]` if None.
+            configs: JSON, TOML or INI (.ini/.cfg) configuration files, or mappings of values by argument name.
+                Files are parsed once and reused until they change; values read as text (INI) are
+                converted like command-line values.
+            env: The environment variables to read the arguments declared by `__env_prefix__` or `Env`
+                from; `os.environ` if None. They are converted like command-line values.
+        """
+        return cls.__load_from_layers(args, [config_layer(source) for source in configs], env)
 
-    def __getitem__(self, key: str) -> Optional[object]:
-        return self.__instance_values__.get(key, self.__class__.__arguments__[key][0].value)
+    @classmethod
+    def __load_from_layers(
+        cls: Type[S],
+        args: Optional[Sequence[str]],
+        layers: Sequence[ConfigLayer],
+        environ: Optional[Mapping[str, str]] = None,
+    ) -> S:
+        if environ is None:
+            environ = os.environ
+        if args is None:
+            args = sys.argv[1:]
+        started = perf_counter() if _timings.enabled else None
+        path = cls.__prescan_subcommand_path(args) if cls._uses_lazy_subcommands() else None
+        parser = cls.__get_compiled_parser(path, layered=True)
+        try:
+            parsed_args = parser.parse_args(args)
+        except _UnselectedSubcommand:
+            parser = cls.__get_compiled_parser(None, layered=True)
+            parsed_args = parser.parse_args(args)
+        if started is not None:
+            _timings.record("parse_args", started, cls)
+
+        instance = cls(args=None, _internal_init=True)
+        try:
+            pending = instance.__load_parsed_values(parsed_args, layers, environ)
+        except _LayerValueError as e:
+            parser.error(str(e))
+        if pending:
+            _run_default_factories(pending, cls)
+        return instance
 
-    def __setattr__(self, name: str, value: object) -> None:
-        """Override attribute setting to store values in instance-specific storage."""
-        if name not in self.__arguments__:
-            # If the attribute is not an argument, use normal setattr
-            super().__setattr__(name, value)
-            return
+    def __load_parsed(self, parsed_args: argparse.Namespace) -> None:
+        """Loads the values of this class and of the selected subcommands from the parsed namespace.
 
-        spec, spec_type = self.__arguments__[name]
-        if spec_type.is_specless_type:
-            # If it's a specless type, store the value directly
-            self.__instance_values__[name] = value
-            return
+        `async def` default factories are run to completion with `asyncio.run()`."""
+        if pending := self.__load_parsed_values(parsed_args):
+            _run_default_factories(pending, self.__class__)
 
-        # For ArgumentSpec types, assign the value to the instance-specific spec
-        instance_specs = self.__instance_specs__
-        if name in self.__instance_specs__:
-            # If the spec exists in instance_specs, update its value
-            instance_specs[name].value = value
-        else:
-            # Create a new instance copy of the spec if it doesn't exist
-            instance_spec: ArgumentSpec[object] = deepcopy(spec)
-            instance_spec.value = value
-            instance_specs[name] = instance_spec
-
-    def __getattribute__(self, name: str) -> object:
-        """Override attribute access to return instance-specific ArgumentSpec objects or values."""
-        # For special attributes, use normal access
-        if TYPE_CHECKING:
-            arguments = self.__arguments__
-        else:
-            arguments = super().__getattribute__("__arguments__")
+    def __load_parsed_values(
+        self,
+        parsed_args: argparse.Namespace,
+        layers: Optional[Sequence[ConfigLayer]] = None,
+        environ: Optional[Mapping[str, str]] = None,
+    ) -> List[Tuple["BaseArguments", PendingFactories]]:
+        """Does the work of `__load_parsed()`, returning the coroutines of async default factories by instance.
+
+        Given `layers`, `parsed_args` comes from the layered parser and the values it lacks are taken from them,
+        or from `environ` (`os.environ` if None). Without them, only the classes reading the environment take
+        values from it, their arguments having been parsed as layered. Raises `_LayerValueError` for an invalid
+        value from another layer, or for a required option no layer supplied."""
+        if environ is None:
+            environ = os.environ
+        pending: List[Tuple[BaseArguments, PendingFactories]] = []
+        merged: List[BaseArguments] = []
+        # load this class's own specs
+        namespace = parsed_args
+        if layers is not None or self.__env_index__:
+            namespace = self.__merge_layers(parsed_args, layers or (), environ)
+            merged.append(self)
+        if coroutines := self.__load_from_namespace(namespace):
+            pending.append((self, coroutines))
+
+        # now walk down through any subcommands
+        started = perf_counter() if _timings.enabled else None
+        current_cls = self.__class__
+        current_inst: Optional["BaseArguments"] = None
+        depth = 0
+        while current_cls._has_subcommands():
+            # 각 레벨에 맞는 dest 이름 사용
+            if depth == 0:
+                dest_name = "subcommand"
+            else:
+                dest_name = f"subcommand_depth_{depth}"
 
-        if name not in arguments:
-            return super().__getattribute__(name)
+            subname = getattr(parsed_args, dest_name, None)
+            if not subname:
+                break
 
-        if TYPE_CHECKING:
-            instance_values = self.__instance_values__
-            instance_specs = self.__instance_specs__
-        else:
-            instance_values = super().__getattribute__("__instance_values__")
-            instance_specs = super().__getattribute__("__instance_specs__")
+            subc = current_cls.__subcommands__.get(subname)
+            if not subc:
+                break
 
-        spec, spec_type = arguments[name]
+            try:
+                argument_class = subc.get_argument_class()
+            except Exception:
+                if subc.import_path is not None:
+                    raise  # A selected subcommand whose module can't be imported is a configuration error
+                break
+
+            # Create subcommand instance with internal flag
+            inst = argument_class(args=None, _internal_init=True)
+            # Load values from parsed args
+            namespace = parsed_args
+            if layers is not None:
+                # A subcommand's values are nested under its name in every layer
+                layers = nested_layers(layers, subname)
+            if layers is not None or inst.__env_index__:
+                namespace = inst.__merge_layers(parsed_args, layers or (), environ)
+                merged.append(inst)
+            if coroutines := inst.__load_from_namespace(namespace):
+                pending.append((inst, coroutines))
+            current_inst = inst
+            current_cls = argument_class
+            depth += 1
+        self.__subcommand = current_inst
+        if started is not None:
+            _timings.record("subcommand_walk", started, self.__class__)
+        # Options are only known to be missing once every layer has been looked at
+        missing = [
+            "/".join(spec.name_or_flags)
+            for inst in merged
+            for key, spec, _ in inst.__class__.__iter_arguments()
+            if spec.required
+            and inst.get_value_source(key) == "default"
+            and any(name.startswith("-") for name in spec.name_or_flags)
+        ]
+        if missing:
+            for _, factories in pending:
+                for result in factories.values():
+                    if isinstance(result, CoroutineType):
+                        result.close()
+            raise _LayerValueError(f"the following arguments are required: {', '.join(missing)}")
+        return pending
 
-        # For specless types, return the actual value if it exists
-        if spec_type.is_specless_type:
-            if name in instance_values:
-                # If the value is already set in instance_values, return it
-                return instance_values[name]
-            return spec.default
-
-        # For ArgumentSpec types, return the instance-specific spec
-        if name in instance_specs:
-            # If the spec exists in instance_specs, return it
-            return instance_specs[name]
-
-        # Create a new instance copy of the spec if it doesn't exist
-        instance_spec: ArgumentSpec[object] = deepcopy(spec)
-        instance_specs[name] = instance_spec
-        return instance_spec
+    def __str__(self) -> str:
+        """String representation of the BaseArguments instance."""
+        return f"{self.__class__.__name__}({self.to_json(indent=2)})"
+
+    def __getitem__(self, key: str) -> Optional[object]:
+        return self.__instance_values__.get(key, self.__class__.__arguments__[key][0].value)
+
+    def __getstate__(self) -> Dict[str, object]:
+        # Views that still share the class-level spec are recreated on access; pickling them would drag the
+        # class-level spec (and its default factories) along
+        state = self.__dict__.copy()
+        state.pop("__computed_values__", None)
+        if isinstance(values := self.__instance_values__, _LazyValues):
+            state["__instance_values__"] = values.evaluated()
+        state["__instance_specs__"] = {
+            key: spec
+            for key, spec in self.__instance_specs__.items()
+            if not isinstance(spec, ArgumentSpecView) or spec.detached
+        }
+        return state
 
     def __init_subclass__(cls, **kwargs: object) -> None:
+        started = perf_counter() if _timings.enabled else None
         super().__init_subclass__(**kwargs)
         cls.__arguments__ = {}
         cls.__subcommands__ = {}
 
+        # A redefined class makes every parser (and factory result) that may refer to the old one stale
+        if "<locals>" not in cls.__qualname__:
+            class_key = (cls.__module__, cls.__qualname__)
+            if (previous := _defined_classes.get(class_key)) is not None and previous() is not None:
+                BaseArguments.invalidate_parser_cache()
+                invalidate_subcommand_factories()
+                invalidate_compiled_schemas()
+            _defined_classes[class_key] = weakref.ref(cls)
+
+        # Start from the already-built schemas of the bases instead of re-analysing every ancestor
+        bases = [base for base in cls.__bases__ if issubclass(base, BaseArguments) and base is not BaseArguments]
+        if len(bases) == 1:
+            cls.__arguments__.update(bases[0].__arguments__)
+            cls.__subcommands__.update(bases[0].__subcommands__)
+        elif bases:
+            # Multiple inheritance: take every argument from the first class in the MRO that defines it
+            for base in reversed(cls.__mro__[1:]):
+                if not issubclass(base, BaseArguments) or base is BaseArguments:
+                    continue
+                for attr_name, entry in base.__arguments__.items():
+                    if isinstance(base.__dict__.get(attr_name), _ArgumentAttribute):
+                        cls.__arguments__[attr_name] = entry
+        covered: Set[type] = {c for base in cls.__bases__ if issubclass(base, BaseArguments) for c in base.__mro__}
+
+        # Only the classes no base has analysed (this class and any plain mixins) are processed
+        names_to_process: Set[str] = set()
         for current_cls in reversed(cls.__mro__):
-            if current_cls in (object, BaseArguments):
+            if len(bases) > 1 or current_cls not in covered:
+                # Subcommands
+                for attr_value in vars(current_cls).values():
+                    if isinstance(attr_value, SubcommandSpec):
+                        attr_value = cast(SubcommandSpec["BaseArguments"], attr_value)
+                        cls.__subcommands__[attr_value.name] = attr_value
+            if current_cls not in covered:
+                # Arguments annotated here, and inherited arguments whose value is reassigned here
+                names_to_process.update(get_own_annotation_names(current_cls))
+                names_to_process.update(name for name in vars(current_cls) if name in cls.__arguments__)
+
+        # ArgumentSpecs
+        for attr_name, attr_hint in _get_type_hints_of(cls, names_to_process) if names_to_process else ():
+            attr_value: Optional[object] = getattr(cls, attr_name, None)
+            if isinstance(attr_value, ArgumentSpec):
+                spec: ArgumentSpec[object] = cast(ArgumentSpec[object], attr_value)
+            else:
+                spec, attr_hint = _infer_spec_and_correct_typehint_from_nonspec_typehint(
+                    attr_name=attr_name,
+                    type_no_spec=attr_hint,
+                    attr_value=attr_value,
+                    help=DeferredText(partial(_get_attr_help, cls, attr_name)),
+                )
+
+            if attr_name in cls.__arguments__:
+                logger.debug(f"Duplicate argument name '{attr_name}' in {cls.__name__}.")
+
+            try:
+                # Extract type information from type hint
+                spec_type: ArgumentSpecType = ArgumentSpecType.from_type_hint(attr_hint)
+
+                # Set `choices` and `type`
+                if detected_choices := spec_type.choices:
+                    spec.choices = detected_choices
+                if spec.type is None and (detected_type := spec_type.type):
+                    if isinstance(detected_type, type(Enum)):
+                        spec.type = detected_type.__getitem__
+                    else:
+                        spec.type = detected_type
+
+                # Determine `nargs` depending on list/tuple type
+                if tn := spec_type.tuple_nargs:
+                    spec.nargs = tn
+                elif spec.nargs is None and spec_type.should_return_as_list or spec_type.should_return_as_tuple:
+                    spec.nargs = "*"
+
+                cls.__arguments__[attr_name] = (spec, spec_type)
+            except Exception as e:
+                print_exc()
+                logger.warning(f"Error processing {attr_name} in {cls.__name__}: {e}")
                 continue
-            # Subcommands
-            for attr_value in vars(current_cls).values():
-                if isinstance(attr_value, SubcommandSpec):
-                    attr_value = cast(SubcommandSpec["BaseArguments"], attr_value)
-                    cls.__subcommands__[attr_value.name] = attr_value
-
-            # ArgumentSpecs
-            docstrings: Dict[str, str] = extract_attr_docstrings(current_cls)
-            for attr_name, attr_hint in _get_type_hints(current_cls):
-                attr_value: Optional[object] = getattr(current_cls, attr_name, None)
-                if isinstance(attr_value, ArgumentSpec):
-                    spec: ArgumentSpec[object] = cast(ArgumentSpec[object], attr_value)
-                else:
-                    spec, attr_hint = _infer_spec_and_correct_typehint_from_nonspec_typehint(
-                        attr_name=attr_name,
-                        type_no_spec=attr_hint,
-                        attr_value=attr_value,
-                        docstrings=docstrings,
-                    )
-
-                if attr_name in cls.__arguments__:
-                    logger.debug(f"Duplicate argument name '{attr_name}' in {current_cls.__name__}.")
 
-                try:
-                    # Extract type information from type hint
-                    spec_type: ArgumentSpecType = ArgumentSpecType.from_type_hint(attr_hint)
-
-                    # Set `choices` and `type`
-                    if detected_choices := spec_type.choices:
-                        spec.choices = detected_choices
-                    if spec.type is None and (detected_type := spec_type.type):
-                        if isinstance(detected_type, type(Enum)):
-                            spec.type = detected_type.__getitem__
-                        else:
-                            spec.type = detected_type
-
-                    # Determine `nargs` depending on list/tuple type
-                    if tn := spec_type.tuple_nargs:
-                        spec.nargs = tn
-                    elif spec.nargs is None and spec_type.should_return_as_list or spec_type.should_return_as_tuple:
-                        spec.nargs = "*"
-
-                    cls.__arguments__[attr_name] = (spec, spec_type)
-                except Exception as e:
-                    print_exc()
-                    logger.warning(f"Error processing {attr_name} in {current_cls.__name__}: {e}")
-                    continue
+        # Route instance reads and writes of the arguments defined here through a descriptor;
+        # inherited ones are served by the descriptor of the class defining them
+        for attr_name in names_to_process.intersection(cls.__arguments__):
+            spec, spec_type = cls.__arguments__[attr_name]
+            setattr(
+                cls,
+                attr_name,
+                _ArgumentAttribute(
+                    key=attr_name,
+                    spec=spec,
+                    is_specless_type=spec_type.is_specless_type,
+                    class_value=getattr(cls, attr_name, _MISSING),
+                ),
+            )
+        cls.__computed__ = resolve_computed_fields(cls, cls.__arguments__)
+        cls.__env_index__ = build_env_index(cls.__env_prefix__, cls.__arguments__, cls.__name__)
+        if started is not None:
+            _timings.record("schema", started, cls)
 
     def get(self, key: str) -> Optional[object]:
         return self.__instance_values__.get(key, self.__class__.__arguments__[key][0].value)
 
+    def get_value_source(self, key: str) -> Optional[str]:
+        """The layer that supplied the value of `key` to `load_layers()`: "default", "config:<path>" (or
+        "config" for a mapping), "env" or "argv". None for instances not loaded that way, unless their
+        class reads the environment."""
+        if key not in self.__class__.__arguments__:
+            raise KeyError(key)
+        return cast(Dict[str, str], self.__dict__.get("__value_sources__", {})).get(key)
+
     def keys(self) -> Iterable[str]:
         yield from (k for k, _v in self.items())
 
@@ -423,17 +845,14 @@ class BaseArguments:
     ) -> Optional[bytes]:
         """Serialize the BaseArguments instance to a pickle file."""
 
-        # Remove all lambda-based default factories
-        for key, spec in self.__instance_specs__.items():
+        # Remove lambda-based default factories from specs modified on this instance.
+        # Views still sharing the class-level spec are not pickled (see `__getstate__`).
+        for spec in self.__instance_specs__.values():
+            if isinstance(spec, ArgumentSpecView) and not spec.detached:
+                continue
             if spec.default_factory is not None and callable(spec.default_factory):
                 logger.warning(f"Removing default_factory from {spec.name_or_flags} in {self.__class__.__name__}.")
                 spec.default_factory = None
-                spec_and_spectype = self.__arguments__.get(key)
-                if spec_and_spectype is None:
-                    continue
-                spec, _ = spec_and_spectype
-                if spec.default_factory is not None and callable(spec.default_factory):
-                    spec.default_factory = None
 
         # If a pickler is provided, use it to serialize
         if pickler is None:
@@ -456,33 +875,12 @@ class BaseArguments:
 
         Args:
             data: Dictionary with argument names and values.
-            args: Optional command line arguments to parse first.
+            args: Optional command line arguments, which take precedence over the dictionary.
 
         Returns:
             A new BaseArguments instance with values from the dictionary.
         """
-        # Create instance with command line args first (if provided)
-        instance = cls(args or [])
-
-        # Apply dictionary values only for keys not set by command line
-        if hasattr(instance, "__instance_values__"):
-            for key, value in data.items():
-                if key in cls.__arguments__:
-                    # Only set if not already set by command line args or if it's still the default
-                    spec, _ = cls.__arguments__[key]
-
-                    # Set from dict if: not in instance values, is None, or is still the default value
-                    if (
-                        key not in instance.__instance_values__
-                        or instance.__instance_values__[key] is None
-                        or instance.__instance_values__[key] == spec.default
-                    ):
-                        instance.__instance_values__[key] = value
-                        # Also update instance specs if they exist
-                        if hasattr(instance, "__instance_specs__") and key in instance.__instance_specs__:
-                            instance.__instance_specs__[key].value = value
-
-        return instance
+        return cls.load_layers(args or [], configs=[data])
 
     @classmethod
     def from_json(cls, json_data: Union[str, Path], args: Optional[Sequence[str]] = None):
@@ -490,20 +888,100 @@ class BaseArguments:
 
         Args:
             json_data: JSON string or path to JSON file.
-            args: Optional command line arguments to parse first.
+            args: Optional command line arguments, which take precedence over the JSON.
 
         Returns:
             A new BaseArguments instance with values from the JSON.
         """
         if isinstance(json_data, Path):
             # It's a file path
-            data = json.loads(Path(json_data).read_text(encoding="utf-8"))
+            return cls.__load_from_layers(args or [], [config_layer(json_data, "json")])
         else:
             # It's a JSON string
             data = json.loads(str(json_data))
 
         return cls.from_dict(data, args)
 
+    def to_bytes(self) -> bytes:
+        """Serialize the values of the instance, and of the selected subcommands, to a compact binary format.
+
+        Only the values are written, in the order of the class's arguments, after a hash of its schema;
+        `from_bytes()` rejects bytes written for another schema. Values not of their argument's declared
+        type are pickled."""
+        parts: List[bytes] = [HEADER]
+        instance: Optional[BaseArguments] = self
+        while instance is not None:
+            cls = instance.__class__
+            parts.append(cls.__get_binary_codec().encode(instance.__instance_values__, instance.get))
+            subcommand = instance.__subcommand
+            parts.append(write_text("" if subcommand is None else cls.__find_subcommand_name(type(subcommand))))
+            instance = subcommand
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls: Type[S], data: bytes) -> S:
+        """Create a BaseArguments instance from bytes written by `to_bytes()`.
+
+        Like `from_pickle()`, this may unpickle values, so only load trusted data.
+
+        Raises:
+            ValueError: If the data was not written by `to_bytes()` of a class with the same schema, or is truncated.
+        """
+        if data[: len(HEADER)] != HEADER:
+            raise ValueError("Bytes data was not written by `to_bytes()` in this format version.")
+        offset = len(HEADER)
+        instance = root = cls(args=None, _internal_init=True)
+        while True:
+            argument_class = instance.__class__
+            offset = argument_class.__get_binary_codec().decode(data, offset, instance.__instance_values__, argument_class.__name__)
+            subname, offset = read_text(data, offset, argument_class.__name__)
+            if not subname:
+                break
+            if (subc := argument_class.__subcommands__.get(subname)) is None:
+                raise ValueError(f"{argument_class.__name__} has no subcommand {subname!r}")
+            subcommand = subc.get_argument_class()(args=None, _internal_init=True)
+            instance.__subcommand = subcommand
+            instance = subcommand
+        if offset != len(data):
+            raise ValueError(f"{len(data) - offset} unexpected bytes after the data of {cls.__name__}")
+        return root
+
+    @classmethod
+    def __get_binary_codec(cls) -> BinaryCodec:
+        """Returns the binary codec of this class, building it on first use."""
+        if (codec := cls.__dict__.get("__binary_codec__")) is not None:
+            return codec
+        fields: List[BinaryField] = []
+        for key, _, spec_type in cls.__iter_arguments():
+            element_type = spec_type.type
+            if element_type is None and spec_type.choices:
+                # Literal choices of a single type
+                if len(choice_types := {type(choice) for choice in spec_type.choices}) == 1:
+                    element_type = choice_types.pop()
+            if spec_type.should_return_as_list:
+                container: Optional[type] = list
+            elif spec_type.should_return_as_tuple:
+                container = tuple
+            else:
+                container = None
+            kind = field_kind(element_type)
+            fields.append(BinaryField(key, kind, container, element_type if kind in ("path", "enum") else None))
+        codec = cls.__binary_codec__ = BinaryCodec(fields)
+        return codec
+
+    @classmethod
+    def __find_subcommand_name(cls, argument_class: type) -> str:
+        """The name of the subcommand of this class whose argument class is `argument_class`."""
+        subcommands = cls.__subcommands__.items()
+        # The selected subcommand's factory has already run; avoid calling the others
+        for name, subc in subcommands:
+            if argument_class is subc.argument_class or argument_class is subc._cached_argument_class:  # pyright: ignore[reportPrivateUsage]
+                return name
+        for name, subc in subcommands:
+            if argument_class is subc.get_argument_class():
+                return name
+        raise ValueError(f"{argument_class.__name__} is not a subcommand of {cls.__name__}")
+
     @classmethod
     def from_pickle(
         cls,
@@ -541,23 +1019,24 @@ class BaseArguments:
             for key, value in data.items():
                 if key in self.__class__.__arguments__:
                     self.__instance_values__[key] = value
-                    # Also update instance specs if they exist
-                    if hasattr(self, "__instance_specs__") and key in self.__instance_specs__:
-                        self.__instance_specs__[key].value = value
 
     @classmethod
     def load_config(
         cls,
         file_path: Union[str, Path],
-        format: Optional[Literal["json", "pickle"]] = None,
+        format: Optional[Literal[ConfigFormat, "pickle"]] = None,
         args: Optional[Sequence[str]] = None,
     ):
         """Load configuration from a file.
 
+        JSON, TOML and INI files are parsed once per process and reused until they change, which
+        makes loading the same file repeatedly cheap.
+
         Args:
             file_path: Path to the configuration file.
-            format: File format. If None, inferred from file extension.
-            args: Optional command line arguments to parse first.
+            format: File format ("json", "toml", "ini" or "pickle"). If None, inferred from file extension.
+            args: Optional command line arguments, which take precedence over values from the file
+                (other than a pickle).
 
         Returns:
             A new BaseArguments instance with values from the file.
@@ -566,25 +1045,149 @@ class BaseArguments:
 
         if format is None:
             # Infer format from extension
-            if path.suffix.lower() == ".json":
-                format = "json"
-            elif path.suffix.lower() in (".pkl", ".pickle"):
+            if path.suffix.lower() in (".pkl", ".pickle"):
                 format = "pickle"
-            else:
+            elif (format := infer_config_format(path)) is None:
                 raise ValueError(f"Cannot infer format from extension: {path.suffix}")
 
-        if format == "json":
-            return cls.from_json(path, args)
-        elif format == "pickle":
+        if format == "pickle":
             return cls.from_pickle(path, args)
+        elif format in ("json", "toml", "ini"):
+            return cls.__load_from_layers(args or [], [config_layer(path, format)])
         else:
             raise ValueError(f"Unsupported format: {format}")
 
     @classmethod
     def get_parser(cls) -> argparse.ArgumentParser:
-        arg_parser = argparse.ArgumentParser(
+        """Returns a new parser for this class, which the caller is free to change.
+
+        Parsing goes through a parser memoized per class instead, which this one does not affect."""
+        return cls.__build_parser(None)
+
+    @classmethod
+    def _get_parser_for_argv(cls, args: Optional[Sequence[str]] = None) -> argparse.ArgumentParser:
+        """Returns the parser to parse `args` with.
+
+        With `__lazy_subcommands__`, only the subcommands selected by `args` are fully built;
+        the others are placeholders whose argument classes are never resolved."""
+        if not cls._uses_lazy_subcommands():
+            return cls.__get_compiled_parser(None)
+        if args is None:
+            args = sys.argv[1:]
+        return cls.__get_compiled_parser(cls.__prescan_subcommand_path(args))
+
+    @classmethod
+    def parse_many(
+        cls: Type[S],
+        argvs: Iterable[Sequence[str]],
+        processes: Optional[int] = None,
+        chunksize: int = 256,
+    ) -> Iterator[Union[S, ParseError]]:
+        """Parses many command lines with one parser, lazily yielding an instance per command line.
+
+        Command lines that fail to parse (or ask for `--help`) yield a `ParseError` instead of
+        printing and exiting, so one bad command line does not stop the batch.
+
+        Args:
+            argvs: The command lines, each a sequence of arguments without the program name.
+            processes: If given, parse in that many worker processes. The class must be importable
+                by the workers and the parsed values picklable. Results are still yielded in order.
+            chunksize: The number of command lines sent to a worker process at once.
+        """
+        if processes is not None:
+            yield from _parse_many_in_processes(cls, argvs, processes, chunksize)
+            return
+
+        # The full parser serves every subcommand path, so it is the one worth reusing for a batch,
+        # unless building it would import the modules of every subcommand
+        parser = None if cls._uses_lazy_subcommands() else cls.__get_compiled_parser(None)
+        fast_parser = cls.__get_fast_parser() if cls.__parse_engine__ == "fast" else None
+        for index, argv in enumerate(argvs):
+            token = _raise_parse_errors.set(True)
+            started = perf_counter() if _timings.enabled else None
+            try:
+                if fast_parser is None or (parsed_args := fast_parser.parse_args(argv)) is None:
+                    parsed_args = parser.parse_args(argv) if parser is not None else cls.__parse_args_with_parser(argv)
+            except ParseError as e:
+                e.argv, e.index = list(argv), index
+                yield e
+                continue
+            except Exception as e:
+                # A type conversion argparse doesn't report itself, like an Enum's KeyError
+                error = ParseError(str(e), argv=argv, index=index, prog=(parser or cls._get_parser_for_argv(argv)).prog)
+                error.__cause__ = e
+                yield error
+                continue
+            finally:
+                _raise_parse_errors.reset(token)
+                if started is not None:
+                    _timings.record("parse_args", started, cls)
+
+            instance = cls(args=None, _internal_init=True)
+            try:
+                instance.__load_parsed(parsed_args)
+            except Exception as e:
+                error = ParseError(str(e), argv=argv, index=index, prog=(parser or cls._get_parser_for_argv(argv)).prog)
+                error.__cause__ = e
+                yield error
+                continue
+            yield instance
+
+    @classmethod
+    def __parse_args(cls, args: Optional[Sequence[str]]) -> argparse.Namespace:
+        if not _timings.enabled:
+            return cls.__parse_args_with_parser(args)
+        started = perf_counter()
+        try:
+            return cls.__parse_args_with_parser(args)
+        finally:
+            _timings.record("parse_args", started, cls)
+
+    @classmethod
+    def __parse_args_with_parser(cls, args: Optional[Sequence[str]]) -> argparse.Namespace:
+        if cls.__parse_engine__ == "fast" and (fast_parser := cls.__get_fast_parser()) is not None:
+            if args is None:
+                args = sys.argv[1:]
+            if (parsed_args := fast_parser.parse_args(args)) is not None:
+                return parsed_args
+        if not cls._uses_lazy_subcommands():
+            return cls.__get_compiled_parser(None).parse_args(args)
+        if args is None:
+            args = sys.argv[1:]
+        try:
+            return cls._get_parser_for_argv(args).parse_args(args)
+        except _UnselectedSubcommand:
+            # The pre-scan guessed a different path than argparse took; the full parser is always right
+            logger.debug(f"Subcommand pre-scan of {cls.__name__} missed for {args!r}; using the full parser.")
+            return cls.__get_compiled_parser(None).parse_args(args)
+
+    @classmethod
+    def __get_compiled_parser(cls, path: Optional[Tuple[str, ...]], layered: bool = False) -> argparse.ArgumentParser:
+        key = (cls, ("layered", path) if layered else path)
+        if (compiled := _parser_cache.get(key, _CompiledParser.is_current)) is not None:
+            return compiled.parser
+
+        started = perf_counter() if _timings.enabled else None
+        dependencies: List[Tuple[SubcommandSpec["BaseArguments"], type]] = []
+        arg_parser = cls.__build_parser(path, layered, dependencies)
+        _parser_cache.put(key, _CompiledParser(parser=arg_parser, dependencies=tuple(dependencies)))
+        if started is not None:
+            _timings.record("parser", started, cls)
+        return arg_parser
+
+    @classmethod
+    def __build_parser(
+        cls,
+        path: Optional[Tuple[str, ...]],
+        layered: bool = False,
+        dependencies: Optional[List[Tuple[SubcommandSpec["BaseArguments"], type]]] = None,
+    ) -> argparse.ArgumentParser:
+        """Builds a parser for the subcommand `path` (all subcommands if None), without memoizing it.
+
+        The subcommand classes the parser was built from are appended to `dependencies`."""
+        arg_parser = _ArgumentParser(
             description=cls.__doc__,
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+            formatter_class=_ArgumentDefaultsHelpFormatter,
             add_help=False,
         )
         arg_parser.add_argument(
@@ -594,9 +1197,134 @@ class BaseArguments:
             default=argparse.SUPPRESS,
             help="Show this help message and exit.",
         )
-        cls.__configure_parser(arg_parser)
+        cls.__configure_parser(arg_parser, _dependencies=dependencies, _path=path, _layered=layered)
         return arg_parser
 
+    @classmethod
+    def __get_fast_parser(cls) -> Optional[FastParser]:
+        """Returns the fast engine's parser for this class, or None if the class uses features it lacks."""
+        try:
+            return _fast_parsers[cls]
+        except KeyError:
+            pass
+        if cls.__env_index__:
+            # The environment is merged into what argparse's layered parser leaves unset
+            _fast_parsers[cls] = None
+            return None
+        actions: List[Optional[FastAction]] = []
+        for key, spec, _ in cls.__iter_arguments():
+            kwargs = spec.get_add_argument_kwargs()
+            if any(name.startswith("-") for name in spec.name_or_flags):
+                kwargs["dest"] = key
+            else:
+                kwargs["required"] = None
+            actions.append(make_fast_action(spec.name_or_flags, {k: v for k, v in kwargs.items() if v is not None}))
+        # The resolver must not refer to `cls`, which would keep it alive through the weak mapping
+        fast_parser = _fast_parsers[cls] = FastParser.create(
+            actions,
+            subcommand_names=tuple(cls.__subcommands__),
+            subcommand_required=not cls.__arguments__ and bool(cls.__subcommands__),
+            resolve_subcommand=partial(BaseArguments.__resolve_fast_subparser, cls.__subcommands__),
+        )
+        return fast_parser
+
+    @staticmethod
+    def __resolve_fast_subparser(subcommands: Dict[str, SubcommandSpec["BaseArguments"]], name: str) -> Optional[FastParser]:
+        try:
+            argument_class = subcommands[name].get_argument_class()
+        except Exception:
+            return None  # argparse reports the failure
+        return argument_class.__get_fast_parser()
+
+    @classmethod
+    def __prescan_subcommand_path(cls, args: Sequence[str]) -> Tuple[str, ...]:
+        """Finds the subcommand names selected by `args` without building any parser.
+
+        Option values are skipped according to each option's arity, and the leading positionals of every
+        level are skipped by count. The result is a best guess; argparse has the final word."""
+        path: List[str] = []
+        current_cls: Type[BaseArguments] = cls
+        index = 0
+        while current_cls._has_subcommands():
+            option_arities, positional_count = current_cls.__get_token_arities()
+            selected: Optional[Type[BaseArguments]] = None
+            while index < len(args):
+                token = args[index]
+                index += 1
+                if token == "--":
+                    return tuple(path)
+                if token.startswith("-") and len(token) > 1:
+                    if "=" in token or (arity := option_arities.get(token)) is None:
+                        continue
+                    if isinstance(arity, int):
+                        index += arity
+                    elif arity == "?":
+                        index += index < len(args) and not args[index].startswith("-")
+                    else:
+                        while index < len(args) and not args[index].startswith("-"):
+                            index += 1
+                    continue
+                if positional_count > 0:
+                    positional_count -= 1
+                    continue
+                if (subc := current_cls.__subcommands__.get(token)) is None:
+                    return tuple(path)
+                try:
+                    selected = subc.get_argument_class()
+                except Exception:
+                    return tuple(path)
+                path.append(token)
+                break
+            if selected is None:
+                break
+            current_cls = selected
+        return tuple(path)
+
+    @classmethod
+    def __get_token_arities(cls) -> Tuple[Dict[str, Union[int, str]], int]:
+        """Returns how many tokens each option string consumes, and how many leading positional tokens there are."""
+        option_arities: Dict[str, Union[int, str]] = {"-h": 0, "--help": 0}
+        positional_count = 0
+        for _, spec, _ in cls.__iter_arguments():
+            if spec.action in ACTION_TYPES_THAT_DONT_SUPPORT_TYPE_KWARG:
+                arity: Union[int, str] = 0
+            elif spec.nargs is None:
+                arity = 1
+            else:
+                arity = spec.nargs
+            if any(name.startswith("-") for name in spec.name_or_flags):
+                for name in spec.name_or_flags:
+                    option_arities[name] = arity
+            elif isinstance(arity, int):
+                positional_count += arity
+        return option_arities, positional_count
+
+    @classmethod
+    def invalidate_parser_cache(cls) -> None:
+        """Drops memoized parsers that involve this class.
+
+        Called on `BaseArguments` itself, every memoized parser is dropped."""
+        if cls is BaseArguments:
+            _parser_cache.discard(lambda key, compiled: True)
+            _fast_parsers.clear()
+            return
+        _fast_parsers.pop(cls, None)
+        _parser_cache.discard(
+            lambda key, compiled: key[0] is cls or any(c is cls for _, c in compiled.dependencies)
+        )
+
+    @staticmethod
+    def parser_cache_info() -> CacheInfo:
+        """Returns hit/miss statistics of the memoized parsers."""
+        return _parser_cache.info()
+
+    @staticmethod
+    def set_parser_cache_maxsize(maxsize: Optional[int]) -> None:
+        """Bounds the number of memoized parsers; the least recently used ones are evicted first.
+
+        None removes the bound."""
+        _parser_cache.maxsize = maxsize
+
     @classmethod
     def __iter_arguments(
         cls,
@@ -613,6 +1341,32 @@ class BaseArguments:
     def _has_subcommands(cls) -> bool:
         return bool(cls.__subcommands__)
 
+    @classmethod
+    def _uses_lazy_subcommands(cls) -> bool:
+        """Whether parsers are built lazily: as `__lazy_subcommands__` says, or if it is None, when a
+        subcommand reachable without calling any factory is given by import path."""
+        if cls.__lazy_subcommands__ is not None:
+            return cls.__lazy_subcommands__
+        # Walking the tree on every parse would cost more than the lookup it decides, so the answer is kept
+        # until the subcommand factories are invalidated (e.g. a class in the tree is redefined)
+        generation = get_factory_generation()
+        if (memo := cls.__dict__.get("__uses_lazy_subcommands__")) is not None and memo[0] == generation:
+            return memo[1]
+        uses_lazy = False
+        seen: Set[type] = set()
+        pending: List[Type[BaseArguments]] = [cls]
+        while pending and not uses_lazy:
+            current = pending.pop()
+            seen.add(current)
+            for subc in current.__subcommands__.values():
+                if subc.import_path is not None:
+                    uses_lazy = True
+                    break
+                if isinstance(subc.argument_class, type) and subc.argument_class not in seen:
+                    pending.append(subc.argument_class)
+        cls.__uses_lazy_subcommands__ = (generation, uses_lazy)
+        return uses_lazy
+
     @classmethod
     def __add_argument_to_parser(
         cls, parser: argparse.ArgumentParser, name_or_flags: List[str], kwargs: "ArgumentKwargs[object]"
@@ -620,11 +1374,27 @@ class BaseArguments:
         parser.add_argument(*name_or_flags, **{k: v for k, v in kwargs.items() if v is not None})  # pyright: ignore[reportArgumentType]
 
     @classmethod
-    def __configure_parser(cls, parser: argparse.ArgumentParser, _depth: int = 0) -> None:
-        # 1) add this class's own arguments
+    def __configure_parser(
+        cls,
+        parser: argparse.ArgumentParser,
+        _depth: int = 0,
+        _dependencies: Optional[List[Tuple[SubcommandSpec["BaseArguments"], type]]] = None,
+        _path: Optional[Tuple[str, ...]] = None,
+        _layered: bool = False,
+    ) -> None:
+        # 1) add this class's own arguments; those of a class reading the environment are always layered
+        layered = _layered or bool(cls.__env_index__)
         for key, spec, _ in cls.__iter_arguments():
             kwargs = spec.get_add_argument_kwargs()
             is_positional = not any(name.startswith("-") for name in spec.name_or_flags)
+            if layered:
+                # Other layers may supply the value, so options are only checked for after merging
+                if kwargs["action"] in _ACCUMULATING_ACTIONS:
+                    kwargs["default"] = argparse.SUPPRESS  # They would add to the stand-in
+                elif kwargs["default"] is not argparse.SUPPRESS:
+                    kwargs["default"] = cast(Any, _LayerDefault(kwargs["default"], kwargs["type"]))
+                if not is_positional:
+                    kwargs["required"] = None
             if is_positional:
                 kwargs["required"] = None
                 cls.__add_argument_to_parser(parser, spec.name_or_flags, kwargs)
@@ -646,97 +1416,174 @@ class BaseArguments:
                 metavar="subcommand",  # Always show 'subcommand' in help text
                 help="Available subcommands",
                 required=not cls.__arguments__ and bool(cls.__subcommands__),
+                parser_class=type(parser) if _path is None else _LazySubcommandParser,
             )
             for name, subc in cls.__iter_subcommands():
+                # Deferred texts are resolved by the help formatter, when help is rendered
                 subparser = subparsers.add_parser(
                     name,
-                    help=subc.help,
-                    description=subc.description or subc.help,
+                    help=cast(Optional[str], get_raw_text(subc, "help")),
+                    description=cast(Optional[str], _get_raw_description(subc)),
                 )
+                if _path is not None:
+                    # Lazy mode: only the selected subcommand gets its arguments
+                    if not _path or _path[0] != name:
+                        cast(_LazySubcommandParser, subparser).unselected = True
+                        continue
+                    argument_class = subc.get_argument_class()
+                    if _dependencies is not None:
+                        _dependencies.append((subc, argument_class))
+                    argument_class.__configure_parser(subparser, _depth + 1, _dependencies, _path[1:], _layered)
+                    continue
                 try:
                     argument_class = subc.get_argument_class()
-                    argument_class.__configure_parser(subparser, _depth + 1)
+                    if _dependencies is not None:
+                        _dependencies.append((subc, argument_class))
+                    argument_class.__configure_parser(subparser, _depth + 1, _dependencies, _layered=_layered)
                 except Exception:
                     # If getting the argument class fails, skip this subcommand configuration
                     pass
 
-    def __load_from_namespace(self, args: argparse.Namespace) -> None:
-        # First, create instance-specific copies of all ArgumentSpecs
-        for key, spec, spec_type in self.__class__.__iter_arguments():
-            # Create a copy of the spec for this instance
-
-            instance_spec = deepcopy(spec)
-            self.__instance_specs__[key] = instance_spec
+    @classmethod
+    def __get_namespace_loader(cls) -> NamespaceLoader:
+        """Returns the loader compiled for this class, compiling it on first use."""
+        if (loader := cls.__dict__.get("__namespace_loader__")) is not None:
+            return loader
+        fields = cls._get_loader_fields()
+        if (compiled := get_compiled_class(cls)) is None or (loader := compiled.get_loader(fields, cls.__qualname__)) is None:
+            loader = compile_loader(fields, subject=cls.__qualname__)
+        cls.__namespace_loader__ = loader
+        return loader
 
-        for key, spec, spec_type in self.__class__.__iter_arguments():
-            instance_spec: ArgumentSpec[object] = self.__instance_specs__[key]
+    @classmethod
+    def _get_loader_fields(cls) -> List[LoaderField]:
+        """Describes the arguments of this class to the namespace loader."""
+        fields: List[LoaderField] = []
+        for key, spec, spec_type in cls.__iter_arguments():
             is_positional: bool = not any(n.startswith("-") for n in spec.name_or_flags)
-            attr = spec.name_or_flags[0] if is_positional else (spec.dest or key)
-            if not hasattr(args, attr):
-                continue
-            val: object = cast(object, getattr(args, attr))
-            if val is argparse.SUPPRESS:
-                continue
-
-            checkable_type: Optional[type] = (
-                spec.type if spec.type is not None and isinstance(spec.type, type) else None
-            )
-
-            # Type check for list/tuple
             if spec_type.should_return_as_list:
-                if isinstance(val, list):
-                    val = cast(List[object], val)
-
-                elif val is not None:
-                    val = [val]
-                if val is not None and checkable_type is not None:
-                    for v in val:
-                        assert_type(v, checkable_type)
-
+                container: Optional[type] = list
             elif spec_type.should_return_as_tuple:
-                if isinstance(val, tuple):
-                    val = cast(Tuple[object, ...], val)
-                elif val is not None:
-                    if isinstance(val, list):
-                        val = tuple(cast(List[object], val))
-                    else:
-                        val = (val,)
-                if val is not None and checkable_type is not None:
-                    for v in val:
-                        assert_type(v, checkable_type)
+                container = tuple
+            else:
+                container = None
+            fields.append(
+                LoaderField(
+                    key=key,
+                    attr=spec.name_or_flags[0] if is_positional else (spec.dest or key),
+                    container=container,
+                    checkable_type=spec.type if spec.type is not None and isinstance(spec.type, type) else None,
+                    default_factory_spec=spec if spec.default_factory is not None else None,
+                    lazy=spec.default_factory is not None
+                    and (cls.__lazy_default_factories__ if spec.lazy is None else spec.lazy),
+                )
+            )
+        return fields
+
+    def __load_from_namespace(self, args: argparse.Namespace) -> Optional[PendingFactories]:
+        # Spec views are created on first access and read their value from here
+        cls = self.__class__
+        submit = None if cls.__default_factory_executor__ is False else _get_factory_submitter(cls.__default_factory_executor__)
+        started = perf_counter() if _timings.enabled else None
+        pending = cls.__get_namespace_loader()(args, self.__instance_values__, submit)
+        if pending is not None:
+            pending = self.__defer_lazy_factories(pending)
+        if started is not None:
+            _timings.record("load_namespace", started, cls)
+        return pending
+
+    def __merge_layers(
+        self, parsed_args: argparse.Namespace, layers: Sequence[ConfigLayer], environ: Optional[Mapping[str, str]]
+    ) -> argparse.Namespace:
+        """Resolves every argument of this class to the highest layer supplying it, in one pass.
+
+        Returns the namespace to load the values given on the command line and the defaults from. The
+        values of the other layers are stored right away, which also keeps their default factories from
+        running."""
+        namespace = argparse.Namespace()
+        parsed = vars(namespace)
+        parsed.update(vars(parsed_args))
+        if environ is not None and self.__env_index__ and (env := env_layer(self.__env_index__, environ)) is not None:
+            layers = [*layers, env]
+        values = self.__instance_values__
+        sources: Dict[str, str] = {}
+        for key, spec, spec_type in self.__class__.__iter_arguments():
+            is_positional = not any(name.startswith("-") for name in spec.name_or_flags)
+            attr = spec.name_or_flags[0] if is_positional else (spec.dest or key)
+            value = parsed.get(attr, _MISSING)
+            if value is not _MISSING and not isinstance(value, _LayerDefault):
+                sources[key] = "argv"
+                continue
+            for layer in reversed(layers):
+                if key in layer.values:
+                    parsed.pop(attr, None)
+                    layer_value = layer.values[key]
+                    try:
+                        if not layer.from_strings:
+                            layer_value = coerce_value(spec, spec_type, layer_value)
+                        elif isinstance(layer_value, str):
+                            layer_value = coerce_string(spec, spec_type, layer_value)
+                    except (ValueError, TypeError, KeyError, argparse.ArgumentTypeError) as e:
+                        flags = "/".join(spec.name_or_flags)
+                        raise _LayerValueError(f"argument {flags}: {e} (from {layer.name})") from e
+                    values[key] = take_layer_value(layer_value)
+                    sources[key] = layer.name
+                    break
+            else:
+                sources[key] = "default"
+                if isinstance(value, _LayerDefault):
+                    parsed[attr] = value.resolve()
+                elif spec.action in _ACCUMULATING_ACTIONS:
+                    # The layered parser gives these no default, so that parsed values don't add to it
+                    if (default := spec.get_add_argument_kwargs()["default"]) is not argparse.SUPPRESS:
+                        parsed[attr] = default
+        self.__dict__["__value_sources__"] = sources
+        return namespace
+
+    def __defer_lazy_factories(self, pending: PendingFactories) -> Optional[PendingFactories]:
+        """Moves the lazy factories out of `pending` into the values, to run on first read."""
+        deferred = [key for key, result in pending.items() if isinstance(result, DeferredFactory)]
+        if not deferred:
+            return pending
+        if not isinstance(values := self.__instance_values__, _LazyValues):
+            # No spec view refers to the plain values yet; they are only created on access
+            values = self.__instance_values__ = _LazyValues(values)
+        for key in deferred:
+            values.pop(key, None)  # A None parsed for the argument; reads must reach the factory
+            values.pending[key] = cast(DeferredFactory, pending.pop(key)).factory
+        return pending or None
 
-            elif val is not None and checkable_type is not None:
-                assert_type(val, checkable_type)
 
-            # Store value in instance-specific storage
-            self.__instance_values__[key] = val
-            # Update the instance-specific spec
-            instance_spec.value = val
+ignored_annotations = tuple(get_type_hints(BaseArguments).keys())
 
-        # Apply default factories after all values are loaded
-        for key, spec, spec_type in self.__class__.__iter_arguments():
-            instance_spec = self.__instance_specs__[key]
-            # Only apply default factory if no value was set from command line
-            if key not in self.__instance_values__ or self.__instance_values__[key] is None:
-                if instance_spec.default_factory is not None:
-                    factory_value = instance_spec.default_factory()
-                    self.__instance_values__[key] = factory_value
-                    # Update the instance-specific spec
-                    instance_spec.value = factory_value
 
+def _get_type_hints_of(cls: type, names: Set[str]) -> Iterator[Tuple[str, object]]:
+    """The type hints of `names` in `cls`, in the order of `get_type_hints()`.
 
-ignored_annotations = tuple(get_type_hints(BaseArguments).keys())
+    Only the annotation of each name in the class that defines it last is evaluated, so a subclass does
+    not evaluate the annotations its bases have already analysed."""
+    if (compiled := get_compiled_class(cls)) is not None and (hints := compiled.get_type_hints(cls)) is not None:
+        yield from ((k, v) for k, v in hints.items() if k in names)
+        return
+    mro = [c for c in cls.__mro__ if c is not object]
+    owned: Dict[type, List[str]] = {}
+    for name in names:
+        if name not in ignored_annotations and (owner := next((c for c in mro if name in get_own_annotations(c)), None)):
+            owned.setdefault(owner, []).append(name)
+    resolved: Dict[str, object] = {}
+    for owner, owner_names in owned.items():
+        resolved.update(get_own_type_hints(owner, owner_names))
+    for name in dict.fromkeys(name for c in reversed(mro) for name in get_own_annotations(c) if name in resolved):
+        yield name, resolved[name]
 
 
-def _get_type_hints(obj: type) -> Iterator[Tuple[str, object]]:
-    """Get type hints for an object, excluding those in BaseArguments."""
-    for k, v in get_type_hints(obj, include_extras=True).items():
-        if k not in ignored_annotations:
-            yield k, v
+def _get_attr_help(cls: type, attr_name: str) -> str:
+    """The help text of an attribute, taken from the docstring below it."""
+    return get_attr_docstrings(cls).get(attr_name, "")
 
 
 def _infer_spec_and_correct_typehint_from_nonspec_typehint(
-    attr_name: str, type_no_spec: object, attr_value: object, docstrings: Dict[str, str]
+    attr_name: str, type_no_spec: object, attr_value: object, help: TextOrDeferred
 ) -> Tuple[ArgumentSpec[object], object]:
     action: Optional[Action] = None
     type: Optional[Callable[[str], object]] = None
@@ -798,7 +1645,7 @@ def _infer_spec_and_correct_typehint_from_nonspec_typehint(
         default=default_value,
         default_factory=default_factory,
         required=default_value is None and default_factory is None and not optional,
-        help=docstrings.get(attr_name, ""),
+        help=cast(str, help),
         action=action,
         type=type,
         annotated=annotated,
@@ -806,6 +1653,194 @@ def _infer_spec_and_correct_typehint_from_nonspec_typehint(
     return spec, type_no_optional_or_spec
 
 
+class _LazyValues(Dict[str, object]):
+    """The values of an instance with lazy default factories, which run when their key is first read."""
+
+    __slots__ = ("pending",)
+
+    def __init__(self, values: Dict[str, object]) -> None:
+        super().__init__(values)
+        self.pending: Dict[str, Callable[[], object]] = {}
+        """The factories not called yet, by key."""
+
+    def __missing__(self, key: str) -> object:
+        if (factory := self.pending.get(key)) is None:
+            raise KeyError(key)
+        value = factory()
+        if isinstance(value, CoroutineType):
+            value.close()
+            raise TypeError(f"The lazy default factory of {key!r} is async; it can only run at parse time")
+        # A factory that raises is tried again on the next read
+        del self.pending[key]
+        super().__setitem__(key, value)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return super().__contains__(key) or key in self.pending
+
+    def __setitem__(self, key: str, value: object) -> None:
+        self.pending.pop(key, None)
+        super().__setitem__(key, value)
+
+    def get(self, key: str, default: object = None) -> object:  # pyright: ignore[reportIncompatibleMethodOverride]
+        if key in self.pending:
+            return self.__missing__(key)
+        return super().get(key, default)
+
+    def evaluated(self) -> Dict[str, object]:
+        """Runs the remaining factories, returning all values as a plain dict."""
+        for key in tuple(self.pending):
+            self.__missing__(key)
+        return dict(self)
+
+
+async def _gather_default_factories(pending: List[Tuple[BaseArguments, PendingFactories]], subject: type) -> None:
+    """Awaits the pending default factory results concurrently, storing them."""
+    import asyncio  # Only worth importing for classes that have async default factories
+
+    started = perf_counter() if _timings.enabled else None
+    # Lazy factories were taken out of `pending` when the values were loaded
+    awaited = [
+        (instance, key, result)
+        for instance, factories in pending
+        for key, result in factories.items()
+        if not isinstance(result, DeferredFactory)
+    ]
+    results = await asyncio.gather(*(_await_default_factory(result) for _, _, result in awaited), return_exceptions=True)
+    if started is not None:
+        _timings.record("default_factories", started, subject)
+    for (instance, key, _), result in zip(awaited, results):
+        if isinstance(result, Exception):
+            owner = type(instance).__name__
+            raise DefaultFactoryError(
+                f"Default factory of {owner}.{key} failed: {type(result).__name__}: {result}", owner=owner, field=key
+            ) from result
+        if isinstance(result, BaseException):
+            raise result
+        instance.__instance_values__[key] = result
+
+
+async def _await_default_factory(result: Union[Coroutine[Any, Any, object], FactoryFuture]) -> object:
+    if not isinstance(result, CoroutineType):
+        import asyncio
+
+        # Submitted to an executor; an async factory run there only created its coroutine
+        value = await asyncio.wrap_future(cast("Future[object]", result))
+        if not isinstance(value, CoroutineType):
+            return value
+        return await cast("Coroutine[Any, Any, object]", value)
+    return await result
+
+
+def _run_default_factories(pending: List[Tuple[BaseArguments, PendingFactories]], subject: type) -> None:
+    """Waits for the pending default factory results from synchronous code.
+
+    Async factories are run with `asyncio.run()`, which can't be done inside a running event loop."""
+    started = perf_counter() if _timings.enabled else None
+    error: Optional[Exception] = None
+    waited = False
+    for instance, factories in pending:
+        for key, result in list(factories.items()):
+            if isinstance(result, CoroutineType):
+                continue
+            waited = True
+            try:
+                value = cast("Future[object]", result).result()
+            except Exception as e:
+                # Like the factories run one after another, raise the first error, but only once all are done
+                error = error or e
+                del factories[key]
+                continue
+            if isinstance(value, CoroutineType):
+                factories[key] = value
+            else:
+                instance.__instance_values__[key] = value
+                del factories[key]
+    if waited and started is not None:
+        _timings.record("default_factories", started, subject)
+    coroutines = [coroutine for _, factories in pending for coroutine in factories.values()]
+    if error is not None:
+        for coroutine in coroutines:
+            cast("Coroutine[Any, Any, object]", coroutine).close()
+        raise error
+    if not coroutines:
+        return
+
+    import asyncio
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(_gather_default_factories(pending, subject))
+        return
+    for coroutine in coroutines:
+        cast("Coroutine[Any, Any, object]", coroutine).close()
+    name = subject.__name__
+    raise RuntimeError(
+        f"{name} has async default factories, which can't be run from inside an event loop; use `await {name}.aparse()`"
+    )
+
+
+def _get_factory_submitter(executor: Union[bool, FactoryExecutor]) -> Optional[FactorySubmitter]:
+    """The function submitting default factories to the executor configured by `__default_factory_executor__`."""
+    if executor is False:
+        return None
+    if executor is True:
+        executor = _get_shared_executor()
+    return executor.submit
+
+
+_shared_executor: Optional[FactoryExecutor] = None
+_shared_executor_lock = threading.Lock()
+
+
+def _get_shared_executor() -> FactoryExecutor:
+    """The thread pool shared by the classes with `__default_factory_executor__ = True`, created on first use."""
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            _shared_executor = ThreadPoolExecutor(thread_name_prefix="spargear-default-factory")
+        return _shared_executor
+
+
+def _parse_chunk(cls: Type[S], argvs: Sequence[Sequence[str]]) -> List[Union[S, ParseError]]:
+    """Worker-process side of `BaseArguments.parse_many()`."""
+    return list(cls.parse_many(argvs))
+
+
+def _parse_many_in_processes(
+    cls: Type[S], argvs: Iterable[Sequence[str]], processes: int, chunksize: int
+) -> Iterator[Union[S, ParseError]]:
+    """Fans `parse_many()` out over a process pool, keeping only a few chunks in flight at a time."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    iterator = iter(argvs)
+    pending: "Deque[Tuple[int, Future[List[Union[S, ParseError]]]]]" = deque()
+    offset = 0
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        while True:
+            while len(pending) < 2 * processes and (chunk := [list(argv) for argv in islice(iterator, chunksize)]):
+                pending.append((offset, executor.submit(_parse_chunk, cls, chunk)))
+                offset += len(chunk)
+            if not pending:
+                return
+            chunk_offset, future = pending.popleft()
+            for result in future.result():
+                if isinstance(result, ParseError) and result.index is not None:
+                    result.index += chunk_offset
+                yield result
+
+
+def _get_raw_description(subc: SubcommandSpec["BaseArguments"]) -> Optional[TextOrDeferred]:
+    """The description of a subparser (falling back to the help), without resolving deferred texts."""
+    description = get_raw_text(subc, "description")
+    if isinstance(description, DeferredText) or isinstance(get_raw_text(subc, "help"), DeferredText):
+        return DeferredText(lambda: subc.description or subc.help)
+    return description or subc.help
+
+
 def _ensure_not_subcommand_spec(subcommand_spec: SubcommandLike[S]) -> Type[S]:
     if isinstance(subcommand_spec, SubcommandSpec):
         return subcommand_spec.get_argument_class()
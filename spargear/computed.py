@@ -0,0 +1,124 @@
+"""Fields derived from other fields of an argument class."""
+
+from inspect import Parameter, signature
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, List, Mapping, Optional, Set, Tuple, TypeVar, Union, overload
+
+if TYPE_CHECKING:
+    from .base import BaseArguments
+
+T = TypeVar("T")
+
+
+class ComputedField(Generic[T]):
+    """A read-only field computed from other fields; see `computed()`."""
+
+    def __init__(self, func: Callable[..., T]) -> None:
+        parameters = list(signature(func).parameters.values())
+        positional = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+        if not parameters or any(p.kind not in positional for p in parameters):
+            raise TypeError(f"A computed field takes `self` followed by the fields it depends on: {func!r}")
+        self.func = func
+        self.name: str = func.__name__
+        self.dependencies: Tuple[str, ...] = tuple(p.name for p in parameters[1:])
+        """The names of the fields (arguments or computed fields) the value is computed from."""
+        self.__name__ = func.__name__
+        self.__qualname__ = getattr(func, "__qualname__", func.__name__)
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, obj: None, objtype: Optional[type] = None) -> "ComputedField[T]": ...
+    @overload
+    def __get__(self, obj: "BaseArguments", objtype: Optional[type] = None) -> T: ...
+    def __get__(self, obj: Optional["BaseArguments"], objtype: Optional[type] = None) -> Union["ComputedField[T]", T]:
+        if obj is None:
+            return self
+        return evaluate_computed(obj, self.name)  # pyright: ignore[reportReturnType]
+
+    def __set__(self, obj: "BaseArguments", value: object) -> None:
+        raise AttributeError(f"Computed field {self.name!r} is read-only; set the fields it depends on instead")
+
+    def __repr__(self) -> str:
+        return f"<computed field {self.name}({', '.join(self.dependencies)})>"
+
+
+# The computed fields to evaluate for one of them, dependencies first, by name
+ComputedPlans = Dict[str, Tuple[ComputedField[Any], ...]]
+
+
+def computed(func: Callable[..., T]) -> ComputedField[T]:
+    """Declares a field computed from other fields of the class, like a property with declared inputs.
+
+    The parameters after `self` name the arguments or other computed fields the value depends on, and
+    receive their values:
+
+        @computed
+        def output_dir(self, root: Path, run_name: str) -> Path:
+            return root / run_name
+
+    Dependencies are resolved when the class is created. The value is computed on first read, after the
+    computed fields it depends on, and memoised on the instance until one of its inputs is set to
+    another value."""
+    return ComputedField(func)
+
+
+def resolve_computed_fields(cls: type, arguments: Mapping[str, object]) -> ComputedPlans:
+    """Checks the dependencies of the computed fields of `cls` and orders them for evaluation.
+
+    Raises TypeError for unknown dependencies and dependency cycles."""
+    fields: Dict[str, ComputedField[Any]] = {}
+    names = [
+        name for klass in reversed(cls.__mro__) for name, value in vars(klass).items() if isinstance(value, ComputedField)
+    ]
+    for name in dict.fromkeys(names):
+        # A subclass may override a computed field with anything else
+        if isinstance(value := getattr(cls, name), ComputedField):
+            fields[name] = value
+    if not fields:
+        return {}
+    for name, field in fields.items():
+        if name in arguments:
+            raise TypeError(f"{cls.__name__}.{name} is both an argument and a computed field")
+        for dependency in field.dependencies:
+            if dependency not in arguments and dependency not in fields:
+                raise TypeError(
+                    f"{cls.__name__}.{name} depends on {dependency!r}, which is neither an argument nor a computed field"
+                )
+
+    plans: ComputedPlans = {}
+    for name in fields:
+        order: List[ComputedField[Any]] = []
+        visited: Set[str] = set()
+
+        def visit(current: str, path: Tuple[str, ...]) -> None:
+            if current in path:
+                cycle = " -> ".join((*path[path.index(current) :], current))
+                raise TypeError(f"Computed fields of {cls.__name__} depend on each other: {cycle}")
+            if current in visited:
+                return
+            for dependency in fields[current].dependencies:
+                if dependency in fields:
+                    visit(dependency, (*path, current))
+            visited.add(current)
+            order.append(fields[current])
+
+        visit(name, ())
+        plans[name] = tuple(order)
+    return plans
+
+
+def evaluate_computed(obj: "BaseArguments", name: str) -> object:
+    """The value of the computed field `name` of `obj`, (re)computing it and its computed inputs as needed."""
+    memo: Dict[str, Tuple[Tuple[object, ...], object]] = obj.__dict__.setdefault("__computed_values__", {})
+    results: Dict[str, object] = {}
+    for field in type(obj).__computed__[name]:
+        inputs = tuple(results[d] if d in results else obj.get(d) for d in field.dependencies)
+        # An input set to another object since the value was computed makes it stale
+        if (cached := memo.get(field.name)) is not None and all(a is b for a, b in zip(cached[0], inputs)):
+            results[field.name] = cached[1]
+            continue
+        value = results[field.name] = field.func(obj, *inputs)
+        memo[field.name] = (inputs, value)
+    return results[name]
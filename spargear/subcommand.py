@@ -1,14 +1,52 @@
 from dataclasses import dataclass, field
 from inspect import getdoc
-from typing import TYPE_CHECKING, Callable, Generic, Optional, Type, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Callable, Generic, Optional, Tuple, Type, TypeVar, Union, cast, overload
 
-from ._typing import sanitize_name, unwrap_callable
+from ._typing import DeferredText, ResolvedOnRead, import_object, sanitize_name, split_import_path, unwrap_callable
 
 if TYPE_CHECKING:
     from .base import BaseArguments
 
 S = TypeVar("S", bound="BaseArguments")
 
+# Bumped by `invalidate_subcommand_factories()` to make every SubcommandSpec re-run its factory.
+_factory_generation: int = 0
+
+
+def invalidate_subcommand_factories() -> None:
+    """Forget the argument classes cached from every `argument_class_factory`."""
+    global _factory_generation
+    _factory_generation += 1
+
+
+def get_factory_generation() -> int:
+    """The number of times `invalidate_subcommand_factories()` was called; caches built from the subcommand
+    tree store it and are stale once it changes."""
+    return _factory_generation
+
+
+class _ImportPathFactory:
+    """Factory importing the argument class named by a "module:qualname" import path."""
+
+    def __init__(self, path: str) -> None:
+        split_import_path(path)
+        self.path = path
+
+    def __call__(self) -> type:
+        argument_class = import_object(self.path)
+        if not isinstance(argument_class, type):
+            raise TypeError(f"{self.path} is not a class")
+        return argument_class
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ImportPathFactory) and other.path == self.path
+
+    def __hash__(self) -> int:
+        return hash(self.path)
+
+    def __repr__(self) -> str:
+        return f"<import {self.path}>"
+
 
 @dataclass
 class SubcommandSpec(Generic[S]):
@@ -16,17 +54,52 @@ class SubcommandSpec(Generic[S]):
 
     name: str
     """The name of the subcommand."""
-    argument_class: Optional[Type[S]] = None
-    """The BaseArguments subclass that defines the subcommand's arguments."""
+    argument_class: Optional[Union[Type[S], str]] = None
+    """The BaseArguments subclass that defines the subcommand's arguments, or its import path
+    ("module:qualname"). A module given by path is imported only when the subcommand is selected."""
     argument_class_factory: Optional[Callable[[], Type[S]]] = None
     """A factory function that returns the BaseArguments subclass."""
-    help: str = ""
-    """Brief help text for the subcommand."""
-    description: Optional[str] = None
-    """Detailed description of the subcommand."""
-
-    # Private field to cache the result of factory function
-    _cached_argument_class: Optional[Type[S]] = field(default=None, init=False, repr=False)
+    help: str = cast(str, ResolvedOnRead(""))
+    """Brief help text for the subcommand. May be given as a DeferredText, resolved on first read."""
+    description: Optional[str] = cast(Optional[str], ResolvedOnRead(None))
+    """Detailed description of the subcommand. May be given as a DeferredText, resolved on first read."""
+
+    # Private fields to cache the result of factory function, along with what produced it
+    _cached_argument_class: Optional[Type[S]] = field(default=None, init=False, repr=False, compare=False)
+    _cached_factory: Optional[Callable[[], Type[S]]] = field(default=None, init=False, repr=False, compare=False)
+    _cached_generation: int = field(default=-1, init=False, repr=False, compare=False)
+
+    if TYPE_CHECKING:
+        # A class given by import path is only known to be some BaseArguments subclass
+
+        @overload
+        def __init__(
+            self: "SubcommandSpec[BaseArguments]",
+            name: str,
+            argument_class: str,
+            argument_class_factory: None = None,
+            help: str = "",
+            description: Optional[str] = None,
+        ) -> None: ...
+
+        @overload
+        def __init__(
+            self,
+            name: str,
+            argument_class: Optional[Type[S]] = None,
+            argument_class_factory: Optional[Callable[[], Type[S]]] = None,
+            help: str = "",
+            description: Optional[str] = None,
+        ) -> None: ...
+
+        def __init__(
+            self,
+            name: str,
+            argument_class: Optional[Union[Type[S], str]] = None,
+            argument_class_factory: Optional[Callable[[], Type[S]]] = None,
+            help: str = "",
+            description: Optional[str] = None,
+        ) -> None: ...
 
     def __post_init__(self) -> None:
         """Validate that either argument_class or argument_class_factory is provided."""
@@ -34,27 +107,108 @@ class SubcommandSpec(Generic[S]):
             raise ValueError("Either argument_class or argument_class_factory must be provided")
         if self.argument_class is not None and self.argument_class_factory is not None:
             raise ValueError("Only one of argument_class or argument_class_factory should be provided")
+        if isinstance(self.argument_class, str):
+            self.argument_class_factory = cast(Callable[[], Type[S]], _ImportPathFactory(self.argument_class))
+            self.argument_class = None
+
+    @property
+    def import_path(self) -> Optional[str]:
+        """The import path the argument class was given as, if any."""
+        if isinstance(factory := self.argument_class_factory, _ImportPathFactory):
+            return factory.path
+        return None
 
     def get_argument_class(self) -> Type[S]:
         """Get the argument class, either directly or from the factory."""
         if self.argument_class is not None:
-            return self.argument_class
+            return cast(Type[S], self.argument_class)
         elif self.argument_class_factory is not None:
-            # Use cached result if available
-            if self._cached_argument_class is not None:
+            # Use cached result if it was produced by the current factory
+            if (
+                self._cached_argument_class is not None
+                and self._cached_factory is self.argument_class_factory
+                and self._cached_generation == _factory_generation
+            ):
                 return self._cached_argument_class
             # Call factory and cache the result
             self._cached_argument_class = self.argument_class_factory()
+            self._cached_factory = self.argument_class_factory
+            self._cached_generation = _factory_generation
             return self._cached_argument_class
         else:
             raise ValueError("No argument class or factory available")
 
+    def invalidate(self) -> None:
+        """Forget the argument class cached from the factory, so the next lookup calls it again."""
+        self._cached_argument_class = None
+        self._cached_factory = None
+
+
+class _DocstringHelp:
+    """Splits the docstring of an object into help and description, on first use."""
+
+    def __init__(self, obj: object) -> None:
+        self._obj = obj
+        self._split: Optional[Tuple[str, Optional[str]]] = None
+
+    def _get_split(self) -> Tuple[str, Optional[str]]:
+        if self._split is None:
+            help: str = ""
+            description: Optional[str] = None
+            if doc := getdoc(self._obj):
+                # Use first line of docstring as help
+                lines = doc.strip().split("\n")
+                help = lines[0].strip()
+                # Use rest of docstring as description if available
+                if len(lines) > 1:
+                    description = "\n".join(line.strip() for line in lines[1:]).strip() or None
+            self._split = (help, description)
+        return self._split
+
+    def help(self) -> str:
+        return self._get_split()[0]
+
+    def description(self) -> Optional[str]:
+        return self._get_split()[1]
+
+
+def _help_from_docstring(
+    obj: object, help: str, description: Optional[str]
+) -> Tuple[str, Optional[str]]:
+    """Returns help and description, deferring to the docstring of `obj` for what was not provided."""
+    if help:
+        return help, description
+    docstring_help = _DocstringHelp(obj)
+    deferred_help = cast(str, DeferredText(docstring_help.help))
+    if description:
+        return deferred_help, description
+    return deferred_help, cast(Optional[str], DeferredText(docstring_help.description))
+
+
+@overload
+def subcommand(
+    name: Optional[str] = None,
+    help: str = "",
+    description: Optional[str] = None,
+    *,
+    argument_class: str,
+) -> Callable[[Callable[..., object]], SubcommandSpec["BaseArguments"]]: ...
+
 
+@overload
 def subcommand(
     name: Optional[str] = None,
     help: str = "",
     description: Optional[str] = None,
     argument_class: Optional[Type[S]] = None,
+) -> Callable[[Union[Callable[..., Type[S]], Type[S]]], SubcommandSpec[S]]: ...
+
+
+def subcommand(
+    name: Optional[str] = None,
+    help: str = "",
+    description: Optional[str] = None,
+    argument_class: Optional[Union[Type[S], str]] = None,
 ) -> Callable[[Union[Callable[..., Type[S]], Type[S]]], SubcommandSpec[S]]:
     """
     Decorator to automatically create SubcommandSpec from a method.
@@ -69,8 +223,10 @@ def subcommand(
               line of the method's docstring.
         description: Detailed description of the subcommand. If not provided,
                     uses the remaining lines of the method's docstring.
-        argument_class: The BaseArguments subclass. If provided, the method won't
-                       be called and this class will be used directly.
+        argument_class: The BaseArguments subclass, or its import path ("module:qualname").
+                       If provided, the method won't be called and this class will be used
+                       directly; a module given by path is imported only when the subcommand
+                       is selected.
 
     Returns:
         A SubcommandSpec instance that can be used as a class attribute.
@@ -108,6 +264,15 @@ def subcommand(
                 pass  # This method body is ignored
         ```
 
+        With an import path (the module is imported only when `train` is selected):
+
+        ```python
+        class MyApp(BaseArguments):
+            @subcommand(argument_class="mypkg.train:TrainArguments", help="Train a model")
+            def train():
+                pass  # This method body is ignored
+        ```
+
     Note:
         - No need for @staticmethod - the decorator handles method calling automatically
         - The method should return a BaseArguments subclass
@@ -118,6 +283,8 @@ def subcommand(
     def decorator(func_or_class: Union[Callable[..., Type[S]], Type[S]]) -> SubcommandSpec[S]:
         if isinstance(func_or_class, type):
             # Handle class objects
+            if isinstance(argument_class, str):
+                raise ValueError("An import path can't be combined with a decorated class")
             if argument_class is not None:
                 t = argument_class
                 if isinstance(func_or_class, t):
@@ -137,25 +304,15 @@ def subcommand(
             # Extract name from function name if not provided
             subcommand_name: str = name or sanitize_name(unwrapped_func.__name__)
 
-            # Extract help from docstring if not provided
-            func_help: str = help
-            func_description: Optional[str] = description
-            if not func_help and (doc := getdoc(unwrapped_func)):
-                # Use first line of docstring as help
-                lines = doc.strip().split("\n")
-                func_help = lines[0].strip()
-                # Use rest of docstring as description if available and description not provided
-                if not func_description and len(lines) > 1:
-                    func_description = "\n".join(line.strip() for line in lines[1:]).strip()
-                    if not func_description:
-                        func_description = None
+            # Take help from docstring if not provided, once it is needed
+            func_help, func_description = _help_from_docstring(unwrapped_func, help, description)
 
             # Determine argument_class or argument_class_factory
             if argument_class is not None:
                 # Use provided argument_class directly
                 return SubcommandSpec(
-                    name=subcommand_name,
-                    argument_class=argument_class,
+                    subcommand_name,
+                    cast(Type[S], argument_class),  # An import path is resolved by __post_init__
                     help=func_help,
                     description=func_description,
                 )
@@ -249,18 +406,8 @@ def subcommandclass(
         # Extract name from class name if not provided
         subcommand_name: str = name or sanitize_name(cls.__name__)
 
-        # Extract help from docstring if not provided
-        cls_help: str = help
-        cls_description: Optional[str] = description
-        if not cls_help and (doc := getdoc(cls)):
-            # Use first line of docstring as help
-            lines = doc.strip().split("\n")
-            cls_help = lines[0].strip()
-            # Use rest of docstring as description if available and description not provided
-            if not cls_description and len(lines) > 1:
-                cls_description = "\n".join(line.strip() for line in lines[1:]).strip()
-                if not cls_description:
-                    cls_description = None
+        # Take help from docstring if not provided, once it is needed
+        cls_help, cls_description = _help_from_docstring(cls, help, description)
 
         # Create SubcommandSpec with the class directly
         return SubcommandSpec(
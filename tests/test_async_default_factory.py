@@ -0,0 +1,112 @@
+import asyncio
+import pickle
+import time
+import unittest
+import warnings
+from typing import Awaitable, Callable, List, Union
+
+from spargear import ArgumentSpec, BaseArguments, DefaultFactoryError, SubcommandSpec, record_timings
+
+DELAY = 0.1
+calls: List[str] = []
+
+
+async def probe(name: str) -> str:
+    calls.append(name)
+    await asyncio.sleep(DELAY)
+    return f"{name}-probed"
+
+
+async def read_token() -> str:
+    return await probe("token")
+
+
+async def broken() -> str:
+    await asyncio.sleep(0)
+    raise OSError("service unreachable")
+
+
+class ServeArguments(BaseArguments):
+    """Serve."""
+
+    endpoint: Union[str, Callable[[], Awaitable[str]]] = lambda: probe("endpoint")
+
+
+class AsyncArguments(BaseArguments):
+    """Arguments with async default factories."""
+
+    token: Union[str, Callable[[], Awaitable[str]]] = read_token
+    cache: ArgumentSpec[str] = ArgumentSpec(["--cache"], default_factory=lambda: probe("cache"))  # pyright: ignore[reportAssignmentType]
+    name: Union[str, Callable[[], str]] = lambda: "sync"
+    serve = SubcommandSpec("serve", argument_class=ServeArguments)
+
+
+class BrokenArguments(BaseArguments):
+    """One of the factories fails."""
+
+    token: Union[str, Callable[[], Awaitable[str]]] = read_token
+    endpoint: Union[str, Callable[[], Awaitable[str]]] = broken
+
+
+class TestAsyncDefaultFactory(unittest.TestCase):
+    def setUp(self) -> None:
+        calls.clear()
+
+    def test_aparse_runs_factories_concurrently(self):
+        started = time.perf_counter()
+        args = asyncio.run(AsyncArguments.aparse(["serve"]))
+        elapsed = time.perf_counter() - started
+        self.assertEqual(args.token, "token-probed")
+        self.assertEqual(args.cache.value, "cache-probed")
+        self.assertEqual(args.name, "sync")
+        self.assertEqual(args.expect(ServeArguments).endpoint, "endpoint-probed")
+        self.assertEqual(sorted(calls), ["cache", "endpoint", "token"])
+        self.assertLess(elapsed, DELAY * 2.5)
+
+    def test_parsed_values_skip_factories(self):
+        args = asyncio.run(AsyncArguments.aparse(["--token", "given", "--cache", "dir"]))
+        self.assertEqual((args.token, args.cache.value), ("given", "dir"))
+        self.assertEqual(calls, [])
+        self.assertIsNone(args.last_subcommand)
+
+    def test_sync_construction(self):
+        args = AsyncArguments(["--cache", "dir", "serve"])
+        self.assertEqual(args.token, "token-probed")
+        self.assertEqual(args.cache.value, "dir")
+        self.assertEqual(args.expect(ServeArguments).endpoint, "endpoint-probed")
+
+    def test_sync_construction_inside_event_loop(self):
+        async def construct() -> None:
+            AsyncArguments([])
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")  # No coroutine is left un-awaited
+            with self.assertRaisesRegex(RuntimeError, "aparse"):
+                asyncio.run(construct())
+
+    def test_errors_are_attributed_to_fields(self):
+        with self.assertRaises(DefaultFactoryError) as cm:
+            asyncio.run(BrokenArguments.aparse([]))
+        self.assertEqual((cm.exception.owner, cm.exception.field), ("BrokenArguments", "endpoint"))
+        self.assertIn("BrokenArguments.endpoint", str(cm.exception))
+        self.assertIsInstance(cm.exception.__cause__, OSError)
+        # The other factories still ran to completion
+        self.assertEqual(calls, ["token"])
+        self.assertEqual(pickle.loads(pickle.dumps(cm.exception)).field, "endpoint")
+
+        with self.assertRaises(DefaultFactoryError):
+            BrokenArguments([])
+        self.assertEqual(asyncio.run(BrokenArguments.aparse(["--endpoint", "x"])).endpoint, "x")
+
+    def test_timings(self):
+        with record_timings() as timings:
+            asyncio.run(AsyncArguments.aparse([]))
+        self.assertGreaterEqual(timings.totals()["default_factories"], DELAY)
+
+    def test_parse_many(self):
+        results = list(AsyncArguments.parse_many([["--cache", "a"], []]))
+        self.assertEqual([r.cache.value for r in results if isinstance(r, AsyncArguments)], ["a", "cache-probed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
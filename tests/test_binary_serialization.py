@@ -0,0 +1,96 @@
+import unittest
+from enum import Enum
+from pathlib import Path
+from typing import Callable, List, Literal, Optional, Tuple, Union
+
+from spargear import ArgumentSpec, BaseArguments, SubcommandSpec
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class TrainArguments(BaseArguments):
+    """Train."""
+
+    epochs: int = 10
+    color: Color = Color.RED
+
+
+class ResolvedArguments(BaseArguments):
+    """A resolved configuration shipped between services."""
+
+    name: str = "run"
+    seed: int = 0
+    debug: bool = False
+    ratio: float = 0.5
+    mode: Literal["fast", "slow"] = "fast"
+    output: Optional[Path] = None
+    tags: List[str] = ["a", "b"]
+    shape: Tuple[int, int] = (1, 1)
+    note: Optional[str] = None
+    extra: ArgumentSpec[object] = ArgumentSpec(["--extra"])
+    cache: Union[str, Callable[[], str]] = lambda: "cache-dir"
+    train = SubcommandSpec("train", argument_class=TrainArguments)
+
+
+class OtherArguments(BaseArguments):
+    name: str = "run"
+    seed: str = "0"
+
+
+class TestBinarySerialization(unittest.TestCase):
+    def test_round_trip(self):
+        args = ResolvedArguments(["--name", "exp", "--seed", "-3", "--debug", "--mode", "slow", "--output", "out/run"])
+        restored = ResolvedArguments.from_bytes(args.to_bytes())
+        self.assertEqual(restored.to_dict(), args.to_dict())
+        self.assertEqual(restored.output, Path("out/run"))
+        self.assertEqual(restored.shape, (1, 1))
+        self.assertIsNone(restored.note)
+        self.assertIsNone(restored.last_subcommand)
+
+    def test_large_values(self):
+        args = ResolvedArguments(["--name", "x" * 300, "--seed", str(2**40), "--shape", "70000", str(-(2**40))])
+        args.tags = [str(i) for i in range(300)]
+        restored = ResolvedArguments.from_bytes(args.to_bytes())
+        self.assertEqual(restored.to_dict(), args.to_dict())
+
+    def test_subcommands(self):
+        args = ResolvedArguments(["train", "--epochs", "3", "--color", "BLUE"])
+        restored = ResolvedArguments.from_bytes(args.to_bytes()).expect(TrainArguments)
+        self.assertEqual((restored.epochs, restored.color), (3, Color.BLUE))
+
+    def test_values_of_other_types_are_pickled(self):
+        args = ResolvedArguments([])
+        args.seed = 2**70
+        args.ratio = 1  # pyright: ignore[reportAttributeAccessIssue]
+        args.tags = ["a", 1]  # pyright: ignore[reportAttributeAccessIssue]
+        args.extra.value = {"nested": [1, 2]}
+        restored = ResolvedArguments.from_bytes(args.to_bytes())
+        self.assertEqual((restored.seed, restored.ratio, restored.tags), (2**70, 1, ["a", 1]))
+        self.assertIs(type(restored.ratio), int)
+        self.assertEqual(restored.extra.value, {"nested": [1, 2]})
+
+    def test_smaller_than_json_and_pickle(self):
+        args = ResolvedArguments(["--output", "out"])
+        data = args.to_bytes()
+        self.assertLess(len(data), len(args.to_json(indent=None, separators=(",", ":")).encode()))
+        self.assertLess(len(data), len(args.to_pickle() or b""))
+
+    def test_rejects_other_data(self):
+        data = ResolvedArguments([]).to_bytes()
+        with self.assertRaisesRegex(ValueError, "another schema"):
+            OtherArguments.from_bytes(data)
+        with self.assertRaises(ValueError):
+            ResolvedArguments.from_bytes(b"not spargear data")
+        with self.assertRaisesRegex(ValueError, "Truncated"):
+            ResolvedArguments.from_bytes(data[:20])
+        with self.assertRaisesRegex(ValueError, "Truncated"):
+            ResolvedArguments.from_bytes(data[:-1])
+        with self.assertRaisesRegex(ValueError, "unexpected bytes"):
+            ResolvedArguments.from_bytes(data + b"\x00")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, Dict
+
+PACKAGE_ROOT = Path(__file__).parents[1]
+
+CLI_SOURCE = '''
+from __future__ import annotations
+
+from enum import Enum
+from pathlib import Path
+from typing import List, Literal, Optional, Tuple
+
+from spargear import ArgumentSpec, BaseArguments, SubcommandSpec
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class Train(BaseArguments):
+    """Train a model."""
+
+    epochs: int = 10
+    """Number of epochs."""
+    layers: List[int] = [64]
+    color: Color = Color.RED
+    output: Optional[Path] = None
+    tags: List[str] = lambda: ["default"]
+
+
+class App(BaseArguments):
+    """The application."""
+
+    name: str = "app"
+    """Name of the run."""
+    mode: Literal["fast", "slow"] = "fast"
+    point: Tuple[int, int] = (0, 0)
+    source: ArgumentSpec[str] = ArgumentSpec(["source"], help="Source file.")
+    train = SubcommandSpec("train", argument_class=Train, help="Train.")
+'''
+
+REPORT = '''
+import json, sys
+from spargear._compiled import get_compiled_class
+from mypkg import cli
+args = cli.App(["src", "--mode", "slow", "train", "--color", "BLUE", "--output", "out"])
+print(json.dumps({
+    "compiled": [get_compiled_class(c) is not None for c in (cli.App, cli.Train)],
+    "values": [repr(args.to_dict()), repr(args.expect(cli.Train).to_dict())],
+    "help": cli.App.get_parser().format_help() + cli.Train.get_parser().format_help(),
+}))
+'''
+
+
+class TestCompiledSchemas(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        (self.root / "mypkg").mkdir()
+        (self.root / "mypkg" / "__init__.py").write_text("")
+        self.cli = self.root / "mypkg" / "cli.py"
+        self.cli.write_text(CLI_SOURCE)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def python(self, *args: str, compiled: bool = True) -> str:
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(PACKAGE_ROOT), str(self.root)]))
+        env["SPARGEAR_COMPILED"] = "1" if compiled else "0"
+        result = subprocess.run([sys.executable, *args], cwd=self.root, env=env, capture_output=True, text=True, check=True)
+        return result.stdout + result.stderr
+
+    def report(self, compiled: bool = True) -> Dict[str, Any]:
+        return json.loads(self.python("-c", REPORT, compiled=compiled).splitlines()[-1])
+
+    def test_compiled_schemas_are_used_and_equivalent(self) -> None:
+        output = self.python("-m", "spargear", "compile", "mypkg.cli:App")
+        artifact = self.root / "mypkg" / "__pycache__" / "cli.spargear.py"
+        self.assertIn(str(artifact), output)
+        self.assertIn("'Train': {'schema_hash'", artifact.read_text())
+
+        report, reference = self.report(), self.report(compiled=False)
+        self.assertEqual(report["compiled"], [True, True])
+        self.assertEqual(reference["compiled"], [False, False])
+        self.assertEqual(report["values"], reference["values"])
+        self.assertEqual(report["help"], reference["help"])
+        self.assertIn("Name of the run.", report["help"])
+
+    def test_stale_schemas_are_ignored(self) -> None:
+        self.python("-m", "spargear", "compile", "mypkg.cli:App")
+        self.cli.write_text(CLI_SOURCE.replace('"""Name of the run."""', '"""Name of this run."""'))
+        report = self.report()
+        self.assertEqual(report["compiled"], [False, False])
+        self.assertIn("Name of this run.", report["help"])
+
+    def test_changed_class_is_ignored(self) -> None:
+        self.python("-m", "spargear", "compile", "mypkg.cli:App")
+        stat = self.cli.stat()
+        # Same size and mtime, but App declares another argument
+        changed = CLI_SOURCE.replace('name: str = "app"', 'nick: str = "app"')
+        self.cli.write_text(changed)
+        os.utime(self.cli, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        report = self.python("-c", "from spargear._compiled import get_compiled_class as g; from mypkg import cli; print(g(cli.App), g(cli.Train) is not None)")
+        self.assertEqual(report.split(), ["None", "True"])
+
+
+if __name__ == "__main__":
+    unittest.main()
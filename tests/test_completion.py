@@ -0,0 +1,186 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from enum import Enum
+from pathlib import Path
+from typing import List, Literal, Optional, Tuple
+
+from spargear import ArgumentSpec, BaseArguments, SubcommandSpec, completion_script, write_completion_index
+from spargear._completer import complete, format_candidates, is_current
+from spargear._completion import build_completion_index
+
+PACKAGE_ROOT = Path(__file__).parents[1]
+COMPLETER = PACKAGE_ROOT / "spargear" / "_completer.py"
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class EvalArguments(BaseArguments):
+    """Evaluate."""
+
+    split: Literal["val", "test"] = "val"
+
+
+class TrainArguments(BaseArguments):
+    """Train."""
+
+    epochs: int = 10
+    """Number of epochs."""
+    layers: List[int] = [64]
+    color: Color = Color.RED
+    verbose: bool = False
+    evaluate = SubcommandSpec("eval", argument_class=EvalArguments, help="Evaluate after training.")
+
+
+class AppArguments(BaseArguments):
+    """App."""
+
+    mode: Literal["fast", "slow"] = "fast"
+    """Speed: fast or slow."""
+    point: Tuple[int, int] = (0, 0)
+    output: Optional[Path] = None
+    source: ArgumentSpec[str] = ArgumentSpec(["source"], choices=["a.txt", "b.txt"], help="Source.")
+    train = SubcommandSpec("train", argument_class=TrainArguments, help="Train a model.")
+
+
+class TestCompletionIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = build_completion_index(AppArguments)
+
+    def candidates(self, line: str) -> List[str]:
+        words = line.split(" ")
+        return [candidate for candidate, _ in complete(self.index, words, len(words) - 1)]
+
+    def test_options(self):
+        self.assertEqual(self.candidates("app --"), ["--help", "--mode", "--point", "--output"])
+        self.assertEqual(self.candidates("app --m"), ["--mode"])
+        self.assertEqual(self.candidates("app a.txt train --e"), ["--epochs"])
+
+    def test_option_values(self):
+        self.assertEqual(self.candidates("app --mode "), ["fast", "slow"])
+        self.assertEqual(self.candidates("app --mode s"), ["slow"])
+        self.assertEqual(self.candidates("app a.txt train --color "), ["RED", "BLUE"])
+        # Values without choices are left to the shell
+        self.assertEqual(self.candidates("app --point 1 "), [])
+
+    def test_option_arity(self):
+        # Both values of --point are consumed, so the next word is the positional
+        self.assertEqual(self.candidates("app --point 1 2 "), ["a.txt", "b.txt"])
+        self.assertEqual(self.candidates("app a.txt train --verbose "), ["eval"])
+        self.assertEqual(self.candidates("app a.txt train --layers 1 2 --e"), ["--epochs"])
+
+    def test_positionals_and_subcommands(self):
+        self.assertEqual(self.candidates("app "), ["a.txt", "b.txt"])
+        self.assertEqual(self.candidates("app --mode fast a.txt "), ["train"])
+        self.assertEqual(self.candidates("app a.txt train "), ["eval"])
+        self.assertEqual(self.candidates("app a.txt train eval --split "), ["val", "test"])
+
+    def test_descriptions(self):
+        words = ["app", "--m"]
+        self.assertEqual(complete(self.index, words, 1), [("--mode", "Speed: fast or slow.")])
+        words = ["app", "a.txt", ""]
+        self.assertEqual(format_candidates("zsh", complete(self.index, words, 2)), "train:Train a model.")
+        self.assertEqual(format_candidates("fish", complete(self.index, words, 2)), "train\tTrain a model.")
+        self.assertEqual(format_candidates("bash", complete(self.index, words, 2)), "train")
+
+    def test_stamps(self):
+        self.assertEqual(list(self.index["stamps"]), [__file__])
+        self.assertTrue(is_current(self.index))
+        self.index["stamps"][__file__][1] += 1
+        self.assertFalse(is_current(self.index))
+
+
+class TestCompletionScripts(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "app.json"
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_scripts(self):
+        for shell in ("bash", "zsh", "fish"):
+            script = completion_script(AppArguments, shell, prog="my-app", index=self.path)
+            self.assertIn("_spargear_complete_my_app", script)
+            self.assertIn(str(self.path), script)
+        self.assertIn("complete -o default -F _spargear_complete_my_app my-app", completion_script(AppArguments, "bash", "my-app", self.path))
+        self.assertTrue(completion_script(AppArguments, "zsh", "my-app", self.path).startswith("#compdef my-app"))
+        self.assertIn("complete -c my-app", completion_script(AppArguments, "fish", "my-app", self.path))
+        with self.assertRaises(ValueError):
+            completion_script(AppArguments, "powershell", index=self.path)  # type: ignore[arg-type]
+
+    def test_unchanged_schema_keeps_index(self):
+        write_completion_index(AppArguments, self.path)
+        index = json.loads(self.path.read_text())
+        index["marker"] = True
+        self.path.write_text(json.dumps(index))
+        write_completion_index(AppArguments, self.path)
+        self.assertTrue(json.loads(self.path.read_text())["marker"])
+        write_completion_index(TrainArguments, self.path)
+        self.assertNotIn("marker", json.loads(self.path.read_text()))
+
+
+CLI_SOURCE = '''
+from typing import Literal
+
+from spargear import BaseArguments
+
+
+class App(BaseArguments):
+    mode: Literal["fast", "slow"] = "fast"
+'''
+
+
+class TestCompleter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        (self.root / "mypkg").mkdir()
+        (self.root / "mypkg" / "__init__.py").write_text("")
+        self.cli = self.root / "mypkg" / "cli.py"
+        self.cli.write_text(CLI_SOURCE)
+        self.index = self.root / "index.json"
+        self.env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(PACKAGE_ROOT), str(self.root)]))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def complete(self, *words: str) -> List[str]:
+        # Run the way the completion scripts run it: isolated, without the package importable
+        command = [sys.executable, "-I", "-S", str(COMPLETER), "bash", str(self.index), str(len(words) - 1), *words]
+        result = subprocess.run(command, cwd=self.root, env=self.env, capture_output=True, text=True, check=True)
+        return result.stdout.split()
+
+    def test_completes_from_index(self):
+        command = [sys.executable, "-m", "spargear", "completion", "mypkg.cli:App", "--index", str(self.index)]
+        subprocess.run(command, cwd=self.root, env=self.env, check=True, capture_output=True)
+        self.assertEqual(json.loads(self.index.read_text())["target"], "mypkg.cli:App")
+        self.assertEqual(self.complete("app", "--"), ["--help", "--mode"])
+        self.assertEqual(self.complete("app", "--mode", ""), ["fast", "slow"])
+
+        # Editing the application regenerates the index on the next completion
+        self.cli.write_text(CLI_SOURCE + textwrap.indent('verbose: bool = False\n', "    "))
+        self.assertEqual(self.complete("app", "--"), ["--help", "--mode", "--verbose"])
+        self.assertTrue(is_current(json.loads(self.index.read_text())))
+
+    def test_script_from_command_line(self):
+        command = [sys.executable, "-m", "spargear", "completion", "mypkg.cli:App", "--shell", "bash", "--index", str(self.index)]
+        result = subprocess.run(command, cwd=self.root, env=self.env, check=True, capture_output=True, text=True)
+        self.assertIn("complete -o default -F _spargear_complete_mypkg mypkg", result.stdout)
+        self.assertEqual(self.complete("mypkg", "--m"), ["--mode"])
+
+    def test_missing_index(self):
+        command = [sys.executable, "-I", "-S", str(COMPLETER), "bash", str(self.index), "1", "app", "--"]
+        result = subprocess.run(command, capture_output=True, text=True)
+        self.assertEqual((result.returncode, result.stdout), (1, ""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import pickle
+import unittest
+from pathlib import Path
+from typing import List
+
+from spargear import ArgumentSpec, BaseArguments, ComputedField, computed
+
+calls: List[str] = []
+
+
+class RunArguments(BaseArguments):
+    """Arguments with derived fields."""
+
+    run_name: str = "run"
+    root: Path = Path("outputs")
+    seed: ArgumentSpec[int] = ArgumentSpec(["--seed"], default=0)
+
+    # Declared before the field it depends on; order of declaration does not matter
+    @computed
+    def log_file(self, output_dir: Path) -> Path:
+        calls.append("log_file")
+        return output_dir / "train.log"
+
+    @computed
+    def output_dir(self, root: Path, run_name: str, seed: int) -> Path:
+        calls.append("output_dir")
+        return root / f"{run_name}-{seed}"
+
+
+class ChildRunArguments(RunArguments):
+    """Overrides a computed field and adds another one."""
+
+    @computed
+    def output_dir(self, root: Path, run_name: str) -> Path:
+        calls.append("child output_dir")
+        return root / run_name
+
+    @computed
+    def summary(self, log_file: Path, run_name: str) -> str:
+        return f"{run_name}: {log_file}"
+
+
+class TestComputedFields(unittest.TestCase):
+    def setUp(self) -> None:
+        calls.clear()
+
+    def test_evaluated_lazily_in_dependency_order(self):
+        args = RunArguments(["--run-name", "exp", "--seed", "3"])
+        self.assertEqual(calls, [])
+        self.assertEqual(args.log_file, Path("outputs/exp-3/train.log"))
+        self.assertEqual(calls, ["output_dir", "log_file"])
+        self.assertEqual(args.output_dir, Path("outputs/exp-3"))
+        self.assertEqual(args.log_file, Path("outputs/exp-3/train.log"))
+        self.assertEqual(calls, ["output_dir", "log_file"])
+
+    def test_setting_an_input_invalidates(self):
+        args = RunArguments([])
+        self.assertEqual(args.log_file, Path("outputs/run-0/train.log"))
+        args.run_name = "other"
+        self.assertEqual(args.log_file, Path("outputs/other-0/train.log"))
+        args.seed.value = 7
+        self.assertEqual(args.output_dir, Path("outputs/other-7"))
+        self.assertEqual(calls, ["output_dir", "log_file", "output_dir", "log_file", "output_dir"])
+        with self.assertRaises(AttributeError):
+            args.output_dir = Path("elsewhere")
+
+    def test_memoised_per_instance(self):
+        first, second = RunArguments(["--run-name", "a"]), RunArguments(["--run-name", "b"])
+        self.assertEqual((first.output_dir, second.output_dir), (Path("outputs/a-0"), Path("outputs/b-0")))
+        self.assertEqual(calls, ["output_dir", "output_dir"])
+
+    def test_inheritance(self):
+        args = ChildRunArguments(["--run-name", "exp"])
+        self.assertEqual(args.summary, "exp: outputs/exp/train.log")
+        self.assertEqual(calls, ["child output_dir", "log_file"])
+        self.assertEqual([f.name for f in ChildRunArguments.__computed__["summary"]], ["output_dir", "log_file", "summary"])
+        self.assertIsInstance(RunArguments.output_dir, ComputedField)
+
+    def test_not_arguments(self):
+        args = RunArguments([])
+        self.assertNotIn("output_dir", args.to_dict())
+        self.assertNotIn("--output-dir", RunArguments.get_parser().format_help())
+        args.output_dir
+        self.assertEqual(pickle.loads(pickle.dumps(args)).output_dir, Path("outputs/run-0"))
+
+    def test_invalid_declarations(self):
+        with self.assertRaisesRegex(TypeError, "neither an argument nor a computed field"):
+
+            class UnknownDependency(BaseArguments):  # pyright: ignore[reportUnusedClass]
+                name: str = "x"
+
+                @computed
+                def upper(self, nmae: str) -> str:
+                    return nmae.upper()
+
+        with self.assertRaisesRegex(TypeError, "first -> second -> first"):
+
+            class Cycle(BaseArguments):  # pyright: ignore[reportUnusedClass]
+                @computed
+                def first(self, second: int) -> int:
+                    return second
+
+                @computed
+                def second(self, first: int) -> int:
+                    return first
+
+        with self.assertRaises(TypeError):
+            computed(lambda: 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from spargear import BaseArguments, SubcommandSpec, config_cache_info, invalidate_config_cache, set_config_cache_maxsize
+
+
+class ServeArguments(BaseArguments):
+    """Serve."""
+
+    workers: int = 1
+
+
+class WorkerArguments(BaseArguments):
+    """Arguments loaded from a shared configuration file."""
+
+    name: str = "worker"
+    port: int = 8080
+    debug: bool = False
+    ratio: Optional[float] = None
+    hosts: List[str] = ["localhost"]
+    shape: Tuple[int, int] = (1, 1)
+    serve = SubcommandSpec("serve", argument_class=ServeArguments)
+
+
+class TestConfigFiles(unittest.TestCase):
+    def setUp(self) -> None:
+        invalidate_config_cache()
+        self.directory = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+        set_config_cache_maxsize(64)
+
+    def write(self, name: str, text: str) -> Path:
+        path = self.directory / name
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_json(self):
+        path = self.write("worker.json", '{"name": "json", "port": 9000, "hosts": ["a", "b"]}')
+        args = WorkerArguments.load_config(path, args=["--port", "1"])
+        self.assertEqual((args.name, args.port, args.hosts), ("json", 1, ["a", "b"]))
+
+    @unittest.skipIf(sys.version_info < (3, 11), "tomllib is new in Python 3.11")
+    def test_toml(self):
+        path = self.write("worker.toml", 'name = "toml"\nport = 9000\nratio = 0.5\n\n[serve]\nworkers = 4\n')
+        args = WorkerArguments.load_config(path, args=["serve"])
+        self.assertEqual((args.name, args.port, args.ratio), ("toml", 9000, 0.5))
+        self.assertEqual(args.expect(ServeArguments).workers, 4)
+        self.assertEqual(args.get_value_source("port"), f"config:{path}")
+
+    def test_ini_values_are_converted(self):
+        path = self.write(
+            "worker.ini",
+            "[DEFAULT]\nname = ini\nport = 9000\ndebug = yes\nratio = 0.25\nhosts = a 'b c'\nshape = 2 3\n\n[serve]\nworkers = 4\n",
+        )
+        args = WorkerArguments.load_config(path, args=["serve"])
+        self.assertEqual(
+            (args.name, args.port, args.debug, args.ratio, args.hosts, args.shape),
+            ("ini", 9000, True, 0.25, ["a", "b c"], (2, 3)),
+        )
+        self.assertEqual(args.expect(ServeArguments).workers, 4)
+        self.assertEqual(WorkerArguments.load_layers([], configs=[path]).port, 9000)
+
+    def test_ini_section_keys_override_default(self):
+        class RunArguments(BaseArguments):
+            port: int = 1
+            level: int = 0
+
+        class AppArguments(BaseArguments):
+            port: int = 8080
+            run = SubcommandSpec("run", argument_class=RunArguments)
+
+        path = self.write("app.ini", "[DEFAULT]\nport = 5\n\n[run]\nport = 6\nlevel = 3\n")
+        args = AppArguments.load_config(path, args=["run"])
+        run = args.expect(RunArguments)
+        self.assertEqual((args.port, run.port, run.level), (5, 6, 3))
+        path = self.write("other.ini", "[DEFAULT]\nport = 5\nlevel = 2\n\n[run]\n")
+        run = AppArguments.load_layers(["run"], configs=[path]).expect(RunArguments)
+        self.assertEqual((run.port, run.level), (1, 0))
+
+    def test_explicit_format(self):
+        path = self.write("worker.conf", "[DEFAULT]\nport = 9000\n")
+        self.assertEqual(WorkerArguments.load_config(path, format="ini").port, 9000)
+        with self.assertRaises(ValueError):
+            WorkerArguments.load_config(path)
+
+    def test_documents_are_cached_until_the_file_changes(self):
+        path = self.write("worker.json", '{"hosts": ["a"]}')
+        first = WorkerArguments.load_config(path)
+        first.hosts.append("mutated")
+        self.assertEqual(WorkerArguments.load_config(path).hosts, ["a"])
+        self.assertEqual(config_cache_info().hits, 1)
+        self.write("worker.json", '{"hosts": ["a", "b", "c"]}')
+        self.assertEqual(WorkerArguments.load_config(path).hosts, ["a", "b", "c"])
+        # Same size, later modification time
+        self.write("worker.json", '{"hosts": ["x", "y", "z"]}')
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(WorkerArguments.load_config(path).hosts, ["x", "y", "z"])
+        self.assertEqual(config_cache_info().misses, 3)
+
+    def test_cache_size_is_bounded(self):
+        set_config_cache_maxsize(1)
+        first, second = self.write("a.json", '{"port": 1}'), self.write("b.json", '{"port": 2}')
+        for path in (first, second, first):
+            WorkerArguments.load_config(path)
+        self.assertEqual(config_cache_info().currsize, 1)
+        self.assertEqual(config_cache_info().misses, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, List, Union
+
+from spargear import ArgumentSpec, BaseArguments, DefaultFactoryError, SubcommandSpec
+
+DELAY = 0.1
+threads: List[str] = []
+
+
+def blocking(value: str) -> Callable[[], str]:
+    def factory() -> str:
+        threads.append(threading.current_thread().name)
+        time.sleep(DELAY)
+        return value
+
+    return factory
+
+
+def unreachable() -> str:
+    time.sleep(DELAY)
+    raise ConnectionError("service unreachable")
+
+
+async def async_token() -> str:
+    await asyncio.sleep(DELAY)
+    return "async-token"
+
+
+class ProbeArguments(BaseArguments):
+    """Probe."""
+
+    __default_factory_executor__ = True
+
+    service: Union[str, Callable[[], str]] = blocking("service")
+
+
+class PooledArguments(BaseArguments):
+    """Arguments whose default factories block."""
+
+    __default_factory_executor__ = True
+
+    token: Union[str, Callable[[], str]] = blocking("token")
+    listing: ArgumentSpec[str] = ArgumentSpec(["--listing"], default_factory=blocking("listing"))
+    name: str = "plain"
+    probe = SubcommandSpec("probe", argument_class=ProbeArguments)
+
+
+own_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="own-pool")
+
+
+class OwnExecutorArguments(BaseArguments):
+    """Arguments using their own executor."""
+
+    __default_factory_executor__ = own_executor
+
+    token: Union[str, Callable[[], str]] = blocking("token")
+    secret: Union[str, Callable[[], Awaitable[str]]] = async_token
+
+
+class FailingArguments(BaseArguments):
+    """One factory fails."""
+
+    __default_factory_executor__ = True
+
+    token: Union[str, Callable[[], str]] = blocking("token")
+    service: Union[str, Callable[[], str]] = unreachable
+
+
+class TestDefaultFactoryExecutor(unittest.TestCase):
+    def setUp(self) -> None:
+        threads.clear()
+
+    def test_factories_run_concurrently(self):
+        started = time.perf_counter()
+        args = PooledArguments(["probe"])
+        elapsed = time.perf_counter() - started
+        self.assertEqual((args.token, args.listing.value, args.name), ("token", "listing", "plain"))
+        self.assertEqual(args.expect(ProbeArguments).service, "service")
+        self.assertLess(elapsed, DELAY * 2.5)
+        self.assertEqual(len(threads), 3)
+        self.assertTrue(all(name.startswith("spargear-default-factory") for name in threads))
+
+    def test_factories_only_run_without_a_value(self):
+        args = PooledArguments(["--token", "given"])
+        self.assertEqual((args.token, args.listing.value), ("given", "listing"))
+        self.assertEqual(len(threads), 1)
+
+    def test_own_executor(self):
+        args = OwnExecutorArguments([])
+        self.assertEqual((args.token, args.secret), ("token", "async-token"))
+        self.assertTrue(threads[0].startswith("own-pool"))
+
+    def test_aparse(self):
+        args = asyncio.run(OwnExecutorArguments.aparse([]))
+        self.assertEqual((args.token, args.secret), ("token", "async-token"))
+        args = asyncio.run(PooledArguments.aparse(["probe"]))
+        self.assertEqual(args.expect(ProbeArguments).service, "service")
+
+    def test_errors(self):
+        # Constructed synchronously, the factory's own exception is raised, as without an executor
+        with self.assertRaisesRegex(ConnectionError, "unreachable"):
+            FailingArguments([])
+        with self.assertRaises(DefaultFactoryError) as cm:
+            asyncio.run(FailingArguments.aparse([]))
+        self.assertEqual(cm.exception.field, "service")
+        self.assertIsInstance(cm.exception.__cause__, ConnectionError)
+
+
+if __name__ == "__main__":
+    unittest.main()
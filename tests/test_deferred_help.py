@@ -0,0 +1,68 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from spargear import BaseArguments, subcommand, subcommandclass
+
+
+class TestDeferredHelp(unittest.TestCase):
+    def test_parsing_does_not_read_sources_or_docstrings(self) -> None:
+        with mock.patch("inspect.getsource", side_effect=AssertionError("getsource")), mock.patch(
+            "spargear.subcommand.getdoc", side_effect=AssertionError("getdoc")
+        ):
+
+            class Leaf(BaseArguments):
+                """Leaf command.
+
+                Does leaf things."""
+
+                depth: int = 1
+                """How deep to go"""
+
+            class DeferredApp(BaseArguments):
+                """Deferred app."""
+
+                name: str = "app"
+                """Name of the app"""
+
+                leaf = subcommandclass()(Leaf)
+
+                @subcommand()
+                def other():  # pyright: ignore[reportSelfClsParameterName]
+                    """Other command."""
+                    return Leaf
+
+            args = DeferredApp(["--name", "x", "leaf", "--depth", "3"])
+            self.assertEqual(args.name, "x")
+            self.assertEqual(args.expect(Leaf).depth, 3)
+
+        # Once help is asked for, everything is resolved as before
+        self.assertEqual(DeferredApp.__arguments__["name"][0].help, "Name of the app")
+        self.assertEqual(DeferredApp.leaf.help, "Leaf command.")
+        self.assertEqual(DeferredApp.leaf.description, "Does leaf things.")
+
+        out = io.StringIO()
+        with redirect_stdout(out), self.assertRaises(SystemExit):
+            DeferredApp(["-h"])
+        self.assertIn("Name of the app", out.getvalue())
+        self.assertIn("Leaf command.", out.getvalue())
+        self.assertIn("Other command.", out.getvalue())
+
+        out = io.StringIO()
+        with redirect_stdout(out), self.assertRaises(SystemExit):
+            DeferredApp(["leaf", "-h"])
+        self.assertIn("Does leaf things.", out.getvalue())
+        self.assertIn("How deep to go", out.getvalue())
+
+    def test_explicit_help_is_kept(self) -> None:
+        class Explicit(BaseArguments):
+            pass
+
+        spec = subcommandclass(help="Given help", description="Given description")(Explicit)
+        self.assertEqual(spec.help, "Given help")
+        self.assertEqual(spec.description, "Given description")
+
+
+if __name__ == "__main__":
+    unittest.main()
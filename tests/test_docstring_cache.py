@@ -0,0 +1,70 @@
+import importlib.util
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from spargear import _docstrings, disable_docstring_cache, enable_docstring_cache  # pyright: ignore[reportPrivateUsage]
+
+MODULE_SOURCE = textwrap.dedent(
+    '''
+    from spargear import BaseArguments
+
+
+    class CachedDocArguments(BaseArguments):
+        name: str = "x"
+        """The name"""
+    '''
+)
+
+
+class TestDocstringCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(disable_docstring_cache)
+        source = Path(self.tmp.name) / "cached_doc_module.py"
+        source.write_text(MODULE_SOURCE, encoding="utf-8")
+        self.cache_dir = Path(self.tmp.name) / "cache"
+        enable_docstring_cache(self.cache_dir)
+
+        spec = importlib.util.spec_from_file_location("cached_doc_module", source)
+        assert spec is not None and spec.loader is not None
+        self.module = importlib.util.module_from_spec(spec)
+        sys.modules["cached_doc_module"] = self.module
+        self.addCleanup(sys.modules.pop, "cached_doc_module", None)
+        spec.loader.exec_module(self.module)
+
+    def test_docstrings_persisted_and_reused(self) -> None:
+        cls = self.module.CachedDocArguments
+        self.assertEqual(cls.__arguments__["name"][0].help, "The name")
+        _docstrings.flush_docstring_cache()
+        self.assertEqual(len(list(self.cache_dir.glob("*.json"))), 1)
+
+        # A fresh process only has the file: nothing needs to be parsed
+        enable_docstring_cache(self.cache_dir)
+        with mock.patch.object(_docstrings, "extract_attr_docstrings", side_effect=AssertionError):
+            self.assertEqual(_docstrings.get_attr_docstrings(cls), {"name": "The name"})
+
+    def test_stale_cache_is_ignored(self) -> None:
+        cls = self.module.CachedDocArguments
+        _docstrings.get_attr_docstrings(cls)
+        _docstrings.flush_docstring_cache()
+
+        assert self.module.__file__ is not None
+        source = Path(self.module.__file__)
+        source.write_text(MODULE_SOURCE.replace("The name", "The new name!"), encoding="utf-8")
+        os.utime(source, ns=(0, 0))
+        enable_docstring_cache(self.cache_dir)
+        self.assertEqual(_docstrings.get_attr_docstrings(cls), {"name": "The new name!"})
+
+    def test_falls_back_without_source_file(self) -> None:
+        cls = type("NoSource", (object,), {"__module__": "module_that_does_not_exist"})
+        self.assertEqual(_docstrings.get_attr_docstrings(cls), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
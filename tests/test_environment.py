@@ -0,0 +1,143 @@
+import asyncio
+import io
+import unittest
+from contextlib import redirect_stderr
+from enum import Enum
+from typing import List, Literal, Optional
+from unittest import mock
+
+from spargear import Annotated, ArgumentSpec, BaseArguments, Env, ParseError, SubcommandSpec
+from spargear._compiled import _HintWriter  # pyright: ignore[reportPrivateUsage]
+
+
+class Level(Enum):
+    DEBUG = "debug"
+    INFO = "info"
+
+
+class WorkerArguments(BaseArguments):
+    """Worker."""
+
+    __env_prefix__ = "WORKER_"
+
+    threads: int = 1
+
+
+class ServiceArguments(BaseArguments):
+    """A service configured through its container's environment."""
+
+    __env_prefix__ = "SVC_"
+
+    host: str = "localhost"
+    port: Annotated[int, Env("PORT")] = 8080
+    debug: bool = False
+    level: Level = Level.INFO
+    mode: Literal["fast", "slow"] = "fast"
+    hosts: List[str] = ["localhost"]
+    ratio: Optional[float] = None
+    worker = SubcommandSpec("worker", argument_class=WorkerArguments)
+
+
+class UnprefixedArguments(BaseArguments):
+    name: str = "x"
+    token: Annotated[Optional[str], Env()] = None
+
+
+class RequiredHostArguments(BaseArguments):
+    __env_prefix__ = "APP_"
+
+    host: ArgumentSpec[str] = ArgumentSpec(["--host"], required=True)
+    port: int = 8080
+
+
+class TestEnvironment(unittest.TestCase):
+    def test_index_is_built_at_class_creation(self):
+        self.assertEqual(
+            ServiceArguments.__env_index__,
+            {
+                "SVC_HOST": "host",
+                "PORT": "port",
+                "SVC_DEBUG": "debug",
+                "SVC_LEVEL": "level",
+                "SVC_MODE": "mode",
+                "SVC_HOSTS": "hosts",
+                "SVC_RATIO": "ratio",
+            },
+        )
+        self.assertEqual(UnprefixedArguments.__env_index__, {"TOKEN": "token"})
+
+    def test_values_are_converted_like_argv(self):
+        environ = {
+            "SVC_HOST": "example.com",
+            "PORT": "9000",
+            "SVC_DEBUG": "true",
+            "SVC_LEVEL": "DEBUG",
+            "SVC_MODE": "slow",
+            "SVC_HOSTS": "a b",
+            "SVC_RATIO": "0.5",
+            "SVC_PORT": "1",  # Not read: `port` names its variable
+        }
+        args = ServiceArguments.load_layers([], env=environ)
+        self.assertEqual(
+            (args.host, args.port, args.debug, args.level, args.mode, args.hosts, args.ratio),
+            ("example.com", 9000, True, Level.DEBUG, "slow", ["a", "b"], 0.5),
+        )
+        self.assertEqual(args.get_value_source("port"), "env")
+
+    def test_precedence(self):
+        environ = {"SVC_HOST": "from-env", "PORT": "9000"}
+        args = ServiceArguments.load_layers(["--port", "1"], configs=[{"host": "from-config", "debug": True}], env=environ)
+        self.assertEqual((args.host, args.port, args.debug), ("from-env", 1, True))
+
+    def test_reads_os_environ(self):
+        with mock.patch.dict("os.environ", {"SVC_HOST": "os-env", "WORKER_THREADS": "4"}):
+            args = ServiceArguments.load_layers(["worker"])
+            self.assertEqual(ServiceArguments.from_dict({}).host, "os-env")
+            self.assertEqual(ServiceArguments([]).host, "os-env")
+            self.assertEqual(ServiceArguments(["--host", "argv"]).host, "argv")
+        self.assertEqual(args.host, "os-env")
+        self.assertEqual(args.expect(WorkerArguments).threads, 4)
+
+    def test_plain_parsing_reads_the_environment(self):
+        with mock.patch.dict("os.environ", {"APP_HOST": "env-host", "APP_PORT": "9000", "WORKER_THREADS": "4"}):
+            args = RequiredHostArguments([])
+            self.assertEqual((args.host.unwrap(), args.port), ("env-host", 9000))
+            self.assertEqual(RequiredHostArguments(["--host", "argv"]).host.unwrap(), "argv")
+            self.assertEqual(asyncio.run(RequiredHostArguments.aparse([])).host.unwrap(), "env-host")
+            first, second = RequiredHostArguments.parse_many([[], ["--port", "1"]])
+            assert isinstance(first, RequiredHostArguments) and isinstance(second, RequiredHostArguments)
+            self.assertEqual((first.port, second.port, second.host.unwrap()), (9000, 1, "env-host"))
+            self.assertEqual(ServiceArguments(["worker"]).expect(WorkerArguments).threads, 4)
+
+    def test_plain_parsing_reports_missing_and_invalid_values(self):
+        for environ, message in (({}, "required: --host"), ({"APP_HOST": "h", "APP_PORT": "many"}, "(from env)")):
+            with mock.patch.dict("os.environ", environ, clear=True):
+                with redirect_stderr(io.StringIO()) as err, self.assertRaises(SystemExit):
+                    RequiredHostArguments([])
+                self.assertIn(message, err.getvalue())
+                (error,) = RequiredHostArguments.parse_many([[]])
+                assert isinstance(error, ParseError)
+                self.assertIn(message, error.message)
+
+    def test_invalid_values_are_parse_errors(self):
+        for environ in ({"PORT": "many"}, {"SVC_MODE": "medium"}, {"SVC_DEBUG": "maybe"}):
+            with redirect_stderr(io.StringIO()) as err, self.assertRaises(SystemExit):
+                ServiceArguments.load_layers([], env=environ)
+            self.assertIn("(from env)", err.getvalue())
+        # Not converted when the command line gives the value
+        self.assertEqual(ServiceArguments.load_layers(["--port", "1"], env={"PORT": "many"}).port, 1)
+
+    def test_duplicate_variable(self):
+        with self.assertRaisesRegex(TypeError, "both read from the environment variable PORT"):
+
+            class Clashing(BaseArguments):  # pyright: ignore[reportUnusedClass]
+                port: Annotated[int, Env("PORT")] = 1
+                other_port: Annotated[int, Env("PORT")] = 2
+
+    def test_compiled_hint(self):
+        source = _HintWriter(__name__).write(Annotated[int, Env("PORT")])
+        self.assertEqual(source, "_mod('spargear._typing').Annotated[int, _mod('spargear._config').Env('PORT')]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+import argparse
+import io
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Literal, Optional, Sequence, Tuple, Type, cast
+from unittest import mock
+
+from spargear import ArgumentSpec, BaseArguments, SubcommandSpec
+from spargear._fastparse import FastParser
+from spargear.base import _raise_parse_errors  # pyright: ignore[reportPrivateUsage]
+
+_original_parse = BaseArguments.__dict__["_BaseArguments__parse_args_with_parser"].__func__
+
+
+class FastChildArguments(BaseArguments):
+    __parse_engine__ = "fast"
+
+    target: ArgumentSpec[str] = ArgumentSpec(["target"])
+    depth: int = 1
+
+
+class FastArguments(BaseArguments):
+    """Every feature the fast engine handles, and a few it hands back to argparse."""
+
+    __parse_engine__ = "fast"
+
+    name: str = "x"
+    count: Optional[int] = None
+    verbose: bool = False
+    quiet: ArgumentSpec[bool] = ArgumentSpec(["-q", "--quiet"], action="store_false")
+    mode: Literal["a", "b"] = "a"
+    tags: List[str] = []
+    point: Tuple[int, int] = (0, 0)
+    path: Path = Path("default")
+    level: ArgumentSpec[str] = ArgumentSpec(["--level"], nargs="?", const="high", default="low")
+    source: ArgumentSpec[str] = ArgumentSpec(["source"])
+    child = SubcommandSpec("child", argument_class=FastChildArguments)
+
+
+ARGVS: List[List[str]] = [
+    ["src"],
+    ["src", "--name", "y", "--count", "3", "--verbose", "-q"],
+    ["--name=y", "src", "--mode", "b"],
+    ["src", "--tags", "a", "b", "--point", "1", "2"],
+    ["src", "--tags"],
+    ["src", "--level"],
+    ["src", "--level", "mid", "--path", "p"],
+    ["src", "--count", "3", "--count", "4"],
+    ["src", "child", "t", "--depth", "2"],
+    ["--name", "y", "src", "child", "--depth", "2", "t"],
+    # Handed back to argparse
+    [],
+    ["src", "--mode", "c"],
+    ["src", "--count", "x"],
+    ["src", "--nam", "y"],
+    ["src", "-h"],
+    ["src", "--", "x"],
+    ["src", "--count", "-5"],
+    ["src", "extra"],
+    ["src", "child"],
+    ["src", "--point", "1"],
+]
+
+
+def parse_with_argparse(cls: Type[BaseArguments], argv: Sequence[str]) -> Optional[argparse.Namespace]:
+    token = _raise_parse_errors.set(True)
+    try:
+        return cls.get_parser().parse_args(argv)
+    except Exception:
+        return None
+    finally:
+        _raise_parse_errors.reset(token)
+
+
+def parse_with_fast_engine(cls: Type[BaseArguments], argv: Sequence[str]) -> Optional[argparse.Namespace]:
+    fast_parser = cast(Optional[FastParser], cls._BaseArguments__get_fast_parser())  # pyright: ignore
+    if fast_parser is None:
+        return None
+    try:
+        return fast_parser.parse_args(argv)
+    except Exception:
+        return None
+
+
+def typed_vars(namespace: argparse.Namespace) -> Dict[str, Tuple[type, object]]:
+    return {key: (type(value), value) for key, value in vars(namespace).items()}
+
+
+def record_command_lines(run: Callable[[], object]) -> List[Tuple[Type[BaseArguments], List[str]]]:
+    """Runs `run`, returning every command line it parsed through BaseArguments."""
+    recorded: List[Tuple[Type[BaseArguments], List[str]]] = []
+
+    def recording_parse(cls: Type[BaseArguments], args: Optional[Sequence[str]]) -> argparse.Namespace:
+        recorded.append((cls, list(sys.argv[1:] if args is None else args)))
+        return _original_parse(cls, args)
+
+    with mock.patch.object(BaseArguments, "_BaseArguments__parse_args_with_parser", classmethod(recording_parse)):
+        run()
+    return recorded
+
+
+def check_conformance(cases: Sequence[Tuple[Type[BaseArguments], Sequence[str]]]) -> Dict[str, object]:
+    """Parses every case with both engines; wherever the fast engine parses, argparse must agree."""
+    handled = 0
+    mismatches: List[str] = []
+    for cls, argv in cases:
+        if (fast := parse_with_fast_engine(cls, argv)) is None:
+            continue
+        handled += 1
+        expected = parse_with_argparse(cls, argv)
+        if expected is None or typed_vars(fast) != typed_vars(expected):
+            mismatches.append(f"{cls.__qualname__} {argv!r}: fast engine {fast!r}, argparse {expected!r}")
+    return {"cases": len(cases), "handled": handled, "mismatches": mismatches}
+
+
+def check_test_suite_conformance() -> Dict[str, object]:
+    """Replays every command line the rest of the test suite parses through both engines."""
+    tests_dir = Path(__file__).parent
+
+    def run_suite() -> None:
+        suite = unittest.defaultTestLoader.discover(str(tests_dir), top_level_dir=str(tests_dir.parent))
+        filtered = unittest.TestSuite(
+            test for test in _iter_tests(suite) if "test_fast_engine" not in test.id() and "process_pool" not in test.id()
+        )
+        unittest.TextTestRunner(stream=io.StringIO()).run(filtered)
+
+    return check_conformance(record_command_lines(run_suite))
+
+
+class TestFastEngine(unittest.TestCase):
+    def test_sample_command_lines(self) -> None:
+        report = check_conformance([(FastArguments, argv) for argv in ARGVS])
+        self.assertEqual(report["mismatches"], [])
+        self.assertEqual(report["handled"], 10)
+
+    def test_command_lines_of_the_test_suite(self) -> None:
+        # In a separate interpreter, so that running the other tests twice cannot affect them
+        code = "import json; from tests.test_fast_engine import check_test_suite_conformance as c; print(json.dumps(c()))"
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=Path(__file__).parents[1], capture_output=True, text=True, check=True
+        )
+        report = json.loads(result.stdout.splitlines()[-1])
+        self.assertEqual(report["mismatches"], [])
+        self.assertGreater(report["cases"], 50)
+        self.assertGreater(report["handled"], report["cases"] // 3)
+
+    def test_instances_match_argparse(self) -> None:
+        for argv in ARGVS[:10]:
+            with self.subTest(argv=argv):
+                fast = FastArguments(argv)
+                with mock.patch.object(FastArguments, "__parse_engine__", "argparse"):
+                    reference = FastArguments(argv)
+                self.assertEqual(fast.to_dict(), reference.to_dict())
+
+    def test_argparse_handles_the_rest(self) -> None:
+        with mock.patch("sys.stderr", io.StringIO()) as stderr, self.assertRaises(SystemExit):
+            FastArguments(["src", "--mode", "c"])
+        self.assertIn("invalid choice", stderr.getvalue())
+        with mock.patch("sys.stdout", io.StringIO()) as stdout, self.assertRaises(SystemExit):
+            FastArguments(["-h"])
+        self.assertIn("--verbose", stdout.getvalue())
+        self.assertEqual(FastArguments(["src", "--nam", "y"]).name, "y")
+
+    def test_only_selected_subcommands_are_resolved(self) -> None:
+        resolved: List[str] = []
+
+        def factory(name: str) -> Callable[[], Type[BaseArguments]]:
+            def get() -> Type[BaseArguments]:
+                resolved.append(name)
+                return FastChildArguments
+
+            return get
+
+        class Root(BaseArguments):
+            __parse_engine__ = "fast"
+            first = SubcommandSpec("first", argument_class_factory=factory("first"))
+            second = SubcommandSpec("second", argument_class_factory=factory("second"))
+
+        args = Root(["second", "t"])
+        self.assertEqual(resolved, ["second"])
+        self.assertIsInstance(args.last_subcommand, FastChildArguments)
+
+    def test_unsupported_classes_use_argparse(self) -> None:
+        class Counting(BaseArguments):
+            __parse_engine__ = "fast"
+            verbosity: ArgumentSpec[int] = ArgumentSpec(["-v"], action="count", default=0)
+
+        self.assertIsNone(Counting._BaseArguments__get_fast_parser())  # pyright: ignore
+        self.assertEqual(Counting(["-v", "-v"]).verbosity.unwrap(), 2)
+
+    def test_parse_many(self) -> None:
+        results = list(FastArguments.parse_many([["src", "--count", "2"], ["src", "--count", "x"]]))
+        self.assertEqual(getattr(results[0], "count"), 2)
+        self.assertIn("invalid int value", str(results[1]))
+
+
+def _iter_tests(suite: unittest.TestSuite) -> Iterator[unittest.TestCase]:
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        else:
+            yield test
+
+
+if __name__ == "__main__":
+    unittest.main()
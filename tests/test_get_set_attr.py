@@ -26,3 +26,35 @@ class TestGetSetAttr(unittest.TestCase):
         self.assertEqual(args.attr2, 100)
         self.assertEqual(args.attr3.value, "new_spec_value")
         self.assertEqual(args.attr4.value, 200)
+
+    def test_class_attributes_unchanged(self):
+        """Class-level access still returns the declared class attributes."""
+
+        spec = ArgumentSpec(name_or_flags=["--level"], default="INFO")
+
+        class ClassLevelArgs(BaseArguments):
+            name: str = "default"
+            level: ArgumentSpec[str] = spec
+            required_value: int
+
+        self.assertEqual(ClassLevelArgs.name, "default")
+        self.assertIs(ClassLevelArgs.level, spec)
+        self.assertFalse(hasattr(ClassLevelArgs, "required_value"))
+
+        class Child(ClassLevelArgs):
+            name: str = "child"
+
+        self.assertEqual(Child.name, "child")
+        self.assertEqual(Child(["--required-value", "1"]).level.unwrap(), "INFO")
+
+    def test_non_argument_attributes(self):
+        """Attributes that are not arguments behave like on any other object."""
+
+        class PlainAttrArgs(BaseArguments):
+            name: str = "default"
+
+        args = PlainAttrArgs([])
+        args.extra = 1  # pyright: ignore[reportAttributeAccessIssue]
+        self.assertEqual(args.extra, 1)  # pyright: ignore[reportAttributeAccessIssue]
+        self.assertNotIn("__getattribute__", vars(BaseArguments))
+        self.assertNotIn("__setattr__", vars(BaseArguments))
@@ -0,0 +1,128 @@
+import io
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Optional, Set
+
+from spargear import BaseArguments, SubcommandSpec, subcommand
+from spargear.subcommand import invalidate_subcommand_factories
+
+MODULES = {
+    "spargear_test_train": '''
+from spargear import BaseArguments
+
+class TrainArguments(BaseArguments):
+    """Train a model."""
+
+    epochs: int = 10
+''',
+    "spargear_test_serve": '''
+from spargear import BaseArguments
+
+class ServeArguments(BaseArguments):
+    port: int = 8000
+''',
+}
+
+
+class ImportPathArguments(BaseArguments):
+    config: Optional[str] = None
+    train = SubcommandSpec("train", "spargear_test_train:TrainArguments", help="Train a model")
+
+    @subcommand(argument_class="spargear_test_serve:ServeArguments", help="Serve a model")
+    def serve():  # pyright: ignore[reportSelfClsParameterName]
+        pass
+
+
+class NestedImportPathArguments(BaseArguments):
+    group = SubcommandSpec("group", argument_class=ImportPathArguments)
+
+
+class EagerImportPathArguments(ImportPathArguments):
+    __lazy_subcommands__ = False
+
+
+class TestImportPathSubcommands(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        for name, source in MODULES.items():
+            (Path(self.directory.name) / f"{name}.py").write_text(source)
+        sys.path.insert(0, self.directory.name)
+        self.forget_modules()
+
+    def tearDown(self) -> None:
+        sys.path.remove(self.directory.name)
+        self.forget_modules()
+        self.directory.cleanup()
+
+    def forget_modules(self) -> None:
+        for name in MODULES:
+            sys.modules.pop(name, None)
+        BaseArguments.invalidate_parser_cache()
+        for spec in (ImportPathArguments.train, ImportPathArguments.serve):
+            spec.invalidate()
+
+    def imported(self) -> Set[str]:
+        return {name for name in MODULES if name in sys.modules}
+
+    def test_only_the_selected_module_is_imported(self) -> None:
+        args = ImportPathArguments(["--config", "c", "train", "--epochs", "3"])
+        self.assertEqual(self.imported(), {"spargear_test_train"})
+        self.assertEqual(args.last_subcommand.to_dict(), {"epochs": 3})  # pyright: ignore[reportOptionalMemberAccess]
+        self.assertEqual(type(args.last_subcommand).__name__, "TrainArguments")
+
+        ImportPathArguments(["serve", "--port", "1"])
+        self.assertEqual(self.imported(), set(MODULES))
+
+    def test_help_imports_nothing(self) -> None:
+        out = io.StringIO()
+        with redirect_stdout(out), self.assertRaises(SystemExit):
+            ImportPathArguments(["-h"])
+        self.assertIn("Train a model", out.getvalue())
+        self.assertIn("Serve a model", out.getvalue())
+        self.assertEqual(self.imported(), set())
+
+    def test_lazy_mode_is_automatic(self) -> None:
+        self.assertTrue(ImportPathArguments._uses_lazy_subcommands())  # pyright: ignore[reportPrivateUsage]
+        self.assertTrue(NestedImportPathArguments._uses_lazy_subcommands())  # pyright: ignore[reportPrivateUsage]
+        NestedImportPathArguments(["group", "serve"])
+        self.assertEqual(self.imported(), {"spargear_test_serve"})
+
+        self.assertFalse(EagerImportPathArguments._uses_lazy_subcommands())  # pyright: ignore[reportPrivateUsage]
+        EagerImportPathArguments(["serve"])
+        self.assertEqual(self.imported(), set(MODULES))
+
+    def test_lazy_mode_is_memoized(self) -> None:
+        class Leaf(BaseArguments):
+            count: int = 1
+
+        class Auto(BaseArguments):
+            leaf = SubcommandSpec("leaf", argument_class=Leaf)
+
+        self.assertFalse(Auto._uses_lazy_subcommands())  # pyright: ignore[reportPrivateUsage]
+        Leaf.__subcommands__["train"] = ImportPathArguments.train
+        self.assertFalse(Auto._uses_lazy_subcommands())  # pyright: ignore[reportPrivateUsage]
+        invalidate_subcommand_factories()
+        self.assertTrue(Auto._uses_lazy_subcommands())  # pyright: ignore[reportPrivateUsage]
+
+    def test_spec(self) -> None:
+        self.assertEqual(ImportPathArguments.train.import_path, "spargear_test_train:TrainArguments")
+        self.assertIsNone(ImportPathArguments.train.argument_class)
+        self.assertIsNone(NestedImportPathArguments.group.import_path)
+        with self.assertRaises(ValueError):
+            SubcommandSpec("bad", "spargear_test_train.TrainArguments")
+
+    def test_missing_class_is_reported_on_selection(self) -> None:
+        class Broken(BaseArguments):
+            missing = SubcommandSpec("missing", "spargear_test_train:Missing")
+            train = SubcommandSpec("train", "spargear_test_train:TrainArguments")
+
+        self.assertEqual(type(Broken(["train"]).last_subcommand).__name__, "TrainArguments")
+        with self.assertRaises(AttributeError):
+            Broken(["missing"])
+
+
+if __name__ == "__main__":
+    unittest.main()
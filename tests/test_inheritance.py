@@ -0,0 +1,99 @@
+import unittest
+from typing import Any, List
+
+from spargear import ArgumentSpec, BaseArguments, SubcommandSpec
+
+
+EVALUATED: List[str] = []
+
+
+def evaluated(name: str) -> type:
+    EVALUATED.append(name)
+    return int
+
+
+class CommonOptions:
+    """A plain mixin, not a BaseArguments subclass."""
+
+    verbose: bool = False
+
+
+class RootArguments(BaseArguments):
+    name: str = "root"
+    """Name of the thing"""
+    tags: ArgumentSpec[List[str]] = ArgumentSpec(["--tags"], help="Tags")
+
+
+class LeftArguments(RootArguments):
+    left: int = 1
+
+
+class RightArguments(RootArguments):
+    name = "right"
+    tags: ArgumentSpec[List[int]] = ArgumentSpec(["--ids"], help="Ids")  # pyright: ignore[reportIncompatibleVariableOverride]
+    child = SubcommandSpec("child", argument_class=RootArguments)
+
+
+class DiamondArguments(LeftArguments, RightArguments):
+    extra: str = "x"
+
+
+class MixedArguments(CommonOptions, DiamondArguments):
+    pass
+
+
+class ReassignedArguments(MixedArguments):
+    verbose = True
+    left = 2
+
+
+class TestInheritance(unittest.TestCase):
+    def test_single_inheritance_reuses_parent_schema(self) -> None:
+        self.assertEqual(list(LeftArguments.__arguments__), ["name", "tags", "left"])
+        self.assertIs(LeftArguments.__arguments__["tags"], RootArguments.__arguments__["tags"])
+        self.assertIs(LeftArguments.__arguments__["name"], RootArguments.__arguments__["name"])
+
+    def test_inherited_help_is_kept(self) -> None:
+        self.assertEqual(LeftArguments.__arguments__["name"][0].help, "Name of the thing")
+
+    def test_diamond_follows_mro(self) -> None:
+        self.assertEqual(list(DiamondArguments.__arguments__), ["name", "tags", "left", "extra"])
+        args = DiamondArguments(["--ids", "1", "2"])
+        self.assertEqual(args.tags.unwrap(), [1, 2])
+        self.assertEqual(args.name, "right")
+        self.assertIn("child", DiamondArguments.__subcommands__)
+
+    def test_plain_mixin_and_reassigned_defaults(self) -> None:
+        self.assertEqual(MixedArguments([]).verbose, False)
+        args = ReassignedArguments([])
+        self.assertEqual(args.verbose, True)
+        self.assertEqual(args.left, 2)
+        self.assertEqual(ReassignedArguments.left, 2)
+        self.assertEqual(MixedArguments([]).left, 1)
+        self.assertEqual(list(ReassignedArguments.__arguments__), list(MixedArguments.__arguments__))
+
+    def test_only_own_annotations_are_evaluated(self) -> None:
+        class Evaluated(BaseArguments):
+            count: "evaluated('count')" = 1  # noqa: F821  # pyright: ignore
+
+        class Child(Evaluated):
+            other: "evaluated('other')" = 2  # noqa: F821  # pyright: ignore
+
+        class Reassigned(Child):
+            count = 3
+
+        self.assertEqual(EVALUATED, ["count", "other", "count"])
+        self.assertEqual(Reassigned([]).to_dict(), {"count": 3, "other": 2})
+
+    def test_deep_chain(self) -> None:
+        parent: Any = BaseArguments
+        for i in range(30):
+            parent = type(f"Level{i}", (parent,), {"__annotations__": {f"level{i}": int}, f"level{i}": i})
+        args = parent(["--level0", "5"])
+        self.assertEqual(list(parent.__arguments__), [f"level{i}" for i in range(30)])
+        self.assertEqual(args.level0, 5)
+        self.assertEqual(args.level29, 29)
+
+
+if __name__ == "__main__":
+    unittest.main()
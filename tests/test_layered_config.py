@@ -0,0 +1,124 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Callable, List, Literal, Union
+
+from spargear import ArgumentSpec, BaseArguments, SubcommandSpec
+
+calls: List[str] = []
+
+
+def token() -> str:
+    calls.append("token")
+    return "generated"
+
+
+class ServeArguments(BaseArguments):
+    """Serve."""
+
+    workers: int = 1
+
+
+class AppArguments(BaseArguments):
+    """Arguments loaded from several sources."""
+
+    __env_prefix__ = "APP_"
+
+    name: str = "app"
+    port: int = 8080
+    """Port to listen on."""
+    debug: bool = False
+    verbose: ArgumentSpec[int] = ArgumentSpec(["-v"], action="count", default=0)
+    api_token: Union[str, Callable[[], str]] = token
+    serve = SubcommandSpec("serve", argument_class=ServeArguments)
+
+
+class TypedArguments(BaseArguments):
+    mode: Literal["fast", "slow"] = "fast"
+    port: int = 8080
+    root: Path = Path(".")
+    modes: List[Literal["fast", "slow"]] = []
+
+
+class RequiredArguments(BaseArguments):
+    host: ArgumentSpec[str] = ArgumentSpec(["--host"], required=True)
+
+
+class TestLayeredConfig(unittest.TestCase):
+    def setUp(self) -> None:
+        calls.clear()
+        fd, self.path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"name": "from-file", "port": 9000, "serve": {"workers": 4}}, f)
+
+    def tearDown(self) -> None:
+        os.unlink(self.path)
+
+    def test_precedence(self):
+        args = AppArguments.load_layers(
+            ["--port", "7000"], configs=[{"debug": True, "name": "from-dict"}, self.path], env={"APP_NAME": "from-env"}
+        )
+        self.assertEqual((args.name, args.port, args.debug), ("from-env", 7000, True))
+        self.assertEqual(args.get_value_source("name"), "env")
+        self.assertEqual(args.get_value_source("port"), "argv")
+        self.assertEqual(args.get_value_source("debug"), "config")
+        self.assertEqual(args.get_value_source("verbose"), "default")
+        self.assertEqual(AppArguments.load_layers([], configs=[self.path]).get_value_source("name"), f"config:{self.path}")
+        self.assertEqual(AppArguments([]).get_value_source("name"), "default")  # The class reads the environment
+        self.assertIsNone(TypedArguments([]).get_value_source("port"))
+
+    def test_command_line_value_equal_to_default_wins(self):
+        args = AppArguments.load_layers(["--port", "8080"], configs=[{"port": 1}])
+        self.assertEqual(args.port, 8080)
+        self.assertEqual(AppArguments.from_dict({"port": 1}, args=["--port", "8080"]).port, 8080)
+
+    def test_defaults_and_factories(self):
+        args = AppArguments.load_layers([], configs=[{"api_token": "configured"}])
+        self.assertEqual((args.name, args.port, args.api_token), ("app", 8080, "configured"))
+        self.assertEqual(calls, [])
+        self.assertEqual(AppArguments.load_layers([]).api_token, "generated")
+        self.assertEqual(calls, ["token"])
+
+    def test_counting_action(self):
+        self.assertEqual(AppArguments.load_layers([]).verbose.value, 0)
+        self.assertEqual(AppArguments.load_layers(["-vv"], configs=[{"verbose": 5}]).verbose.value, 2)
+        self.assertEqual(AppArguments.load_layers([], configs=[{"verbose": 5}]).verbose.value, 5)
+
+    def test_subcommand_values_are_nested(self):
+        serve = AppArguments.load_layers(["serve"], configs=[self.path]).expect(ServeArguments)
+        self.assertEqual(serve.workers, 4)
+        self.assertEqual(serve.get_value_source("workers"), f"config:{self.path}")
+        serve = AppArguments.load_layers(["serve", "--workers", "2"], configs=[self.path]).expect(ServeArguments)
+        self.assertEqual(serve.workers, 2)
+
+    def test_required_option(self):
+        self.assertEqual(RequiredArguments.load_layers([], configs=[{"host": "example.com"}]).host.value, "example.com")
+        with self.assertRaises(SystemExit):
+            RequiredArguments.load_layers([])
+
+    def test_typed_layer_values_are_converted(self):
+        args = TypedArguments.load_layers([], configs=[{"root": "/srv", "port": "9000", "modes": ["slow"]}])
+        self.assertEqual((args.root, args.port, args.modes), (Path("/srv"), 9000, ["slow"]))
+
+    def test_typed_layer_values_are_validated(self):
+        for values in ({"mode": "zzz"}, {"port": "notint"}, {"modes": ["fast", "zzz"]}):
+            with self.subTest(values=values), redirect_stderr(io.StringIO()) as err, self.assertRaises(SystemExit):
+                TypedArguments.load_layers([], configs=[values])
+            self.assertIn("(from config)", err.getvalue())
+
+    def test_help_is_unchanged(self):
+        outputs: List[str] = []
+        for parse in (AppArguments, AppArguments.load_layers):
+            with redirect_stdout(io.StringIO()) as out, self.assertRaises(SystemExit):
+                parse(["--help"])
+            outputs.append(out.getvalue())
+        self.assertIn("(default: 8080)", outputs[0])
+        self.assertEqual(outputs[0], outputs[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import json
+import pickle
+import unittest
+from typing import Callable, List, Union
+
+from spargear import ArgumentSpec, BaseArguments, SubcommandSpec
+
+calls: List[str] = []
+
+
+def expensive(name: str) -> Callable[[], str]:
+    def factory() -> str:
+        calls.append(name)
+        return f"{name}-loaded"
+
+    return factory
+
+
+class EvalArguments(BaseArguments):
+    """Evaluate."""
+
+    __lazy_default_factories__ = True
+
+    dataset: Union[str, Callable[[], str]] = expensive("dataset")
+
+
+class LazyArguments(BaseArguments):
+    """Arguments whose default factories run on first read."""
+
+    __lazy_default_factories__ = True
+
+    vocabulary: Union[str, Callable[[], str]] = expensive("vocabulary")
+    data_dir: ArgumentSpec[str] = ArgumentSpec(["--data-dir"], default_factory=expensive("data_dir"))
+    run_id: ArgumentSpec[str] = ArgumentSpec(["--run-id"], default_factory=expensive("run_id"), lazy=False)
+    name: str = "plain"
+    evaluate = SubcommandSpec("eval", argument_class=EvalArguments)
+
+
+class PerSpecArguments(BaseArguments):
+    """Only one argument is lazy."""
+
+    eager: Union[str, Callable[[], str]] = expensive("eager")
+    lazy: ArgumentSpec[str] = ArgumentSpec(["--lazy"], default_factory=expensive("lazy"), lazy=True)
+
+
+class TestLazyDefaultFactory(unittest.TestCase):
+    def setUp(self) -> None:
+        calls.clear()
+
+    def test_factories_run_on_first_read(self):
+        args = LazyArguments([])
+        self.assertEqual(calls, ["run_id"])
+        self.assertEqual(args.vocabulary, "vocabulary-loaded")
+        self.assertEqual(args.vocabulary, "vocabulary-loaded")
+        self.assertEqual(args.data_dir.value, "data_dir-loaded")
+        self.assertEqual(args["data_dir"], "data_dir-loaded")
+        self.assertEqual(calls, ["run_id", "vocabulary", "data_dir"])
+
+    def test_parsed_and_assigned_values(self):
+        args = LazyArguments(["--data-dir", "given"])
+        args.vocabulary = "assigned"
+        self.assertEqual((args.vocabulary, args.data_dir.value), ("assigned", "given"))
+        self.assertEqual(calls, ["run_id"])
+
+    def test_per_spec_option(self):
+        args = PerSpecArguments([])
+        self.assertEqual(calls, ["eager"])
+        self.assertEqual(args.lazy.value, "lazy-loaded")
+        self.assertEqual(calls, ["eager", "lazy"])
+
+    def test_serialization_forces_evaluation(self):
+        expected = {
+            "vocabulary": "vocabulary-loaded",
+            "data_dir": "data_dir-loaded",
+            "run_id": "run_id-loaded",
+            "name": "plain",
+        }
+        self.assertEqual(LazyArguments([]).to_dict(), expected)
+        self.assertEqual(json.loads(LazyArguments([]).to_json()), expected)
+        self.assertEqual(dict(LazyArguments([]).items()), expected)
+        calls.clear()
+        restored = pickle.loads(pickle.dumps(LazyArguments([])))
+        self.assertEqual(calls, ["run_id", "vocabulary", "data_dir"])
+        self.assertEqual(restored.to_dict(), expected)
+
+    def test_subcommands(self):
+        args = LazyArguments(["eval"])
+        self.assertEqual(calls, ["run_id"])
+        self.assertEqual(args.expect(EvalArguments).dataset, "dataset-loaded")
+
+    def test_failing_factory_is_retried(self):
+        attempts: List[int] = []
+
+        def flaky() -> str:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OSError("not mounted")
+            return "mounted"
+
+        class FlakyArguments(BaseArguments):
+            __lazy_default_factories__ = True
+
+            mount: Union[str, Callable[[], str]] = flaky
+
+        args = FlakyArguments([])
+        with self.assertRaises(OSError):
+            args.mount
+        self.assertEqual(args.mount, "mounted")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from typing import List, Optional, Type
+
+from spargear import ArgumentSpec, BaseArguments, SubcommandSpec
+
+FACTORY_CALLS: List[str] = []
+
+
+class LazyLeafArguments(BaseArguments):
+    """Leaf command."""
+
+    count: int = 1
+
+
+class LazyTrainArguments(BaseArguments):
+    """Train a model."""
+
+    epochs: int = 10
+    leaf = SubcommandSpec("leaf", argument_class=LazyLeafArguments, help="Leaf command")
+
+
+class LazyServeArguments(BaseArguments):
+    """Serve a model."""
+
+    port: int = 8000
+
+
+def train_factory() -> Type[BaseArguments]:
+    FACTORY_CALLS.append("train")
+    return LazyTrainArguments
+
+
+def serve_factory() -> Type[BaseArguments]:
+    FACTORY_CALLS.append("serve")
+    return LazyServeArguments
+
+
+class LazyRootArguments(BaseArguments):
+    """Root of a lazily built CLI."""
+
+    __lazy_subcommands__ = True
+
+    config: Optional[str] = None
+    train = SubcommandSpec("train", argument_class_factory=train_factory, help="Train a model")
+    serve = SubcommandSpec("serve", argument_class_factory=serve_factory, help="Serve a model")
+
+
+class LazyOptionalPositionalArguments(BaseArguments):
+    __lazy_subcommands__ = True
+
+    target: ArgumentSpec[Optional[str]] = ArgumentSpec(["target"], nargs="?", help="Optional target")
+    serve = SubcommandSpec("serve", argument_class_factory=serve_factory, help="Serve a model")
+
+
+class TestLazySubcommands(unittest.TestCase):
+    def setUp(self) -> None:
+        FACTORY_CALLS.clear()
+        BaseArguments.invalidate_parser_cache()
+        LazyRootArguments.train.invalidate()
+        LazyRootArguments.serve.invalidate()
+        LazyOptionalPositionalArguments.serve.invalidate()
+
+    def test_only_selected_factory_is_called(self) -> None:
+        args = LazyRootArguments(["--config", "c.toml", "serve", "--port", "9000"])
+        self.assertEqual(args.config, "c.toml")
+        self.assertEqual(args.expect(LazyServeArguments).port, 9000)
+        self.assertEqual(FACTORY_CALLS, ["serve"])
+
+    def test_nested_path(self) -> None:
+        leaf = LazyRootArguments(["train", "--epochs", "3", "leaf", "--count", "2"]).expect(LazyLeafArguments)
+        self.assertEqual(leaf.count, 2)
+        self.assertEqual(FACTORY_CALLS, ["train"])
+
+    def test_root_help_does_not_resolve_subcommands(self) -> None:
+        out = io.StringIO()
+        with redirect_stdout(out), self.assertRaises(SystemExit):
+            LazyRootArguments(["-h"])
+        self.assertIn("Train a model", out.getvalue())
+        self.assertIn("Serve a model", out.getvalue())
+        self.assertEqual(FACTORY_CALLS, [])
+
+    def test_subcommand_help_builds_only_its_parser(self) -> None:
+        out = io.StringIO()
+        with redirect_stdout(out), self.assertRaises(SystemExit):
+            LazyRootArguments(["serve", "-h"])
+        self.assertIn("--port", out.getvalue())
+        self.assertEqual(FACTORY_CALLS, ["serve"])
+
+    def test_errors_match_eager_parser(self) -> None:
+        with self.assertRaises(SystemExit):
+            LazyRootArguments(["unknown"])
+        with self.assertRaises(SystemExit):
+            LazyRootArguments(["serve", "--port", "not-a-number"])
+
+    def test_prescan_miss_falls_back_to_full_parser(self) -> None:
+        args = LazyOptionalPositionalArguments(["value", "serve", "--port", "1"])
+        self.assertEqual(args.target.unwrap(), "value")
+        self.assertEqual(args.expect(LazyServeArguments).port, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import argparse
+import unittest
+from typing import Dict, List, Optional, Tuple
+
+from spargear import BaseArguments
+from spargear._loader import LoaderField, compile_loader, generate_loader_source
+
+
+class LoaderArguments(BaseArguments):
+    name: str = "x"
+    ports: List[int] = [1]
+    pair: Optional[Tuple[int, int]] = None
+    token: str = lambda: "generated"  # pyright: ignore[reportAssignmentType]
+
+
+class TestNamespaceLoader(unittest.TestCase):
+    def test_loader_compiled_once_per_class(self) -> None:
+        LoaderArguments([])
+        loader = LoaderArguments.__dict__["__namespace_loader__"]
+        LoaderArguments(["--name", "y"])
+        self.assertIs(LoaderArguments.__dict__["__namespace_loader__"], loader)
+        self.assertIsNone(BaseArguments.__namespace_loader__)
+
+    def test_loaded_values(self) -> None:
+        args = LoaderArguments(["--ports", "2", "3", "--pair", "4", "5"])
+        self.assertEqual(args.ports, [2, 3])
+        self.assertEqual(args.pair, (4, 5))
+        self.assertEqual(args.token, "generated")
+
+    def test_generated_loader_containers_and_type_checks(self) -> None:
+        fields = [
+            LoaderField(key="items", attr="items", container=tuple, checkable_type=int, default_factory_spec=None),
+            LoaderField(key="single", attr="single", container=list, checkable_type=None, default_factory_spec=None),
+        ]
+        self.assertNotIn("for key", generate_loader_source(fields))
+        loader = compile_loader(fields)
+
+        values: Dict[str, object] = {}
+        loader(argparse.Namespace(items=[1, 2], single="a"), values, None)
+        self.assertEqual(values, {"items": (1, 2), "single": ["a"]})
+
+        with self.assertRaises(TypeError):
+            loader(argparse.Namespace(items=["not-an-int"]), {}, None)
+
+        values = {}
+        loader(argparse.Namespace(items=argparse.SUPPRESS), values, None)
+        self.assertEqual(values, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
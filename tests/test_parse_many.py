@@ -0,0 +1,96 @@
+import io
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from enum import Enum
+from typing import List, Sequence
+
+from spargear import BaseArguments, ParseError, SubcommandSpec
+
+
+class JobServeArguments(BaseArguments):
+    port: int = 8000
+
+
+class JobArguments(BaseArguments):
+    """Validate job command lines."""
+
+    name: str
+    retries: int = 0
+    serve = SubcommandSpec("serve", argument_class=JobServeArguments, help="Serve")
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class PaintArguments(BaseArguments):
+    color: Color = Color.RED
+
+
+ARGVS: List[Sequence[str]] = [
+    ["--name", "a"],
+    ["--name", "b", "--retries", "x"],
+    ["--retries", "1"],
+    ["--name", "c", "serve", "--port", "1"],
+    ["-h"],
+]
+
+
+class TestParseMany(unittest.TestCase):
+    def check_results(self, results: List[object]) -> None:
+        self.assertEqual(len(results), 5)
+        first, bad_int, missing, serve, help = results
+
+        assert isinstance(first, JobArguments)
+        self.assertEqual((first.name, first.retries), ("a", 0))
+
+        assert isinstance(bad_int, ParseError)
+        self.assertIn("invalid int value", bad_int.message)
+        self.assertEqual((bad_int.index, bad_int.argv, bad_int.status), (1, ["--name", "b", "--retries", "x"], 2))
+
+        assert isinstance(missing, ParseError)
+        self.assertIn("--name", missing.message)
+        self.assertEqual(missing.index, 2)
+
+        assert isinstance(serve, JobArguments)
+        self.assertEqual(serve.expect(JobServeArguments).port, 1)
+
+        assert isinstance(help, ParseError)
+        self.assertEqual((help.index, help.status), (4, 0))
+
+    def test_conversion_error_does_not_stop_the_batch(self) -> None:
+        results = list(PaintArguments.parse_many([["--color", "BLUE"], ["--color", "GREEN"], ["--color", "RED"]]))
+        first, bad, last = results
+        assert isinstance(first, PaintArguments) and isinstance(last, PaintArguments)
+        self.assertEqual((first.color, last.color), (Color.BLUE, Color.RED))
+        assert isinstance(bad, ParseError)
+        self.assertEqual((bad.index, bad.argv), (1, ["--color", "GREEN"]))
+        self.assertIsInstance(bad.__cause__, KeyError)
+
+    def test_yields_instances_and_errors_without_output(self) -> None:
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            self.check_results(list(JobArguments.parse_many(ARGVS)))
+        self.assertEqual((out.getvalue(), err.getvalue()), ("", ""))
+
+    def test_is_lazy(self) -> None:
+        def argvs():
+            yield ["--name", "a"]
+            raise AssertionError("consumed too eagerly")
+
+        results = JobArguments.parse_many(argvs())
+        first = next(results)
+        assert isinstance(first, JobArguments)
+        self.assertEqual(first.name, "a")
+
+    def test_regular_parsing_still_exits(self) -> None:
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            JobArguments(["--retries", "x"])
+
+    def test_process_pool(self) -> None:
+        self.check_results(list(JobArguments.parse_many(ARGVS, processes=2, chunksize=2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
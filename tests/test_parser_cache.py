@@ -0,0 +1,97 @@
+import argparse
+import io
+import unittest
+from contextlib import redirect_stderr
+from typing import List, Type
+
+from spargear import ArgumentSpec, BaseArguments, SubcommandSpec
+
+
+class CachedChildArguments(BaseArguments):
+    name: ArgumentSpec[str] = ArgumentSpec(["--name"], default="child", help="Child name")
+
+
+class OtherChildArguments(BaseArguments):
+    other: ArgumentSpec[str] = ArgumentSpec(["--other"], default="other", help="Other name")
+
+
+class CachedRootArguments(BaseArguments):
+    verbose: ArgumentSpec[bool] = ArgumentSpec(["-v"], action="store_true", help="Verbose")
+    child = SubcommandSpec("child", argument_class=CachedChildArguments, help="Child command")
+
+
+def compiled_parser(cls: Type[BaseArguments]) -> argparse.ArgumentParser:
+    return cls._get_parser_for_argv([])  # pyright: ignore[reportPrivateUsage]
+
+
+class TestParserCache(unittest.TestCase):
+    def setUp(self) -> None:
+        BaseArguments.invalidate_parser_cache()
+
+    def test_parser_is_memoized(self) -> None:
+        before = BaseArguments.parser_cache_info()
+        parser1 = compiled_parser(CachedRootArguments)
+        parser2 = compiled_parser(CachedRootArguments)
+        after = BaseArguments.parser_cache_info()
+
+        self.assertIs(parser1, parser2)
+        self.assertEqual(after.misses - before.misses, 1)
+        self.assertEqual(after.hits - before.hits, 1)
+
+    def test_get_parser_returns_a_new_parser(self) -> None:
+        parser = CachedRootArguments.get_parser()
+        self.assertIsNot(parser, CachedRootArguments.get_parser())
+        self.assertIsNot(parser, compiled_parser(CachedRootArguments))
+        parser.add_argument("--extra")
+        parser.set_defaults(verbose=True)
+        self.assertFalse(CachedRootArguments([]).verbose.unwrap())
+        with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+            CachedRootArguments(["--extra", "x"])
+
+    def test_instances_reuse_parser(self) -> None:
+        CachedRootArguments(["child", "--name", "a"])
+        before = BaseArguments.parser_cache_info()
+        child = CachedRootArguments(["child", "--name", "b"]).expect(CachedChildArguments)
+        after = BaseArguments.parser_cache_info()
+
+        self.assertEqual(child.name.unwrap(), "b")
+        self.assertEqual(after.misses, before.misses)
+        self.assertGreater(after.hits, before.hits)
+
+    def test_invalidate_single_class(self) -> None:
+        parser1 = compiled_parser(CachedRootArguments)
+        CachedChildArguments.invalidate_parser_cache()  # the root parser embeds the child
+        self.assertIsNot(compiled_parser(CachedRootArguments), parser1)
+
+    def test_factory_change_rebuilds_parser(self) -> None:
+        calls: List[str] = []
+
+        def child_factory() -> Type[BaseArguments]:
+            calls.append("child")
+            return CachedChildArguments
+
+        class FactoryRoot(BaseArguments):
+            sub = SubcommandSpec("sub", argument_class_factory=child_factory)
+
+        parser1 = compiled_parser(FactoryRoot)
+        self.assertIs(compiled_parser(FactoryRoot), parser1)
+        self.assertEqual(calls, ["child"])
+
+        FactoryRoot.sub.argument_class_factory = lambda: OtherChildArguments
+        parser2 = compiled_parser(FactoryRoot)
+        self.assertIsNot(parser2, parser1)
+        self.assertEqual(FactoryRoot(["sub", "--other", "x"]).expect(OtherChildArguments).other.unwrap(), "x")
+
+    def test_bounded_eviction(self) -> None:
+        BaseArguments.set_parser_cache_maxsize(2)
+        try:
+            classes = [type(f"Dynamic{i}", (BaseArguments,), {"__annotations__": {"x": int}}) for i in range(5)]
+            for c in classes:
+                compiled_parser(c)
+            self.assertEqual(BaseArguments.parser_cache_info().currsize, 2)
+        finally:
+            BaseArguments.set_parser_cache_maxsize(256)
+
+
+if __name__ == "__main__":
+    unittest.main()
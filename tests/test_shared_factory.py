@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import time
+import unittest
+from typing import Callable, List, Union
+
+from spargear import (
+    ArgumentSpec,
+    BaseArguments,
+    SharedFactory,
+    invalidate_shared_factories,
+    set_shared_factory_cache_maxsize,
+    shared_factory,
+    shared_factory_cache_info,
+)
+
+calls: List[str] = []
+
+
+@shared_factory
+def cache_dir() -> str:
+    calls.append("cache_dir")
+    return f"/tmp/cache-{len(calls)}"
+
+
+@shared_factory(ttl=0.05)
+def credentials() -> str:
+    calls.append("credentials")
+    return f"token-{len(calls)}"
+
+
+class WorkerArguments(BaseArguments):
+    """Arguments built many times per second."""
+
+    cache: Union[str, Callable[[], str]] = cache_dir
+    token: ArgumentSpec[str] = ArgumentSpec(["--token"], default_factory=credentials)
+
+
+class TestSharedFactory(unittest.TestCase):
+    def setUp(self) -> None:
+        invalidate_shared_factories()
+        calls.clear()
+
+    def tearDown(self) -> None:
+        set_shared_factory_cache_maxsize(128)
+
+    def test_result_is_shared_between_instances(self):
+        first, second = WorkerArguments([]), WorkerArguments([])
+        self.assertEqual(first.cache, second.cache)
+        self.assertEqual(first.token.value, second.token.value)
+        self.assertEqual(sorted(calls), ["cache_dir", "credentials"])
+        self.assertIsInstance(cache_dir, SharedFactory)
+        self.assertEqual(getattr(cache_dir, "__name__"), "cache_dir")
+
+    def test_ttl(self):
+        token = WorkerArguments([]).token.value
+        self.assertEqual(WorkerArguments([]).token.value, token)
+        time.sleep(0.06)
+        self.assertNotEqual(WorkerArguments([]).token.value, token)
+        self.assertEqual(calls.count("credentials"), 2)
+        with self.assertRaises(ValueError):
+            shared_factory(lambda: 0, ttl=-1)
+
+    def test_command_line_value_skips_factory(self):
+        self.assertEqual(WorkerArguments(["--token", "given"]).token.value, "given")
+        self.assertNotIn("credentials", calls)
+
+    def test_invalidation(self):
+        before = WorkerArguments([]).cache
+        self.assertTrue(cache_dir.invalidate())
+        self.assertFalse(cache_dir.invalidate())
+        self.assertNotEqual(WorkerArguments([]).cache, before)
+        WorkerArguments([])
+        self.assertEqual(invalidate_shared_factories(credentials), 1)
+        self.assertEqual(invalidate_shared_factories(), 1)
+        self.assertEqual(shared_factory_cache_info().currsize, 0)
+
+    def test_lru_eviction(self):
+        set_shared_factory_cache_maxsize(2)
+        factories = [shared_factory(lambda i=i: calls.append(str(i)) or i) for i in range(3)]
+        for factory in factories:
+            factory()
+        self.assertEqual(shared_factory_cache_info().currsize, 2)
+        factories[2]()
+        factories[0]()
+        self.assertEqual(calls, ["0", "1", "2", "0"])
+
+    def test_concurrent_misses_run_once(self):
+        started = threading.Barrier(8)
+
+        @shared_factory
+        def slow() -> int:
+            calls.append("slow")
+            time.sleep(0.05)
+            return 1
+
+        def worker() -> None:
+            started.wait()
+            slow()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(calls, ["slow"])
+
+    def test_async_factory(self):
+        @shared_factory
+        async def probe() -> str:
+            calls.append("probe")
+            await asyncio.sleep(0)
+            return "probed"
+
+        class ProbeArguments(BaseArguments):
+            service: Union[str, Callable[[], str]] = probe  # pyright: ignore[reportAssignmentType]
+
+        self.assertEqual(asyncio.run(ProbeArguments.aparse([])).service, "probed")
+        self.assertEqual(ProbeArguments([]).service, "probed")
+        self.assertEqual(calls, ["probe"])
+
+    def test_concurrent_async_misses_run_once(self):
+        @shared_factory
+        async def probe() -> str:
+            calls.append("probe")
+            await asyncio.sleep(0.01)
+            return "probed"
+
+        class ProbeArguments(BaseArguments):
+            service: Union[str, Callable[[], str]] = probe  # pyright: ignore[reportAssignmentType]
+
+        async def parse_concurrently() -> List[ProbeArguments]:
+            return await asyncio.gather(*(ProbeArguments.aparse([]) for _ in range(5)))
+
+        self.assertEqual([args.service for args in asyncio.run(parse_concurrently())], ["probed"] * 5)
+        self.assertEqual(calls, ["probe"])
+
+    def test_failed_async_factory_is_shared_and_retried(self):
+        @shared_factory
+        async def probe() -> str:
+            calls.append("probe")
+            await asyncio.sleep(0.01)
+            if len(calls) == 1:
+                raise OSError("unreachable")
+            return "probed"
+
+        async def call_concurrently() -> List[object]:
+            return await asyncio.gather(*(probe() for _ in range(3)), return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, OSError) for result in asyncio.run(call_concurrently())))
+        self.assertEqual(asyncio.run(call_concurrently()), ["probed"] * 3)
+        self.assertEqual(calls, ["probe", "probe"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from spargear import ArgumentSpec, ArgumentSpecType, BaseArguments
+from spargear._typing import Annotated
+
+
+class TestArgumentSpecType(unittest.TestCase):
+    def test_analysis(self) -> None:
+        list_type = ArgumentSpecType.from_type_hint(Optional[List[Path]])
+        self.assertIs(list_type.type, Path)
+        self.assertTrue(list_type.should_return_as_list)
+        self.assertFalse(list_type.should_return_as_tuple)
+        self.assertTrue(list_type.is_specless_type)
+
+        tuple_type = ArgumentSpecType.from_type_hint(ArgumentSpec[Tuple[int, int]])
+        self.assertIs(tuple_type.type, int)
+        self.assertEqual(tuple_type.tuple_nargs, 2)
+        self.assertFalse(tuple_type.is_specless_type)
+        self.assertEqual(ArgumentSpecType.from_type_hint(Tuple[int, ...]).tuple_nargs, "+")
+
+        literal_type = ArgumentSpecType.from_type_hint(Literal["a", "b"])
+        self.assertEqual(literal_type.choices, ("a", "b"))
+
+    def test_identical_hints_share_one_analysis(self) -> None:
+        class First(BaseArguments):
+            paths: Optional[List[Path]] = None
+
+        class Second(BaseArguments):
+            files: Optional[List[Path]] = None
+
+        self.assertIs(First.__arguments__["paths"][1], Second.__arguments__["files"][1])
+        self.assertIs(ArgumentSpecType.from_type_hint(Optional[List[Path]]), ArgumentSpecType.from_type_hint(Optional[List[Path]]))
+
+    def test_literal_order_is_kept_per_class(self) -> None:
+        class First(BaseArguments):
+            mode: Literal["x", "y"] = "x"
+
+        class Second(BaseArguments):
+            mode: Literal["y", "x"] = "y"
+
+        self.assertEqual(First.__arguments__["mode"][1].choices, ("x", "y"))
+        self.assertEqual(Second.__arguments__["mode"][1].choices, ("y", "x"))
+        self.assertIn("{y,x}", Second.get_parser().format_usage())
+
+    def test_unhashable_hint(self) -> None:
+        metadata: Dict[str, Any] = {}
+        spec_type = ArgumentSpecType.from_type_hint(Annotated[int, metadata])
+        self.assertIsNotNone(spec_type)
+
+    def test_direct_construction_is_analysed(self) -> None:
+        spec_type = ArgumentSpecType(List[int])
+        self.assertTrue(spec_type.should_return_as_list)
+        self.assertIs(spec_type.type, int)
+        self.assertEqual(spec_type.basic_info["type"], int)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import copy
+import pickle
+import unittest
+from typing import List, cast
+from unittest import mock
+
+from spargear import ArgumentSpec, BaseArguments
+from spargear.argspec import ArgumentSpecView
+
+
+class ViewArguments(BaseArguments):
+    name: ArgumentSpec[str] = ArgumentSpec(["--name"], default="anonymous", help="Name")
+    tags: ArgumentSpec[List[str]] = ArgumentSpec(["--tags"], nargs="*", default_factory=lambda: ["a"], help="Tags")
+    count: int = 1
+
+
+class TestSpecViews(unittest.TestCase):
+    def test_instances_do_not_copy_specs(self) -> None:
+        with mock.patch.object(copy, "deepcopy", side_effect=AssertionError("deepcopy called")):
+            args = ViewArguments(["--name", "x"])
+            self.assertEqual(args.name.unwrap(), "x")
+            self.assertEqual(args.name.help, "Name")
+
+    def test_value_writes_go_to_instance_values(self) -> None:
+        args = ViewArguments([])
+        args.name.value = "y"
+        self.assertEqual(args.to_dict()["name"], "y")
+        args.name = "z"  # pyright: ignore[reportAttributeAccessIssue]
+        self.assertEqual(args.name.value, "z")
+
+    def test_metadata_write_does_not_touch_class_spec(self) -> None:
+        args = ViewArguments([])
+        class_spec, _ = ViewArguments.__arguments__["name"]
+        args.name.help = "Changed"
+        self.assertEqual(args.name.help, "Changed")
+        self.assertTrue(cast(ArgumentSpecView[str], args.name).detached)
+        self.assertEqual(class_spec.help, "Name")
+        self.assertEqual(ViewArguments([]).name.help, "Name")
+
+    def test_instances_are_isolated(self) -> None:
+        first = ViewArguments(["--tags", "b"])
+        second = ViewArguments([])
+        first.name.value = "first"
+        self.assertEqual(second.name.value, "anonymous")
+        self.assertEqual(first.tags.value, ["b"])
+        self.assertEqual(second.tags.value, ["a"])
+
+    def test_view_equals_equivalent_spec(self) -> None:
+        args = ViewArguments(["--name", "x"])
+        expected = ArgumentSpec(["--name"], default="anonymous", help="Name", type=str)
+        expected.value = "x"
+        self.assertEqual(args.name, expected)
+
+    def test_pickle_round_trip(self) -> None:
+        args = ViewArguments(["--name", "x", "--tags", "c"])
+        args.name.value = "y"
+        restored = pickle.loads(args.to_pickle())
+        self.assertEqual(restored.name.value, "y")
+        self.assertEqual(restored.tags.value, ["c"])
+        # the class-level default factory is left alone
+        self.assertIsNotNone(ViewArguments.__arguments__["tags"][0].default_factory)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from spargear import _timings  # pyright: ignore[reportPrivateUsage]
+from spargear import (
+    BaseArguments,
+    RunnableArguments,
+    SubcommandArguments,
+    SubcommandSpec,
+    add_timing_hook,
+    record_timings,
+    remove_timing_hook,
+)
+from spargear._timings import Timings
+
+
+class TimedRunArguments(RunnableArguments[None]):
+    """Run something."""
+
+    names: List[str] = lambda: ["a"]  # pyright: ignore[reportAssignmentType]
+    """Names to process."""
+
+    def run(self) -> None:
+        pass
+
+
+class TimedArguments(SubcommandArguments):
+    verbose: bool = False
+    run_command = SubcommandSpec("run", argument_class=TimedRunArguments, help="Run")
+
+
+class TestTimings(unittest.TestCase):
+    def test_record_timings(self) -> None:
+        BaseArguments.invalidate_parser_cache()
+        with record_timings() as timings:
+
+            class Defined(BaseArguments):  # pyright: ignore[reportUnusedClass]
+                name: str = "x"
+
+            args = TimedArguments(["run"])
+            args.execute()
+            TimedArguments.get_parser().format_help()
+
+        phases = {timing.phase for timing in timings.records}
+        for phase in ("schema", "docstrings", "parser", "parse_args", "load_namespace", "default_factories", "subcommand_walk", "execute", "run"):
+            self.assertIn(phase, phases)
+        subjects = {timing.subject for timing in timings.records if timing.phase == "schema"}
+        self.assertTrue(any(subject and subject.endswith("Defined") for subject in subjects))
+        self.assertIn("parse_args", timings.totals())
+        self.assertIn("load_namespace", timings.summary())
+        self.assertFalse(_timings.enabled)
+
+    def test_hooks(self) -> None:
+        calls: List[Tuple[str, float, Optional[str]]] = []
+
+        def hook(phase: str, seconds: float, subject: Optional[str]) -> None:
+            calls.append((phase, seconds, subject))
+
+        add_timing_hook(hook)
+        try:
+            TimedArguments(["--verbose"])
+        finally:
+            remove_timing_hook(hook)
+        self.assertIn("parse_args", [phase for phase, _, _ in calls])
+        calls.clear()
+        TimedArguments([])
+        self.assertEqual(calls, [])
+
+    def test_statistics_without_records(self) -> None:
+        timings = Timings(keep_records=False)
+        for seconds in (0.3, 0.1, 0.2):
+            timings("parse_args", seconds, "A")
+        timings("parse_args", 0.5, "B")
+        timings("schema", 0.1, "A")
+        self.assertEqual(timings.records, [])
+        stats = timings.stats[("parse_args", "A")]
+        self.assertEqual((stats.count, stats.min, stats.max), (3, 0.1, 0.3))
+        self.assertAlmostEqual(stats.total, 0.6)
+        self.assertAlmostEqual(timings.totals()["parse_args"], 1.1)
+        summary = timings.summary().splitlines()
+        self.assertEqual(summary[2].split(), ["parse_args", "4", "1100.000", "500.000", "B"])
+
+    def test_environment_variable_prints_summary(self) -> None:
+        root = Path(__file__).resolve().parent.parent
+        env = dict(os.environ, SPARGEAR_TIMINGS="1", PYTHONPATH=str(root))
+        code = "from spargear import BaseArguments\nclass A(BaseArguments):\n    x: int = 1\nA([])\n"
+        result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+        self.assertIn("spargear timings", result.stderr)
+        self.assertIn("parse_args", result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()